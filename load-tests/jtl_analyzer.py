@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Streaming analyzer for JMeter results (JTL) in CSV or XML format.
+
+Samples are read one at a time and folded into per-label histograms, so memory
+stays constant however large the file is (only the number of labels and time
+buckets matters). Produces per-label p50/p90/p99/p99.9, error rate, throughput
+and Apdex, the same figures per fixed time bucket, a JSON summary and an HTML
+page with SVG charts.
+
+Examples:
+    python load-tests/jtl_analyzer.py reports/load/results.jtl
+    python load-tests/jtl_analyzer.py results.xml --bucket 30 --apdex-t 300 --output-dir reports
+"""
+
+import argparse
+import csv
+import html
+import json
+import os
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from load_engine import LatencyHistogram
+
+project_root = Path(__file__).parent.parent
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+def read_csv_samples(path):
+    """Yield (timestamp_ms, elapsed_ms, label, success) from a CSV JTL with a header row"""
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            yield int(row["timeStamp"]), int(row["elapsed"]), row["label"], row["success"].lower() == "true"
+
+
+def read_xml_samples(path):
+    """Yield (timestamp_ms, elapsed_ms, label, success) from an XML JTL; only top-level samples count"""
+    depth = 0
+    root = None
+    for event, element in ET.iterparse(path, events=("start", "end")):
+        if root is None:
+            root = element
+        if element.tag not in ("httpSample", "sample"):
+            continue
+        if event == "start":
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 0:
+            yield int(element.get("ts")), int(element.get("t")), element.get("lb"), element.get("s") == "true"
+            # Drop parsed samples so memory does not grow with the file
+            root.clear()
+
+
+def detect_format(path):
+    with open(path, "rb") as f:
+        return "xml" if f.read(64).lstrip().startswith(b"<") else "csv"
+
+
+class Aggregate:
+    """Counts, latency histogram and Apdex tallies of a set of samples"""
+
+    def __init__(self, apdex_t):
+        self.apdex_t = apdex_t
+        self.histogram = LatencyHistogram()
+        self.count = 0
+        self.errors = 0
+        self.satisfied = 0
+        self.tolerating = 0
+        self.first_ts = None
+        self.last_ts = None
+
+    def add(self, timestamp, elapsed, success):
+        self.count += 1
+        self.histogram.record(elapsed * 1000)
+        if not success:
+            self.errors += 1  # failed samples count as frustrated
+        elif elapsed <= self.apdex_t:
+            self.satisfied += 1
+        elif elapsed <= 4 * self.apdex_t:
+            self.tolerating += 1
+        end = timestamp + elapsed
+        self.first_ts = timestamp if self.first_ts is None else min(self.first_ts, timestamp)
+        self.last_ts = end if self.last_ts is None else max(self.last_ts, end)
+
+    def to_dict(self, seconds=None):
+        if seconds is None:
+            seconds = max((self.last_ts - self.first_ts) / 1000, 0.001) if self.count else 0
+        result = {
+            "samples": self.count,
+            "errors": self.errors,
+            "error_rate": round(self.errors / self.count, 6) if self.count else 0.0,
+            "throughput_per_second": round(self.count / seconds, 3) if seconds else 0.0,
+            "apdex": round((self.satisfied + self.tolerating / 2) / self.count, 4) if self.count else None,
+        }
+        for percent in PERCENTILES:
+            result[f"p{percent:g}_ms"] = round(self.histogram.percentile(percent) / 1000, 3)
+        result["max_ms"] = round(self.histogram.max / 1000, 3)
+        return result
+
+
+def analyze(samples, bucket_seconds=10, apdex_t=500):
+    """Fold samples into overall, per-label and per-bucket aggregates"""
+    total = Aggregate(apdex_t)
+    labels = {}
+    buckets = {}
+    bucket_ms = int(bucket_seconds * 1000)
+    for timestamp, elapsed, label, success in samples:
+        total.add(timestamp, elapsed, success)
+        labels.setdefault(label, Aggregate(apdex_t)).add(timestamp, elapsed, success)
+        bucket = buckets.setdefault(timestamp // bucket_ms * bucket_ms, {})
+        bucket.setdefault(label, Aggregate(apdex_t)).add(timestamp, elapsed, success)
+
+    return {
+        "apdex_threshold_ms": apdex_t,
+        "bucket_seconds": bucket_seconds,
+        "start": total.first_ts,
+        "end": total.last_ts,
+        "total": total.to_dict(),
+        "labels": {label: aggregate.to_dict() for label, aggregate in sorted(labels.items())},
+        "time_series": [
+            {"start": start, **{label: aggregate.to_dict(bucket_seconds) for label, aggregate in sorted(per_label.items())}}
+            for start, per_label in sorted(buckets.items())
+        ],
+    }
+
+
+def _svg_chart(title, series, unit, width=760, height=220):
+    """Line chart of {name: [(x_seconds, y), ...]} as an SVG string"""
+    pad_left, pad_bottom, pad_top = 60, 30, 30
+    points = [point for values in series.values() for point in values]
+    if not points:
+        return ""
+    max_x = max(x for x, _ in points) or 1
+    max_y = max(y for _, y in points) or 1
+    colors = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b"]
+
+    def scale(x, y):
+        return (pad_left + x / max_x * (width - pad_left - 10),
+                height - pad_bottom - y / max_y * (height - pad_bottom - pad_top))
+
+    parts = [f'<svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg">',
+             f'<text x="{pad_left}" y="18" font-weight="bold">{html.escape(title)}</text>',
+             f'<line x1="{pad_left}" y1="{height - pad_bottom}" x2="{width - 10}" y2="{height - pad_bottom}" stroke="#999"/>',
+             f'<line x1="{pad_left}" y1="{pad_top}" x2="{pad_left}" y2="{height - pad_bottom}" stroke="#999"/>',
+             f'<text x="4" y="{pad_top + 4}" font-size="11">{max_y:.1f} {unit}</text>',
+             f'<text x="{width - 60}" y="{height - 8}" font-size="11">{max_x:.0f} s</text>']
+    for index, (name, values) in enumerate(series.items()):
+        color = colors[index % len(colors)]
+        coordinates = " ".join(f"{sx:.1f},{sy:.1f}" for sx, sy in (scale(x, y) for x, y in values))
+        parts.append(f'<polyline fill="none" stroke="{color}" stroke-width="1.5" points="{coordinates}"/>')
+        parts.append(f'<text x="{pad_left + 10 + 170 * index}" y="{height - 8}" font-size="11" fill="{color}">'
+                     f'{html.escape(name)}</text>')
+    parts.append("</svg>")
+    return "\n".join(parts)
+
+
+def render_html(summary, source):
+    start = summary["start"] or 0
+
+    def series(metric):
+        result = {}
+        for bucket in summary["time_series"]:
+            for label, values in bucket.items():
+                if label != "start":
+                    result.setdefault(label, []).append(((bucket["start"] - start) / 1000, values[metric]))
+        return result
+
+    rows = "\n".join(
+        f"<tr><td>{html.escape(label)}</td><td>{s['samples']}</td><td>{s['error_rate'] * 100:.2f}%</td>"
+        f"<td>{s['throughput_per_second']:.1f}</td><td>{s['p50_ms']:.1f}</td><td>{s['p90_ms']:.1f}</td>"
+        f"<td>{s['p99_ms']:.1f}</td><td>{s['p99.9_ms']:.1f}</td><td>{s['apdex']}</td></tr>"
+        for label, s in [*summary["labels"].items(), ("TOTAL", summary["total"])]
+    )
+    charts = [
+        _svg_chart("p90 latency per bucket", series("p90_ms"), "ms"),
+        _svg_chart("Throughput per bucket", series("throughput_per_second"), "req/s"),
+        _svg_chart("Error rate per bucket", series("error_rate"), ""),
+        _svg_chart(f"Apdex per bucket (T = {summary['apdex_threshold_ms']} ms)", series("apdex"), ""),
+    ]
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Load test results</title>
+<style>body {{ font-family: sans-serif; margin: 20px; }} table {{ border-collapse: collapse; }}
+td, th {{ border: 1px solid #ccc; padding: 4px 8px; text-align: right; }} td:first-child {{ text-align: left; }}</style>
+</head><body>
+<h1>Load test results</h1>
+<p>Source: {html.escape(str(source))}; {summary['bucket_seconds']} s buckets</p>
+<table><tr><th>Label</th><th>Samples</th><th>Errors</th><th>req/s</th><th>p50 ms</th><th>p90 ms</th>
+<th>p99 ms</th><th>p99.9 ms</th><th>Apdex</th></tr>
+{rows}
+</table>
+{"".join(f"<div>{chart}</div>" for chart in charts)}
+</body></html>
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize JMeter JTL results (CSV or XML) in constant memory")
+    parser.add_argument("jtl", help="Results file")
+    parser.add_argument("--format", choices=["auto", "csv", "xml"], default="auto", help="JTL format")
+    parser.add_argument("--bucket", type=float, default=10, help="Time bucket size in seconds")
+    parser.add_argument("--apdex-t", type=int, default=500, help="Apdex satisfied threshold in milliseconds")
+    parser.add_argument("--output-dir", default=str(project_root / "reports"), help="Where the summary and chart go")
+    args = parser.parse_args()
+
+    jtl_format = detect_format(args.jtl) if args.format == "auto" else args.format
+    samples = read_xml_samples(args.jtl) if jtl_format == "xml" else read_csv_samples(args.jtl)
+    summary = analyze(samples, args.bucket, args.apdex_t)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    name = Path(args.jtl).stem
+    json_path = os.path.join(args.output_dir, f"{name}-summary.json")
+    html_path = os.path.join(args.output_dir, f"{name}-report.html")
+    with open(json_path, "w") as f:
+        json.dump(summary, f, indent=2)
+    with open(html_path, "w") as f:
+        f.write(render_html(summary, args.jtl))
+
+    total = summary["total"]
+    print(f"📊 {total['samples']} samples, {total['error_rate'] * 100:.2f}% errors, "
+          f"{total['throughput_per_second']:.1f} req/s, p99 {total['p99_ms']:.1f} ms, Apdex {total['apdex']}")
+    for label, s in summary["labels"].items():
+        print(f"   {label:<24} p50 {s['p50_ms']:8.1f}  p90 {s['p90_ms']:8.1f}  p99 {s['p99_ms']:8.1f}  "
+              f"p99.9 {s['p99.9_ms']:8.1f} ms  errors {s['error_rate'] * 100:.2f}%")
+    print(f"📁 {json_path}\n📁 {html_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
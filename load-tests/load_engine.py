@@ -0,0 +1,276 @@
+"""Open-loop HTTP load generation on asyncio.
+
+Requests are started on a fixed arrival schedule (constant or Poisson), not
+when a virtual user finishes its previous request. Latency is measured from
+the *scheduled* start, so queueing caused by a saturated target is part of the
+result instead of being hidden by threads that wait (coordinated omission).
+Requests go over a pool of keep-alive HTTP/1.1 connections implemented on
+asyncio streams, and latencies are recorded in HDR-style histograms.
+"""
+import asyncio
+import math
+import random
+import ssl
+import time
+from urllib.parse import urlsplit
+
+
+class HttpError(Exception):
+    """Raised when a response cannot be read"""
+
+
+class LatencyHistogram:
+    """Log-linear histogram of microsecond values with bounded relative error.
+
+    Like HdrHistogram, every power-of-two range is split into
+    ``sub_buckets`` linear buckets, so any recorded value is reported within
+    ``1 / sub_buckets`` of its true value (0.4% with the default 256) while the
+    memory used only grows with the logarithm of the range.
+    """
+
+    def __init__(self, sub_buckets=256):
+        self.sub_bits = sub_buckets.bit_length() - 1
+        self.counts = {}
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def record(self, microseconds):
+        value = max(int(microseconds), 0)
+        shift = max(value.bit_length() - self.sub_bits, 0)
+        key = (shift, value >> shift)
+        self.counts[key] = self.counts.get(key, 0) + 1
+        self.total += 1
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        for key, count in other.counts.items():
+            self.counts[key] = self.counts.get(key, 0) + count
+        self.total += other.total
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percent):
+        """Value (microseconds) at or below which ``percent`` of the recorded values fall"""
+        if not self.total:
+            return 0
+        # Nearest rank; rounded first so that e.g. 99.9% of 1000 values is rank 999, not 1000
+        rank = max(1, math.ceil(round(self.total * percent / 100, 9)))
+        seen = 0
+        for shift, mantissa in sorted(self.counts, key=lambda k: k[1] << k[0]):
+            seen += self.counts[(shift, mantissa)]
+            if seen >= rank:
+                # Middle of the bucket, clamped to the observed range
+                value = (mantissa << shift) + ((1 << shift) >> 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def summary(self, percents=(50, 90, 99, 99.9)):
+        """Percentiles, min and max in milliseconds"""
+        result = {f"p{p:g}": self.percentile(p) / 1000 for p in percents}
+        result["min"] = (self.min or 0) / 1000
+        result["max"] = self.max / 1000
+        return result
+
+
+class ConnectionPool:
+    """Keep-alive HTTP/1.1 connections to one origin, at most ``size`` open at a time"""
+
+    def __init__(self, base_url, size=100, timeout=30):
+        parts = urlsplit(base_url if "://" in base_url else f"http://{base_url}")
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.base_path = parts.path.rstrip("/")
+        self.host_header = parts.netloc
+        self.timeout = timeout
+        self._slots = asyncio.Semaphore(size)
+        self._idle = []
+        self.connections_opened = 0
+
+    async def request(self, method, path, headers=None, body=b""):
+        """Send one request; return (status, reason, body, connect_seconds)"""
+        async with self._slots:
+            connection, connect_seconds = await self._acquire()
+            reader, writer = connection
+            try:
+                status, reason, response_body, keep_alive = await asyncio.wait_for(
+                    self._exchange(reader, writer, method, path, headers or {}, body), self.timeout)
+            except BaseException:
+                writer.close()
+                raise
+            if keep_alive:
+                self._idle.append(connection)
+            else:
+                writer.close()
+            return status, reason, response_body, connect_seconds
+
+    async def close(self):
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+    async def _acquire(self):
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return (reader, writer), 0.0
+            writer.close()
+        started = time.perf_counter()
+        context = ssl.create_default_context() if self.scheme == "https" else None
+        connection = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port, ssl=context), self.timeout)
+        self.connections_opened += 1
+        return connection, time.perf_counter() - started
+
+    async def _exchange(self, reader, writer, method, path, headers, body):
+        lines = [f"{method} {self.base_path}{path} HTTP/1.1", f"Host: {self.host_header}",
+                 "Connection: keep-alive", f"Content-Length: {len(body)}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise HttpError("Connection closed before the response")
+        _, status, *reason = status_line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+        response_headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        if int(status) in (204, 304) or method == "HEAD":
+            response_body = b""
+            keep_alive = True
+        elif response_headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            response_body = b"".join(chunks)
+            keep_alive = True
+        elif "content-length" in response_headers:
+            response_body = await reader.readexactly(int(response_headers["content-length"]))
+            keep_alive = True
+        else:
+            response_body = await reader.read()
+            keep_alive = False
+        if response_headers.get("connection", "").lower() == "close":
+            keep_alive = False
+        return int(status), reason[0] if reason else "", response_body, keep_alive
+
+
+class Sample:
+    """One request's outcome, in JMeter's terms"""
+
+    __slots__ = ("timestamp", "label", "latency", "service_time", "connect", "status", "message",
+                 "success", "bytes", "sent_bytes")
+
+    def __init__(self, timestamp, label, latency, service_time, connect, status, message, success, received, sent):
+        self.timestamp = timestamp
+        self.label = label
+        self.latency = latency
+        self.service_time = service_time
+        self.connect = connect
+        self.status = status
+        self.message = message
+        self.success = success
+        self.bytes = received
+        self.sent_bytes = sent
+
+
+class LabelStats:
+    """Aggregates for one sampler label"""
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.service_time = LatencyHistogram()
+        self.count = 0
+        self.errors = 0
+        self.bytes = 0
+
+    def add(self, sample):
+        self.count += 1
+        self.errors += not sample.success
+        self.bytes += sample.bytes
+        self.latency.record(sample.latency * 1_000_000)
+        self.service_time.record(sample.service_time * 1_000_000)
+
+
+def arrival_offsets(rate, duration, distribution="constant", seed=None):
+    """Yield the start offsets (seconds) of an open-loop schedule of ``rate`` requests per second"""
+    rng = random.Random(seed)
+    offset = 0.0
+    index = 0
+    while True:
+        if distribution == "poisson":
+            offset += rng.expovariate(rate)
+        else:
+            offset = index / rate
+            index += 1
+        if offset >= duration:
+            return
+        yield offset
+
+
+async def run_open_loop(scenario, pool, rate, duration, distribution="constant", seed=None,
+                        max_in_flight=10000, on_sample=None):
+    """Start ``scenario`` requests at ``rate`` per second for ``duration`` seconds.
+
+    Returns a dict of :class:`LabelStats` per label plus run totals. Arrivals
+    that find ``max_in_flight`` requests outstanding are counted as skipped
+    instead of being delayed, so the schedule itself never slows down.
+    """
+    stats = {}
+    in_flight = set()
+    skipped = 0
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    wall_started = time.time()
+
+    async def fire(index, scheduled):
+        request = scenario.build_request(index)
+        sent = time.perf_counter()
+        try:
+            status, reason, body, connect = await pool.request(
+                request.method, request.path, request.headers, request.body)
+            success, message = scenario.check(request, status, body)
+            message = message or reason
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, HttpError, ValueError) as e:
+            status, body, connect, success, message = 0, b"", 0.0, False, f"{type(e).__name__}: {e}"
+        finished = time.perf_counter()
+        service_time = finished - sent
+        # Measured from the intended start: includes time spent waiting for a free connection
+        latency = max(loop.time() - scheduled, service_time)
+        sample = Sample(wall_started + (scheduled - started), request.label, latency, service_time,
+                        connect, status, message, success, len(body), len(request.body))
+        stats.setdefault(request.label, LabelStats()).add(sample)
+        if on_sample is not None:
+            on_sample(sample)
+
+    for index, offset in enumerate(arrival_offsets(rate, duration, distribution, seed)):
+        scheduled = started + offset
+        delay = scheduled - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if len(in_flight) >= max_in_flight:
+            skipped += 1
+            continue
+        task = asyncio.ensure_future(fire(index, scheduled))
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
+
+    if in_flight:
+        await asyncio.gather(*in_flight)
+    elapsed = loop.time() - started
+    return {"labels": stats, "elapsed": elapsed, "skipped": skipped,
+            "connections_opened": pool.connections_opened}
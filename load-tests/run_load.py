@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Run the homepage, product and checkout load scenarios with the asyncio engine.
+
+Examples:
+    python load-tests/run_load.py homepage --base-url http://localhost:8000 --rate 200 --duration 60
+    python load-tests/run_load.py all --base-url http://qa-ecommerce.example.com \\
+        --api-url http://qa-api.example.com --arrival poisson --jtl reports/load/results.jtl
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from load_engine import ConnectionPool, run_open_loop
+from scenarios import SCENARIOS, CheckoutScenario, ProductScenario
+
+project_root = Path(__file__).parent.parent
+
+# Columns of JMeter's CSV result format; "elapsed" is measured from the scheduled start
+JTL_FIELDS = ["timeStamp", "elapsed", "label", "responseCode", "responseMessage", "threadName",
+              "success", "failureMessage", "bytes", "sentBytes", "Latency", "Connect"]
+
+
+def build_scenario(name, args):
+    if name == "product":
+        return ProductScenario(args.product_id or ["prod_123"])
+    if name == "checkout":
+        return CheckoutScenario(args.auth_token, args.checkout_data)
+    return SCENARIOS[name]()
+
+
+class JtlWriter:
+    """Streams samples to a JMeter-compatible CSV results file"""
+
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._file = open(path, "w", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(JTL_FIELDS)
+
+    def write(self, sample):
+        message = "OK" if sample.success else sample.message
+        self._writer.writerow([
+            int(sample.timestamp * 1000), round(sample.latency * 1000), sample.label, sample.status or "",
+            message, "asyncio", str(sample.success).lower(), "" if sample.success else sample.message,
+            sample.bytes, sample.sent_bytes, round(sample.service_time * 1000), round(sample.connect * 1000),
+        ])
+
+    def close(self):
+        self._file.close()
+
+
+async def run_scenario(name, args, jtl):
+    scenario = build_scenario(name, args)
+    pool = ConnectionPool(getattr(args, scenario.target), size=args.connections, timeout=args.timeout)
+    try:
+        return await run_open_loop(scenario, pool, args.rate, args.duration, args.arrival, args.seed,
+                                   on_sample=jtl.write if jtl else None)
+    finally:
+        await pool.close()
+
+
+def summarize(name, result):
+    labels = {}
+    for label, stats in result["labels"].items():
+        labels[label] = {
+            "samples": stats.count,
+            "errors": stats.errors,
+            "error_rate": stats.errors / stats.count if stats.count else 0.0,
+            "throughput_per_second": stats.count / result["elapsed"] if result["elapsed"] else 0.0,
+            "received_bytes": stats.bytes,
+            "latency_ms": stats.latency.summary(),
+            "service_time_ms": stats.service_time.summary(),
+        }
+    return {"scenario": name, "elapsed_seconds": result["elapsed"], "skipped_arrivals": result["skipped"],
+            "connections_opened": result["connections_opened"], "labels": labels}
+
+
+def print_summary(summary):
+    print(f"\n📊 {summary['scenario']}: {summary['elapsed_seconds']:.1f}s, "
+          f"{summary['connections_opened']} connections, {summary['skipped_arrivals']} skipped arrivals")
+    print(f"   {'label':<20} {'samples':>8} {'err %':>6} {'req/s':>8} {'p50':>8} {'p90':>8} "
+          f"{'p99':>8} {'p99.9':>8} {'max':>8}  (ms, from scheduled start)")
+    for label, s in summary["labels"].items():
+        lat = s["latency_ms"]
+        print(f"   {label:<20} {s['samples']:>8} {s['error_rate'] * 100:>6.2f} {s['throughput_per_second']:>8.1f} "
+              f"{lat['p50']:>8.1f} {lat['p90']:>8.1f} {lat['p99']:>8.1f} {lat['p99.9']:>8.1f} {lat['max']:>8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Open-loop HTTP load test")
+    parser.add_argument("scenario", choices=[*SCENARIOS, "all"], help="Scenario to run")
+    parser.add_argument("--base-url", default=os.getenv("LOAD_BASE_URL", "http://qa-ecommerce.example.com"),
+                        help="Storefront URL (homepage scenario)")
+    parser.add_argument("--api-url", default=os.getenv("LOAD_API_URL", "http://qa-api.example.com"),
+                        help="API URL (product and checkout scenarios)")
+    parser.add_argument("--rate", type=float, default=50.0, help="Arrivals per second")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of arrivals per scenario")
+    parser.add_argument("--arrival", choices=["constant", "poisson"], default="constant",
+                        help="Arrival process: evenly spaced or Poisson")
+    parser.add_argument("--seed", type=int, default=None, help="Seed of the Poisson arrival process")
+    parser.add_argument("--connections", type=int, default=100, help="Keep-alive connections per target")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    parser.add_argument("--product-id", action="append", help="Product id(s) requested by the product scenario")
+    parser.add_argument("--auth-token", default=os.getenv("LOAD_AUTH_TOKEN", "dummy_auth_token"),
+                        help="Bearer token of the checkout scenario")
+    parser.add_argument("--checkout-data", default=None,
+                        help="checkouts.jsonl/.csv from selenium-tests/test_data/generator.py")
+    parser.add_argument("--jtl", default=None, help="Also write every sample to this JMeter-style CSV file")
+    parser.add_argument("--output-dir", default=str(project_root / "reports" / "load"),
+                        help="Directory of the JSON summaries")
+    parser.add_argument("--max-error-rate", type=float, default=None,
+                        help="Exit with 1 if any label's error rate (percent) is higher")
+    args = parser.parse_args()
+
+    names = list(SCENARIOS) if args.scenario == "all" else [args.scenario]
+    jtl = JtlWriter(args.jtl) if args.jtl else None
+    os.makedirs(args.output_dir, exist_ok=True)
+    failed = False
+    try:
+        for name in names:
+            print(f"🚀 {name}: {args.rate:g} req/s ({args.arrival}) for {args.duration:g}s")
+            result = asyncio.run(run_scenario(name, args, jtl))
+            summary = summarize(name, result)
+            print_summary(summary)
+            with open(os.path.join(args.output_dir, f"{name}.json"), "w") as f:
+                json.dump(summary, f, indent=2)
+            if args.max_error_rate is not None:
+                failed |= any(s["error_rate"] * 100 > args.max_error_rate for s in summary["labels"].values())
+    finally:
+        if jtl:
+            jtl.close()
+    print(f"\n📁 Summaries written to {args.output_dir}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""The JMeter plans in jmeter-tests/ as load engine scenarios.
+
+Each scenario builds the same request as its JMeter sampler and applies the
+same response assertion. Target hosts are full URLs here (JMeter's
+``BASE_URL``/``API_BASE_URL`` variables hold bare host names).
+"""
+import csv
+import json
+from abc import ABC, abstractmethod
+from itertools import cycle
+
+# Request body of the "POST Checkout" sampler in checkout_api_load_test.jmx
+DEFAULT_CHECKOUT_PAYLOAD = {
+    "paymentDetails": {
+        "method": "credit_card",
+        "cardNumber": "4242424242424242",
+        "expiryDate": "12/25",
+        "cvv": "123"
+    },
+    "shippingAddress": {
+        "street": "123 Test St",
+        "city": "Testville",
+        "zipCode": "12345",
+        "country": "USA"
+    }
+}
+
+
+class Request:
+    __slots__ = ("label", "method", "path", "headers", "body")
+
+    def __init__(self, label, method, path, headers=None, body=b""):
+        self.label = label
+        self.method = method
+        self.path = path
+        self.headers = headers or {}
+        self.body = body
+
+
+class Scenario(ABC):
+    """One sampler: how to build its request and which status codes pass its assertion"""
+
+    # Name of the URL option (base_url or api_url) the scenario's requests go to
+    target = "base_url"
+
+    def __init__(self, label, expected_statuses):
+        self.label = label
+        self.expected_statuses = expected_statuses
+
+    @abstractmethod
+    def build_request(self, index):
+        """The ``index``-th request of the run"""
+
+    def check(self, request, status, body):
+        """Return (success, failure message) like a JMeter response code assertion"""
+        if status in self.expected_statuses:
+            return True, None
+        expected = " or ".join(str(s) for s in sorted(self.expected_statuses))
+        return False, f"Expected response code {expected}, got {status}"
+
+
+class HomepageScenario(Scenario):
+    """homepage_load_test.jmx: GET / and assert 200"""
+
+    def __init__(self):
+        super().__init__("GET Homepage", {200})
+
+    def build_request(self, index):
+        return Request(self.label, "GET", "/")
+
+
+class ProductScenario(Scenario):
+    """product_api_load_test.jmx: GET /api/v1/products/${PRODUCT_ID} and assert 200"""
+
+    target = "api_url"
+
+    def __init__(self, product_ids=("prod_123",)):
+        super().__init__("GET Product by ID", {200})
+        self._product_ids = cycle(product_ids)
+
+    def build_request(self, index):
+        return Request(self.label, "GET", f"/api/v1/products/{next(self._product_ids)}")
+
+
+class CheckoutScenario(Scenario):
+    """checkout_api_load_test.jmx: POST /api/v1/checkout with a bearer token and assert 200 or 201.
+
+    Payloads come from a checkouts file of the test data generator (JSONL, or CSV
+    with dotted column names) when given, else the plan's fixed body is sent.
+    Rows are reused from the start when the file runs out, like JMeter's
+    recycling CSV Data Set.
+    """
+
+    target = "api_url"
+
+    def __init__(self, auth_token="dummy_auth_token", data_file=None):
+        super().__init__("POST Checkout", {200, 201})
+        self.headers = {"Content-Type": "application/json", "Authorization": f"Bearer {auth_token}"}
+        self._data_file = data_file
+        self._rows = None
+        if data_file:
+            if next(self._read_rows(), None) is None:
+                raise ValueError(f"Checkout data file {data_file} has no rows")
+            self._rows = self._read_rows()
+
+    def build_request(self, index):
+        payload = next(self._rows, None) if self._rows is not None else DEFAULT_CHECKOUT_PAYLOAD
+        if payload is None:
+            self._rows = self._read_rows()
+            payload = next(self._rows)
+        body = {"paymentDetails": payload["paymentDetails"], "shippingAddress": payload["shippingAddress"]}
+        return Request(self.label, "POST", "/api/v1/checkout", self.headers, json.dumps(body).encode())
+
+    def _read_rows(self):
+        """Stream payloads from the data file, one row at a time"""
+        with open(self._data_file, newline="") as f:
+            if self._data_file.endswith(".csv"):
+                for row in csv.DictReader(f):
+                    yield _unflatten(row)
+            else:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+
+
+def _unflatten(row):
+    nested = {}
+    for key, value in row.items():
+        target = nested
+        *parents, name = key.split(".")
+        for parent in parents:
+            target = target.setdefault(parent, {})
+        target[name] = value
+    return nested
+
+
+SCENARIOS = {
+    "homepage": HomepageScenario,
+    "product": ProductScenario,
+    "checkout": CheckoutScenario,
+}
@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+"""
+Run the Postman collection without Node.js or Newman.
+
+Understands the part of the Postman sandbox the collection uses:
+``{{variable}}`` substitution, ``pm.test``, ``pm.expect(...).to...`` chains,
+``pm.response.to.have.status/jsonSchema``, ``pm.environment.set/get`` and the
+``var``/``if`` statements around them. Requests go over one pooled
+``requests.Session``. Top-level folders run concurrently unless one needs a
+variable another sets (e.g. ``authToken`` from Authentication) or both change
+server state, in which case they keep their collection order.
+
+Examples:
+    python postman-tests/run_collection.py
+    python postman-tests/run_collection.py --env-var baseUrl=http://localhost:8000/api/v1 \\
+        --junit reports/api/postman-results.xml
+"""
+
+import argparse
+import json
+import re
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+
+collection_dir = Path(__file__).parent
+project_root = collection_dir.parent
+default_collection = collection_dir / "E-Commerce_API_Tests.postman_collection.json"
+default_environment = collection_dir / "environments" / "qa.postman_environment.json"
+
+VARIABLE = re.compile(r"{{\s*([\w.-]+)\s*}}")
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class ScriptError(Exception):
+    """Raised for a script statement outside the supported pm.* subset"""
+
+
+class AssertionFailed(Exception):
+    """Raised by a failing pm.expect / pm.response.to assertion"""
+
+
+# What a failing statement can raise; any of them fails the surrounding pm.test
+SCRIPT_ERRORS = (ScriptError, AssertionFailed, ValueError, KeyError, IndexError, TypeError)
+
+
+# --- Script interpreter -------------------------------------------------------
+
+def _split_top_level(text, separators):
+    """Split on any of ``separators`` outside strings, brackets, braces and parentheses"""
+    parts, depth, quote, start = [], 0, None, 0
+    for index, char in enumerate(text):
+        if quote:
+            if char == quote and text[index - 1] != "\\":
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+        elif char in separators and depth == 0:
+            parts.append(text[start:index])
+            start = index + 1
+    parts.append(text[start:])
+    return [part.strip() for part in parts if part.strip()]
+
+
+def _closing(text, start):
+    """Index of the bracket closing the one at ``start``"""
+    depth, quote = 0, None
+    for index in range(start, len(text)):
+        char = text[index]
+        if quote:
+            if char == quote and text[index - 1] != "\\":
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+            if depth == 0:
+                return index
+    raise ScriptError(f"Unbalanced brackets in: {text}")
+
+
+def _js_literal(text):
+    """Parse a JS literal (single quotes and bare object keys allowed) as JSON"""
+    converted = re.sub(r"'((?:[^'\\]|\\.)*)'", lambda m: json.dumps(m.group(1)), text)
+    converted = re.sub(r"([{,]\s*)([A-Za-z_$][\w$]*)\s*:", r'\1"\2":', converted)
+    return json.loads(converted)
+
+
+def _truthy(value):
+    """JavaScript truthiness"""
+    return value not in (None, False, 0, "")
+
+
+class Sandbox:
+    """Executes one request's test script against its response"""
+
+    def __init__(self, response, variables):
+        self.response = response
+        self.variables = variables
+        self.scope = {}
+        self.results = []  # (test name, error message or None)
+
+    def run(self, lines):
+        # Statements end at a semicolon or at a line break outside brackets
+        source = "\n".join(line for line in lines if not line.strip().startswith("//"))
+        for statement in _split_top_level(source, ";\n"):
+            try:
+                self.execute(statement)
+            except SCRIPT_ERRORS as e:
+                self.results.append((f"Script: {statement[:60]}", f"{type(e).__name__}: {e}"))
+
+    def execute(self, statement):
+        if statement.startswith("pm.test("):
+            end = _closing(statement, len("pm.test"))
+            name, body = _split_top_level(statement[len("pm.test("):end], ",")
+            body_match = re.fullmatch(r"function\s*\(\s*\)\s*{(.*)}", body, re.S)
+            if not body_match:
+                raise ScriptError(f"Unsupported test callback: {body}")
+            try:
+                for inner in _split_top_level(body_match.group(1), ";"):
+                    self.execute(inner)
+                self.results.append((self.evaluate(name), None))
+            except SCRIPT_ERRORS as e:
+                self.results.append((self.evaluate(name), str(e) or type(e).__name__))
+        elif match := re.fullmatch(r"(?:var|let|const)\s+(\w+)\s*=\s*(.+)", statement, re.S):
+            self.scope[match.group(1)] = self.evaluate(match.group(2))
+        elif match := re.fullmatch(r"if\s*\((.+?)\)\s*{(.*)}", statement, re.S):
+            if _truthy(self.evaluate(match.group(1))):
+                for inner in _split_top_level(match.group(2), ";"):
+                    self.execute(inner)
+        elif match := re.fullmatch(r"pm\.(?:environment|collectionVariables|variables)\.set\((.+)\)",
+                                   statement, re.S):
+            key, value = _split_top_level(match.group(1), ",")
+            self.variables.set(self.evaluate(key), self.evaluate(value))
+        elif statement.startswith("pm.expect("):
+            end = _closing(statement, len("pm.expect"))
+            actual = self.evaluate(statement[len("pm.expect("):end])
+            self._assert(actual, statement[end + 1:])
+        elif statement.startswith("pm.response.to."):
+            self._assert_response(statement[len("pm.response.to."):])
+        else:
+            raise ScriptError(f"Unsupported statement: {statement}")
+
+    def evaluate(self, expression):
+        expression = expression.strip()
+        if expression[:1] in "'\"[{0123456789-" or expression in ("true", "false", "null"):
+            return _js_literal(expression)
+        prefixes = {
+            "pm.response.json()": lambda: self.response.json(),
+            "pm.response.text()": lambda: self.response.text,
+            "pm.response.code": lambda: self.response.status_code,
+            "pm.response.status": lambda: self.response.reason,
+            "pm.response.responseTime": lambda: round(self.response.elapsed.total_seconds() * 1000),
+        }
+        for prefix, getter in prefixes.items():
+            if expression.startswith(prefix):
+                return self._access(getter(), expression[len(prefix):])
+        if match := re.match(r"pm\.(?:environment|collectionVariables|variables)\.get\(([^)]*)\)", expression):
+            return self._access(self.variables.get(self.evaluate(match.group(1))), expression[match.end():])
+        if match := re.match(r"[A-Za-z_$][\w$]*", expression):
+            if match.group() not in self.scope:
+                raise ScriptError(f"Unknown identifier: {match.group()}")
+            return self._access(self.scope[match.group()], expression[match.end():])
+        raise ScriptError(f"Unsupported expression: {expression}")
+
+    @staticmethod
+    def _access(value, accessors):
+        """Apply ``.name`` / ``[index]`` accessors; missing members are None like JS undefined"""
+        for name, index in re.findall(r"\.(\w+)|\[\s*['\"]?([^\]'\"]+)['\"]?\s*\]", accessors):
+            key = name or index
+            if isinstance(value, list) and key.isdigit():
+                value = value[int(key)] if int(key) < len(value) else None
+            elif isinstance(value, list) and key == "length":
+                value = len(value)
+            elif isinstance(value, dict):
+                value = value.get(key)
+            else:
+                raise ScriptError(f"Cannot read '{key}' of {value!r}")
+        return value
+
+    def _assert(self, actual, chain):
+        match = re.fullmatch(r"\.to(?:\.(?:be|have|been|and|that|is|deep|not))*\.(\w+)\((.*)\)", chain, re.S)
+        if not match:
+            raise ScriptError(f"Unsupported assertion: pm.expect(...){chain}")
+        negate = ".not." in chain
+        method = match.group(1)
+        args = [self.evaluate(arg) for arg in _split_top_level(match.group(2), ",")]
+        if method == "property":
+            passed = isinstance(actual, dict) and args[0] in actual and (
+                len(args) < 2 or actual[args[0]] == args[1])
+            description = f"have property '{args[0]}'" + (f" of {args[1]!r}" if len(args) > 1 else "")
+        elif method in ("a", "an"):
+            types = {"array": list, "object": dict, "string": str, "number": (int, float), "boolean": bool}
+            passed = isinstance(actual, types[args[0]]) and not (args[0] == "number" and isinstance(actual, bool))
+            description = f"be {method} {args[0]}"
+        elif method == "oneOf":
+            passed = actual in args[0]
+            description = f"be one of {args[0]}"
+        elif method in ("equal", "eql", "equals"):
+            passed = actual == args[0]
+            description = f"equal {args[0]!r}"
+        elif method in ("include", "contain"):
+            passed = args[0] in actual
+            description = f"include {args[0]!r}"
+        elif method in ("above", "below"):
+            passed = actual > args[0] if method == "above" else actual < args[0]
+            description = f"be {method} {args[0]}"
+        else:
+            raise ScriptError(f"Unsupported assertion method: {method}")
+        if passed == negate:
+            raise AssertionFailed(f"expected {actual!r} to {'not ' if negate else ''}{description}")
+
+    def _assert_response(self, chain):
+        match = re.fullmatch(r"(?:have|be)\.(\w+)\((.*)\)", chain, re.S)
+        if not match:
+            raise ScriptError(f"Unsupported assertion: pm.response.to.{chain}")
+        method, argument = match.group(1), self.evaluate(match.group(2)) if match.group(2) else None
+        if method == "status":
+            actual = self.response.status_code if isinstance(argument, int) else self.response.reason
+            if actual != argument:
+                raise AssertionFailed(f"expected response to have status {argument!r} but got {actual!r}")
+        elif method == "jsonSchema":
+            errors = _schema_errors(self.response.json(), argument)
+            if errors:
+                raise AssertionFailed("; ".join(errors))
+        else:
+            raise ScriptError(f"Unsupported assertion method: {method}")
+
+
+def _schema_errors(value, schema, path="response"):
+    """Validate the JSON Schema keywords type, properties, required and items"""
+    types = {"object": dict, "array": list, "string": str, "integer": int, "number": (int, float),
+             "boolean": bool, "null": type(None)}
+    expected = schema.get("type")
+    if expected and not isinstance(value, types[expected]):
+        return [f"{path} should be {expected}"]
+    errors = []
+    if isinstance(value, dict):
+        errors += [f"{path} is missing required property '{name}'"
+                   for name in schema.get("required", []) if name not in value]
+        for name, subschema in schema.get("properties", {}).items():
+            if name in value:
+                errors += _schema_errors(value[name], subschema, f"{path}.{name}")
+    if isinstance(value, list) and "items" in schema:
+        for index, item in enumerate(value):
+            errors += _schema_errors(item, schema["items"], f"{path}[{index}]")
+    return errors
+
+
+# --- Collection runner --------------------------------------------------------
+
+class Variables:
+    """Collection variables overlaid with the environment, shared by all folders"""
+
+    def __init__(self, collection, environment=None, overrides=None):
+        self._values = {v["key"]: v.get("value", "") for v in collection.get("variable", [])}
+        if environment:
+            self._values.update({v["key"]: v.get("value", "") for v in environment.get("values", [])
+                                 if v.get("enabled", True)})
+        self._values.update(overrides or {})
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            return self._values.get(key)
+
+    def set(self, key, value):
+        with self._lock:
+            self._values[key] = value
+
+    def resolve(self, text):
+        """Substitute ``{{name}}`` placeholders; unknown names are left as they are"""
+        def replace(match):
+            value = self.get(match.group(1))
+            return match.group(0) if value is None else str(value)
+        return VARIABLE.sub(replace, text)
+
+
+def _requests_of(item):
+    """Requests of a folder (or a single request) in collection order"""
+    if "request" in item:
+        return [item]
+    return [request for child in item.get("item", []) for request in _requests_of(child)]
+
+
+def _test_script(item):
+    return [line for event in item.get("event", []) if event.get("listen") == "test"
+            for line in event["script"].get("exec", [])]
+
+
+def folder_dependencies(folders):
+    """Map each folder index to the earlier folders it has to wait for.
+
+    A folder waits for an earlier one that sets a variable it reads, and for
+    the last earlier folder that also changes server state (non-GET requests),
+    so stateful folders stay in collection order.
+    """
+    sets, reads, mutates = [], [], []
+    for folder in folders:
+        requests_ = _requests_of(folder)
+        script = " ".join(line for request in requests_ for line in _test_script(request))
+        sets.append(set(re.findall(r"pm\.(?:environment|collectionVariables|variables)\.set\(\s*['\"]([^'\"]+)",
+                                   script)))
+        reads.append(set(VARIABLE.findall(json.dumps([request["request"] for request in requests_]))))
+        mutates.append(any(request["request"].get("method", "GET").upper() not in SAFE_METHODS
+                           for request in requests_))
+
+    dependencies = {}
+    for index in range(len(folders)):
+        needs = {earlier for earlier in range(index) if sets[earlier] & reads[index]}
+        if mutates[index]:
+            stateful = [earlier for earlier in range(index) if mutates[earlier]]
+            if stateful:
+                needs.add(stateful[-1])
+        dependencies[index] = needs
+    return dependencies
+
+
+class CollectionRunner:
+    def __init__(self, collection, variables, timeout=30, workers=4, serial=False):
+        self.collection = collection
+        self.variables = variables
+        self.timeout = timeout
+        self.workers = 1 if serial else workers
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.workers, pool_maxsize=self.workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._print_lock = threading.Lock()
+
+    def run(self):
+        """Run all folders; return a list of folder results in collection order"""
+        folders = self.collection.get("item", [])
+        dependencies = folder_dependencies(folders)
+        results = [None] * len(folders)
+        pending = set(range(len(folders)))
+        running = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            while pending or running:
+                for index in sorted(pending):
+                    if not dependencies[index] & (pending | set(running.values())):
+                        pending.discard(index)
+                        running[executor.submit(self.run_folder, folders[index])] = index
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future)] = future.result()
+        self.session.close()
+        return results
+
+    def run_folder(self, folder):
+        started = time.perf_counter()
+        executions = [self.run_request(item, folder.get("name", "")) for item in _requests_of(folder)]
+        return {"name": folder.get("name", ""), "seconds": time.perf_counter() - started,
+                "executions": executions}
+
+    def run_request(self, item, folder_name):
+        spec = item["request"]
+        url = spec["url"]["raw"] if isinstance(spec["url"], dict) else spec["url"]
+        headers = {h["key"]: self.variables.resolve(h["value"]) for h in spec.get("header", [])
+                   if not h.get("disabled")}
+        body = spec.get("body", {})
+        data = self.variables.resolve(body["raw"]).encode() if body.get("mode") == "raw" else None
+        execution = {"name": item["name"], "method": spec.get("method", "GET"), "url": self.variables.resolve(url),
+                     "status": None, "seconds": 0.0, "error": None, "tests": []}
+        try:
+            response = self.session.request(execution["method"], execution["url"], headers=headers, data=data,
+                                            timeout=self.timeout)
+        except requests.RequestException as e:
+            execution["error"] = f"{type(e).__name__}: {e}"
+        else:
+            execution["status"] = response.status_code
+            execution["seconds"] = response.elapsed.total_seconds()
+            sandbox = Sandbox(response, self.variables)
+            sandbox.run(_test_script(self.collection) + _test_script(item))
+            execution["tests"] = sandbox.results
+        self._report(folder_name, execution)
+        return execution
+
+    def _report(self, folder_name, execution):
+        with self._print_lock:
+            status = execution["status"] or execution["error"]
+            print(f"→ {folder_name} / {execution['name']}  {execution['method']} {execution['url']} "
+                  f"[{status}, {execution['seconds'] * 1000:.0f}ms]")
+            for name, error in execution["tests"]:
+                print(f"   {'✅' if error is None else '❌'} {name}" + (f": {error}" if error else ""))
+
+
+def write_junit(results, path, collection_name):
+    """Write one testsuite per folder and one testcase per pm.test, like Newman's JUnit reporter"""
+    root = ET.Element("testsuites", name=collection_name)
+    for folder in results:
+        cases = [(execution, name, error) for execution in folder["executions"]
+                 for name, error in (execution["tests"] or [("Request", execution["error"])])]
+        suite = ET.SubElement(root, "testsuite", name=folder["name"], tests=str(len(cases)),
+                              failures=str(sum(1 for e, _, error in cases if error and not e["error"])),
+                              errors=str(sum(1 for e, _, _ in cases if e["error"])),
+                              time=f"{folder['seconds']:.3f}")
+        for execution, name, error in cases:
+            case = ET.SubElement(suite, "testcase", classname=f"{folder['name']}.{execution['name']}",
+                                 name=name, time=f"{execution['seconds']:.3f}")
+            if execution["error"]:
+                ET.SubElement(case, "error", message=execution["error"])
+            elif error:
+                ET.SubElement(case, "failure", message=error, type="AssertionFailure")
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    ET.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a Postman collection (Newman replacement)")
+    parser.add_argument("collection", nargs="?", default=str(default_collection), help="Collection JSON file")
+    parser.add_argument("-e", "--environment", default=str(default_environment), help="Environment JSON file")
+    parser.add_argument("--env-var", action="append", default=[], metavar="KEY=VALUE",
+                        help="Override an environment variable")
+    parser.add_argument("--junit", default=str(project_root / "reports" / "api" / "postman-results.xml"),
+                        help="JUnit XML output file")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    parser.add_argument("--workers", type=int, default=4, help="Folders run at the same time")
+    parser.add_argument("--serial", action="store_true", help="Run folders one after another")
+    args = parser.parse_args()
+
+    collection = json.loads(Path(args.collection).read_text())
+    environment = json.loads(Path(args.environment).read_text()) if args.environment else None
+    overrides = dict(pair.split("=", 1) for pair in args.env_var)
+    variables = Variables(collection, environment, overrides)
+
+    print(f"🔌 {collection['info']['name']}")
+    started = time.perf_counter()
+    results = CollectionRunner(collection, variables, args.timeout, args.workers, args.serial).run()
+    elapsed = time.perf_counter() - started
+    write_junit(results, args.junit, collection["info"]["name"])
+
+    executions = [execution for folder in results for execution in folder["executions"]]
+    tests = [error for execution in executions for _, error in execution["tests"]]
+    failed_tests = sum(1 for error in tests if error)
+    request_errors = sum(1 for execution in executions if execution["error"])
+    print(f"\n📊 {len(executions)} requests ({request_errors} errors), {len(tests)} tests "
+          f"({failed_tests} failed) in {elapsed:.2f}s")
+    print(f"📁 JUnit results: {args.junit}")
+    return 1 if failed_tests or request_errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
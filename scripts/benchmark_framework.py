@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Framework-overhead benchmark for the page objects.
+Runs BasePage, LoginPage, ProductPage, CartPage and SearchResultsPage operations
+against the local stand-in app (fixed data, no injected latency), reports the
+latency of each operation, the WebDriver commands it sends and the time spent
+outside WebDriver round trips (steps, waits, screenshots, parsing), and compares
+the numbers with a stored baseline.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+selenium_tests_dir = project_root / "selenium-tests"
+sys.path.insert(0, str(selenium_tests_dir))
+
+from local_app import LocalApp  # noqa: E402
+from pages.base_page import BasePage  # noqa: E402
+from pages.cart_page import CartPage  # noqa: E402
+from pages.locators import By  # noqa: E402
+from pages.login_page import LoginPage  # noqa: E402
+from pages.product_page import ProductPage  # noqa: E402
+from pages.search_results_page import SearchResultsPage  # noqa: E402
+from test_data.catalog import ProductCatalog  # noqa: E402
+from utils import instrumentation  # noqa: E402
+from utils.command_profiler import CommandLog  # noqa: E402
+from utils.config import Config  # noqa: E402
+from utils.screenshots import ScreenshotService  # noqa: E402
+from utils.wait_engine import WaitLedger  # noqa: E402
+
+default_baseline = project_root / "scripts" / "framework_benchmark_baseline.json"
+default_results = project_root / "reports" / "framework_benchmark.json"
+
+_MISSING_LOCATOR = (By.ID, "benchmark-missing-element")
+
+
+class Target:
+    """Page objects bound to one driver and the data the operations use"""
+
+    def __init__(self, driver, config, product, query):
+        self.driver = driver
+        self.config = config
+        self.product_id = product["id"]
+        self.product_name = product["name"]
+        self.query = query
+        self.base = BasePage(driver, config)
+        self.login = LoginPage(driver, config)
+        self.product = ProductPage(driver, config)
+        self.cart = CartPage(driver, config)
+        self.results = SearchResultsPage(driver, config)
+
+    def home(self):
+        self.base.navigate_to("/")
+
+    def search(self):
+        self.base.navigate_to(f"/search?q={self.query}")
+
+    def product_page(self):
+        self.product.open_product(self.product_id)
+
+    def filled_cart(self):
+        # Adding the same product again only raises its quantity, so the cart keeps one line
+        self.product.open_product(self.product_id).add_to_cart()
+        self.cart.open()
+
+
+def _read_product(page):
+    return page.get_product_title(), page.get_product_price(), page.get_product_description()
+
+
+def _read_totals(target):
+    return target.cart.get_subtotal(), target.cart.get_tax(), target.cart.get_total()
+
+
+def _failed_login(target):
+    target.login.login("benchmark@example.com", "wrong-password")
+    return target.login.get_error_message()
+
+
+# (name, setup, operation): setup brings the browser to the page under test and is not timed
+OPERATIONS = [
+    ("BasePage.navigate_to", Target.search, lambda t: t.base.navigate_to("/")),
+    ("BasePage.navigate_to (unchanged page)", Target.home, lambda t: t.base.navigate_to("/")),
+    ("BasePage.find_element", Target.home, lambda t: t.base.find_element(BasePage._search_input)),
+    ("BasePage.is_element_visible", Target.home, lambda t: t.base.is_element_visible(BasePage._search_input)),
+    ("BasePage.is_element_absent", Target.home, lambda t: t.base.is_element_absent(_MISSING_LOCATOR)),
+    ("BasePage.get_element_text", Target.product_page, lambda t: t.base.get_element_text(ProductPage.PRODUCT_TITLE)),
+    ("BasePage.capture_screenshot", Target.home, lambda t: t.base.capture_screenshot("benchmark")),
+    ("BasePage.perform_search", Target.home, lambda t: t.base.perform_search(t.query)),
+    ("SearchResultsPage.get_results", Target.search, lambda t: t.results.get_results()),
+    ("SearchResultsPage.get_results_count", Target.search, lambda t: t.results.get_results_count()),
+    ("SearchResultsPage.is_product_listed", Target.search, lambda t: t.results.is_product_listed(t.product_name)),
+    ("LoginPage.open", Target.home, lambda t: t.login.open()),
+    ("LoginPage.login (invalid)", lambda t: t.login.open(), _failed_login),
+    ("ProductPage.open_product", Target.home, lambda t: t.product.open_product(t.product_id)),
+    ("ProductPage.read_details", Target.product_page, lambda t: _read_product(t.product)),
+    ("ProductPage.read_details (snapshot)", Target.product_page, lambda t: _read_product(t.product.snapshot())),
+    ("ProductPage.add_to_cart", Target.product_page, lambda t: t.product.set_quantity(1).add_to_cart()),
+    ("CartPage.open", Target.home, lambda t: t.cart.open()),
+    ("CartPage.get_cart_items_count", Target.filled_cart, lambda t: t.cart.get_cart_items_count()),
+    ("CartPage.get_item_price", Target.filled_cart, lambda t: t.cart.get_item_price(0)),
+    ("CartPage.read_totals", Target.filled_cart, _read_totals),
+]
+
+
+def measure(target, name, setup, operation, iterations, warmup):
+    """Time ``operation`` ``iterations`` times; return latency, command and wait statistics"""
+    driver = target.driver
+    wall_ms, framework_ms, commands, waits = [], [], [], []
+    for run in range(warmup + iterations):
+        if setup is not None:
+            setup(target)
+        log = CommandLog()
+        ledger = WaitLedger()
+        driver.command_log = log
+        driver.wait_ledger = ledger
+        for page in (target.base, target.login, target.product, target.cart, target.results):
+            page.wait.ledger = ledger
+        driver.screenshots.start_test(f"benchmark_{run}")
+        instrumentation.start_test(name)
+
+        started = time.perf_counter()
+        operation(target)
+        elapsed = time.perf_counter() - started
+
+        # Rendering the step log is part of what a test pays for each page-object call
+        render_started = time.perf_counter()
+        instrumentation.finish_test(failed=False)
+        elapsed += time.perf_counter() - render_started
+        driver.command_log = None
+        if run < warmup:
+            continue
+        wall_ms.append(elapsed * 1000)
+        framework_ms.append((elapsed - log.total_seconds) * 1000)
+        commands.append(len(log.entries))
+        waits.append(len(ledger.entries))
+
+    wall_ms.sort()
+    return {
+        "median_ms": round(statistics.median(wall_ms), 3),
+        "p90_ms": round(wall_ms[min(len(wall_ms) - 1, int(len(wall_ms) * 0.9))], 3),
+        "framework_ms": round(statistics.median(framework_ms), 3),
+        "commands": round(statistics.mean(commands), 2),
+        "waits": round(statistics.mean(waits), 2),
+    }
+
+
+def compare(results, baseline, max_regression, min_delta_ms):
+    """Regressions of ``results`` against ``baseline`` as printable lines"""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        if current["commands"] > previous["commands"]:
+            regressions.append(f"{name}: {previous['commands']} -> {current['commands']} WebDriver commands")
+        delta = current["median_ms"] - previous["median_ms"]
+        if previous["median_ms"] and delta > min_delta_ms and delta / previous["median_ms"] * 100 > max_regression:
+            regressions.append(f"{name}: median {previous['median_ms']:.1f} -> {current['median_ms']:.1f} ms "
+                               f"({delta / previous['median_ms'] * 100:+.0f}%)")
+    return regressions
+
+
+def create_fake_driver():
+    """In-process driver over the stand-in app's HTML: measures the framework with no browser at all"""
+    import requests
+    from utils.fake_driver import FakeDriver
+
+    return FakeDriver(session=requests.Session())
+
+
+def create_browser(config):
+    # Imported here so that --help and baseline comparisons never load selenium.webdriver
+    from utils.driver_factory import create_driver
+    from utils.driver_resolver import DriverResolver
+
+    resolver = DriverResolver(config.browser, cache_dir=config.webdriver_cache_dir,
+                              pinned_path=config.pinned_driver_path, offline=config.webdriver_offline)
+    return create_driver(config, resolver.resolve())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark page-object operations against the local stand-in app")
+    parser.add_argument("--driver", choices=("browser", "fake"), default="browser",
+                        help="Real browser, or utils.fake_driver to isolate framework overhead")
+    parser.add_argument("--browser", default="chrome", help="Browser: chrome or firefox")
+    parser.add_argument("--profile", default="fast-functional", help="Browser profile from config.json")
+    parser.add_argument("--iterations", type=int, default=20, help="Timed runs per operation")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed runs per operation before timing")
+    parser.add_argument("--instrumentation-level", default=None, choices=instrumentation.LEVELS,
+                        help="Step logging level to measure (default: config.json)")
+    parser.add_argument("--only", action="append", default=[],
+                        help="Only run operations whose name contains this text (repeatable)")
+    parser.add_argument("--baseline", default=str(default_baseline), help="Baseline JSON file")
+    parser.add_argument("--results", default=str(default_results), help="JSON file the results are written to")
+    parser.add_argument("--update-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--max-regression", type=float, default=25.0,
+                        help="Fail if an operation's median is this many percent slower than the baseline")
+    parser.add_argument("--min-delta-ms", type=float, default=2.0,
+                        help="Ignore slowdowns smaller than this many milliseconds (timer noise)")
+    args = parser.parse_args()
+
+    config = Config(args.browser, "local", args.profile)
+    instrumentation.set_level(args.instrumentation_level or config.instrumentation_level)
+    catalog = ProductCatalog()
+    product = catalog.first()
+    query = product["name"].split()[-1]
+    operations = [op for op in OPERATIONS if not args.only or any(text in op[0] for text in args.only)]
+    driver_key = f"{config.browser}/{config.profile}" if args.driver == "browser" else "fake"
+    target_key = f"{driver_key}/{instrumentation.get_level()}"
+
+    print(f"⏱️ Benchmarking {len(operations)} page-object operations ({target_key}, "
+          f"{args.iterations} runs + {args.warmup} warm-up)...")
+    app = LocalApp(host=config.local_app_host, port=0, latency_ms=0, jitter_ms=0).start()
+    config.use_local_app(app.base_url, app.api_url)
+    driver = create_browser(config) if args.driver == "browser" else create_fake_driver()
+    screenshot_dir = tempfile.mkdtemp(prefix="framework-benchmark-")
+    driver.screenshots = ScreenshotService(screenshot_dir)
+    results = {}
+    try:
+        target = Target(driver, config, product, query)
+        for name, setup, operation in operations:
+            results[name] = measure(target, name, setup, operation, args.iterations, args.warmup)
+    finally:
+        driver.screenshots.close()
+        driver.quit()
+        app.stop()
+
+    print(f"\n{'Operation':40} {'median ms':>10} {'p90 ms':>9} {'framework':>10} {'commands':>9} {'waits':>6}")
+    for name, r in results.items():
+        print(f"{name:40} {r['median_ms']:10.2f} {r['p90_ms']:9.2f} {r['framework_ms']:10.2f} "
+              f"{r['commands']:9.2f} {r['waits']:6.2f}")
+    print("\n'framework' is the median time outside WebDriver round trips: steps, waits, screenshots, parsing")
+
+    run = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "target": target_key,
+        "iterations": args.iterations,
+        "operations": results,
+    }
+    results_path = Path(args.results)
+    os.makedirs(results_path.parent, exist_ok=True)
+    results_path.write_text(json.dumps(run, indent=2))
+
+    baseline_path = Path(args.baseline)
+    baselines = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+    if args.update_baseline:
+        baselines[target_key] = {**baselines.get(target_key, {}), **results}
+        baseline_path.write_text(json.dumps(baselines, indent=2, sort_keys=True))
+        print(f"\n💾 Baseline for {target_key} updated in {baseline_path}")
+        return 0
+    if target_key not in baselines:
+        print(f"\nNo baseline for {target_key} yet; run with --update-baseline to store one")
+        return 0
+
+    regressions = compare(results, baselines[target_key], args.max_regression, args.min_delta_ms)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regressions vs baseline (>{args.max_regression}% and "
+              f">{args.min_delta_ms} ms slower, or more WebDriver commands):")
+        for line in regressions:
+            print(f"   {line}")
+        return 1
+    print("\n✅ No regressions vs baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
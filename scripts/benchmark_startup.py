@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for the UI test suite.
+Times `pytest --collect-only` (interpreter start, plugin loading, conftest and
+test module imports), lists the slowest imports and keeps a history so that
+startup regressions show up between runs.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+selenium_tests_dir = project_root / "selenium-tests"
+default_history = project_root / "reports" / "startup_benchmark.json"
+
+
+def time_collection(extra_args):
+    """Run one collection in a fresh interpreter; return its wall time and the -X importtime output"""
+    command = [sys.executable, "-X", "importtime", "-m", "pytest", "--collect-only", "-q", *extra_args]
+    started = time.perf_counter()
+    result = subprocess.run(command, cwd=selenium_tests_dir, capture_output=True, text=True)
+    elapsed = time.perf_counter() - started
+    if result.returncode != 0:
+        print(result.stdout[-2000:])
+        raise RuntimeError(f"Collection failed with exit code {result.returncode}")
+    return elapsed, result.stderr
+
+
+def slowest_imports(importtime_output, limit):
+    """Top-level imports sorted by cumulative time (microseconds)"""
+    imports = []
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            imports.append((int(cumulative), name.strip()))
+    return sorted(imports, reverse=True)[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark test suite startup (pytest --collect-only)")
+    parser.add_argument("--runs", type=int, default=5, help="Number of timed collections")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest imports to list")
+    parser.add_argument("--history", default=str(default_history), help="JSON file the results are appended to")
+    parser.add_argument("--max-seconds", type=float, default=None, help="Fail if the median exceeds this")
+    parser.add_argument("--max-regression", type=float, default=None,
+                        help="Fail if the median is this many percent slower than the previous run")
+    parser.add_argument("pytest_args", nargs="*", help="Extra pytest arguments, e.g. a test path")
+    args = parser.parse_args()
+
+    print("⏱️ Benchmarking suite startup...")
+    timings = []
+    importtime_output = ""
+    for run in range(args.runs):
+        elapsed, output = time_collection(args.pytest_args)
+        timings.append(elapsed)
+        importtime_output = importtime_output or output
+        print(f"   Run {run + 1}: {elapsed:.3f}s")
+
+    median = statistics.median(timings)
+    print(f"\n📊 Collection time: median {median:.3f}s, min {min(timings):.3f}s over {args.runs} runs")
+    print("\n🐢 Slowest top-level imports:")
+    for cumulative, name in slowest_imports(importtime_output, args.top):
+        print(f"   {cumulative / 1000:8.1f} ms  {name}")
+
+    history_path = Path(args.history)
+    history = json.loads(history_path.read_text()) if history_path.exists() else []
+    previous = history[-1]["median_seconds"] if history else None
+    history.append({
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "median_seconds": round(median, 4),
+        "min_seconds": round(min(timings), 4),
+        "runs": args.runs,
+        "pytest_args": args.pytest_args,
+    })
+    os.makedirs(history_path.parent, exist_ok=True)
+    history_path.write_text(json.dumps(history, indent=2))
+
+    failed = False
+    if previous:
+        change = (median - previous) / previous * 100
+        print(f"\n📈 Change vs previous run: {change:+.1f}% ({previous:.3f}s -> {median:.3f}s)")
+        if args.max_regression is not None and change > args.max_regression:
+            print(f"❌ Startup regressed by more than {args.max_regression}%")
+            failed = True
+    if args.max_seconds is not None and median > args.max_seconds:
+        print(f"❌ Median collection time exceeds the {args.max_seconds}s budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,12 +6,16 @@ This runs a simplified version of the login test without a real browser.
 
 import sys
 import os
+import time
 from pathlib import Path
 
 # Add selenium-tests to path
 selenium_tests_dir = Path(__file__).parent.parent / "selenium-tests"
 sys.path.insert(0, str(selenium_tests_dir))
 
+# Total time the demo may take; a slow import or data load fails the run
+TIME_BUDGET_SECONDS = float(os.getenv("SANITY_TIME_BUDGET", "10"))
+
 def demo_functionality():
     """Demonstrate that all the core functionality works."""
     print("🚀 E-Commerce QA Lab - Functionality Demo")
@@ -145,5 +149,11 @@ def demo_functionality():
     return True
 
 if __name__ == "__main__":
+    started = time.perf_counter()
     success = demo_functionality()
+    elapsed = time.perf_counter() - started
+    print(f"\n⏱️ Completed in {elapsed:.2f}s (budget {TIME_BUDGET_SECONDS:.0f}s)")
+    if elapsed > TIME_BUDGET_SECONDS:
+        print("   ❌ Time budget exceeded")
+        success = False
     sys.exit(0 if success else 1)
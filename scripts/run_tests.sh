@@ -108,29 +108,56 @@ run_smoke_tests() {
     return $exit_code
 }
 
-# Function to run API tests (if Newman is available)
+# Function to run API tests (Postman collection, no Newman needed)
 run_api_tests() {
     print_status "🔌 Running API Tests..."
+    mkdir -p reports/api
+
+    # Variables can be overridden, e.g. API_ENV_VARS="--env-var baseUrl=http://127.0.0.1:8000/api/v1"
+    python postman-tests/run_collection.py \
+        postman-tests/E-Commerce_API_Tests.postman_collection.json \
+        -e postman-tests/environments/qa.postman_environment.json \
+        --junit reports/api/postman-results.xml \
+        $API_ENV_VARS
+
+    local exit_code=$?
+
+    if [ $exit_code -eq 0 ]; then
+        print_success "API tests completed successfully"
+    else
+        print_warning "Some API tests failed"
+    fi
+
+    return $exit_code
+}
+
+# Function to run load tests with the asyncio engine (no JMeter install needed)
+run_performance_tests() {
+    local scenario=${1:-all}
+    print_status "⚡ Running Performance Tests ($scenario)..."
+    mkdir -p reports/load
     
-    if command -v newman &> /dev/null; then
-        mkdir -p reports/api
-        
-        newman run postman-tests/E-Commerce_API_Tests.postman_collection.json \
-            -e postman-tests/environments/qa.postman_environment.json \
-            -r cli,junit,htmlextra \
-            --reporter-junit-export reports/api/newman-results.xml \
-            --reporter-htmlextra-export reports/api/newman-report.html \
-            --color on
-        
-        if [ $? -eq 0 ]; then
-            print_success "API tests completed successfully"
-        else
-            print_warning "Some API tests failed"
-        fi
+    # Targets and load shape come from LOAD_BASE_URL, LOAD_API_URL, LOAD_RATE and LOAD_DURATION
+    python load-tests/run_load.py "$scenario" \
+        --rate "${LOAD_RATE:-50}" \
+        --duration "${LOAD_DURATION:-30}" \
+        --arrival "${LOAD_ARRIVAL:-constant}" \
+        --jtl reports/load/results.jtl \
+        --output-dir reports/load
+    
+    local exit_code=$?
+    
+    if [ -f reports/load/results.jtl ]; then
+        python load-tests/jtl_analyzer.py reports/load/results.jtl --output-dir reports/load
+    fi
+    
+    if [ $exit_code -eq 0 ]; then
+        print_success "Performance tests completed"
     else
-        print_warning "Newman not found. Skipping API tests."
-        print_status "Install Newman with: npm install -g newman newman-reporter-htmlextra"
+        print_warning "Performance tests failed (exit code: $exit_code)"
     fi
+    
+    return $exit_code
 }
 
 # Function to generate reports
@@ -152,7 +179,8 @@ generate_reports() {
     # List all available reports
     print_status "Available reports:"
     [ -f "reports/ui-test-report.html" ] && echo "  📋 UI Test Report: reports/ui-test-report.html"
-    [ -f "reports/api/newman-report.html" ] && echo "  🔌 API Test Report: reports/api/newman-report.html"
+    [ -f "reports/api/postman-results.xml" ] && echo "  🔌 API Test Results: reports/api/postman-results.xml"
+    [ -d "reports/load" ] && [ "$(ls -A reports/load)" ] && echo "  ⚡ Load Test Results: reports/load/"
     [ -d "reports/allure-report" ] && echo "  📈 Allure Report: reports/allure-report/index.html"
     [ -d "reports/screenshots" ] && [ "$(ls -A reports/screenshots)" ] && echo "  📸 Screenshots: reports/screenshots/"
 }
@@ -165,17 +193,19 @@ clean_reports() {
     rm -f reports/*.html
     rm -rf reports/api/*
     rm -f reports/screenshots/*
+    rm -rf reports/load/*
     print_success "Reports cleaned"
 }
 
 # Function to show usage
 show_usage() {
-    echo "Usage: $0 {ui|smoke|api|all|clean|specific} [test_path]"
+    echo "Usage: $0 {ui|smoke|api|performance|all|clean|specific} [test_path|scenario]"
     echo ""
     echo "Commands:"
     echo "  ui         Run all UI tests"
     echo "  smoke      Run smoke tests only"
-    echo "  api        Run API tests (requires Newman)"
+    echo "  api        Run API tests (Postman collection)"
+    echo "  performance Run load scenarios: homepage, product, checkout or all (default)"
     echo "  all        Run all tests and generate reports"
     echo "  clean      Clean old reports"
     echo "  specific   Run a specific test (requires test_path)"
@@ -183,6 +213,7 @@ show_usage() {
     echo "Examples:"
     echo "  $0 ui                                    # Run all UI tests"
     echo "  $0 smoke                                 # Run smoke tests"
+    echo "  LOAD_RATE=200 $0 performance checkout    # Open-loop load at 200 req/s"
     echo "  $0 specific tests/test_login.py          # Run specific test file"
     echo "  $0 specific tests/test_login.py::TestLogin::test_successful_login"
     echo ""
@@ -207,6 +238,9 @@ main() {
         api)
             run_api_tests
             ;;
+        performance)
+            run_performance_tests "$2"
+            ;;
         specific)
             if [ -z "$2" ]; then
                 print_error "Test path required for specific test"
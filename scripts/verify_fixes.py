@@ -6,9 +6,13 @@ This script validates the basic functionality without running full tests.
 
 import sys
 import os
+import time
 import importlib.util
 from pathlib import Path
 
+# Total time the verification may take; a slow import or data load fails the run
+TIME_BUDGET_SECONDS = float(os.getenv("SANITY_TIME_BUDGET", "10"))
+
 # Add the selenium-tests directory to the Python path
 selenium_tests_dir = Path(__file__).parent.parent / "selenium-tests"
 sys.path.insert(0, str(selenium_tests_dir))
@@ -147,13 +151,20 @@ def main():
     ]
     
     results = []
+    started = time.perf_counter()
     for test_name, test_func in tests:
+        check_started = time.perf_counter()
         try:
             result = test_func()
             results.append((test_name, result))
         except Exception as e:
             print(f"❌ {test_name} failed with exception: {e}")
             results.append((test_name, False))
+        print(f"⏱️ {test_name} took {time.perf_counter() - check_started:.2f}s")
+    
+    elapsed = time.perf_counter() - started
+    within_budget = elapsed <= TIME_BUDGET_SECONDS
+    results.append((f"Time Budget ({elapsed:.2f}s of {TIME_BUDGET_SECONDS:.0f}s)", within_budget))
     
     # Summary
     print("\n" + "="*50)
@@ -1,57 +1,338 @@
 import pytest
 import os
 import json
-from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
+from test_data import products
+from utils import instrumentation, run_summary
+from utils.browser_pool import BrowserPool
+from utils.command_profiler import CommandLog
+from utils.browser_profiles import BASELINE_PROFILE, merge_page_metrics, page_savings
 from utils.config import Config
+from utils.driver_factory import create_driver
+from utils.driver_resolver import DriverResolver
+from utils.screenshots import ScreenshotService
+from utils.session_cache import SessionCache
+from utils.step_retry import StepRetryBudget
+from utils.wait_engine import WaitLedger
+
+
+pytest_plugins = ["plugins.duration_scheduler", "plugins.test_impact", "plugins.result_cache"]
+
+PAGE_METRICS_CACHE_KEY = "browser_profiles/page_metrics"
+
+
+def _format_driver_resolution(records, config):
+    for r in records:
+        yield (f"[{r['worker']}] {r['browser']} {r['browser_version'] or ''} -> {r['path']} "
+               f"({r['source']}, {r['seconds']:.3f}s)")
+
+
+def _merged_page_metrics(records):
+    profile = records[0]["profile"]
+    pages = {}
+    for r in records:
+        merge_page_metrics(pages, r["pages"])
+    return profile, pages
+
+
+def _format_page_metrics(records, config):
+    profile, pages = _merged_page_metrics(records)
+    baseline = config.cache.get(f"{PAGE_METRICS_CACHE_KEY}/{BASELINE_PROFILE}", {}) if getattr(config, "cache", None) else {}
+    savings = page_savings(pages, baseline) if profile != BASELINE_PROFILE else {}
+    for page, totals in sorted(pages.items()):
+        line = (f"{page}: {totals['bytes'] / totals['samples'] / 1024:.1f} KiB, "
+                f"{totals['load_ms'] / totals['samples']:.0f} ms per load ({totals['samples']} loads)")
+        if page in savings:
+            line += (f" | saved vs {BASELINE_PROFILE}: {savings[page]['bytes'] / 1024:.1f} KiB, "
+                     f"{savings[page]['load_ms']:.0f} ms")
+        yield line
+    if profile != BASELINE_PROFILE and not baseline:
+        yield f"No '{BASELINE_PROFILE}' baseline recorded yet; run once with --profile {BASELINE_PROFILE} to report savings"
+
+
+def _format_wait_time(records, config):
+    total = sum(r["seconds"] for r in records)
+    yield f"{sum(r['waits'] for r in records)} waits, {total:.1f}s spent waiting across {len(records)} tests"
+    saved = sum(r.get("saved", 0.0) for r in records)
+    if saved:
+        yield f"~{saved:.1f}s of polling latency saved by waits observed in the page"
+    for r in sorted(records, key=lambda r: r["seconds"], reverse=True)[:5]:
+        yield f"{r['seconds']:7.2f}s  {r['waits']:4d} waits  {r['nodeid']}"
+
+
+def _format_webdriver_commands(records, config):
+    total = sum(r["commands"] for r in records)
+    seconds = sum(r["seconds"] for r in records)
+    yield f"{total} commands, {seconds:.1f}s in WebDriver round trips across {len(records)} tests"
+    for r in sorted(records, key=lambda r: r["commands"], reverse=True)[:5]:
+        budget = f" (budget {r['budget']})" if r["budget"] is not None else ""
+        yield f"{r['commands']:6d} commands  {r['seconds']:7.2f}s  {r['nodeid']}{budget}"
+
+
+def _format_session_cache(records, config):
+    totals = {key: sum(r[key] for r in records) for key in ("restored", "ui_logins", "api_logins", "invalidated")}
+    yield (f"{totals['restored']} sessions restored from cache, {totals['ui_logins']} UI logins, "
+           f"{totals['api_logins']} API logins, {totals['invalidated']} invalidated")
+
+
+def _format_screenshots(records, config):
+    totals = {key: sum(r[key] for r in records) for key in ("captured", "stored", "deduplicated", "dropped", "bytes_written")}
+    yield (f"{totals['captured']} captured, {totals['stored']} stored ({totals['bytes_written'] / 1024:.0f} KiB), "
+           f"{totals['deduplicated']} deduplicated, {totals['dropped']} dropped by byte caps")
+
+
+def _format_step_retries(records, config):
+    yield f"{sum(r['retries'] for r in records)} page-object steps retried in place across {len(records)} tests"
+    for r in sorted(records, key=lambda r: r["retries"], reverse=True)[:5]:
+        yield f"{r['retries']:4d}  {r['nodeid']}  ({', '.join(sorted(set(r['steps'])))})"
+
+
+def _format_browser_pool(records, config):
+    totals = {key: sum(r[key] for r in records) for key in ("created", "recycled", "leases")}
+    yield (f"{totals['leases']} tests served by {totals['created']} browser sessions "
+           f"({totals['recycled']} recycled) in {len(records)} processes")
+
+
+def _format_cart_seeding(records, config):
+    totals = {key: sum(r[key] for r in records) for key in ("logins", "items_added", "carts_cleared")}
+    yield (f"{totals['items_added']} cart items seeded through the API for {totals['logins']} sessions, "
+           f"{totals['carts_cleared']} carts cleared")
+
+
+run_summary.register_formatter("driver_resolution", "WebDriver binary resolution", _format_driver_resolution)
+run_summary.register_formatter("page_metrics", "Page weight and load time per browser profile", _format_page_metrics)
+run_summary.register_formatter("browser_pool", "Browser sessions", _format_browser_pool)
+run_summary.register_formatter("wait_time", "Explicit wait time", _format_wait_time)
+run_summary.register_formatter("webdriver_commands", "WebDriver commands", _format_webdriver_commands)
+run_summary.register_formatter("session_cache", "Authenticated sessions", _format_session_cache)
+run_summary.register_formatter("screenshots", "Screenshots", _format_screenshots)
+run_summary.register_formatter("cart_seeding", "Cart seeding", _format_cart_seeding)
+run_summary.register_formatter("step_retries", "Step retries", _format_step_retries)
 
 
 def pytest_addoption(parser):
     parser.addoption("--browser", action="store", default="chrome", help="Browser to run tests: chrome or firefox")
-    parser.addoption("--env", action="store", default="qa", help="Environment to run tests: dev, qa, or prod")
+    parser.addoption("--env", action="store", default="qa",
+                     help="Environment to run tests: dev, qa, prod, or local (starts the bundled stand-in app)")
+    parser.addoption("--profile", action="store", default=None,
+                     help="Browser profile from config.json: fast-functional, full-fidelity or visual")
+    parser.addoption("--instrumentation-level", action="store", default=None, choices=instrumentation.LEVELS,
+                     help="Step logging: off, failures (log attached to failed tests), steps or verbose")
+
+
+def pytest_configure(config):
+    level = config.getoption("--instrumentation-level")
+    if level is None:
+        level = Config(config.getoption("--browser"), config.getoption("--env")).instrumentation_level
+    instrumentation.set_level(level)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    instrumentation.start_test(item.nodeid)
 
 
 @pytest.fixture(scope="session")
 def config(request):
     browser = request.config.getoption("--browser")
     env = request.config.getoption("--env")
-    return Config(browser, env)
+    profile = request.config.getoption("--profile")
+    return Config(browser, env, profile)
 
 
-@pytest.fixture(scope="function")
-def driver(config, request):
-    browser = config.browser.lower()
+@pytest.fixture(scope="session", autouse=True)
+def local_app(config):
+    """With --env local, the bundled stand-in application, one isolated instance per test process"""
+    if config.env != "local":
+        yield None
+        return
+    from local_app import LocalApp
     
-    if browser == "chrome":
-        options = webdriver.ChromeOptions()
-        options.add_argument("--start-maximized")
-        options.add_argument("--disable-extensions")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--no-sandbox")
-        # options.add_argument("--headless")  # Uncomment for headless execution
-        driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=options)
-    elif browser == "firefox":
-        options = webdriver.FirefoxOptions()
-        options.add_argument("--start-maximized")
-        # options.add_argument("--headless")  # Uncomment for headless execution
-        driver = webdriver.Firefox(service=FirefoxService(GeckoDriverManager().install()), options=options)
-    else:
-        raise ValueError(f"Browser {browser} is not supported")
-    
-    driver.implicitly_wait(10)
+    app = LocalApp(
+        host=config.local_app_host,
+        port=config.local_app_port,
+        latency_ms=config.local_app_latency_ms,
+        jitter_ms=config.local_app_jitter_ms,
+        extra_users=[config.get_credentials(user_type) for user_type in config.user_types],
+    ).start()
+    config.use_local_app(app.base_url, app.api_url)
+    yield app
+    app.stop()
+
+
+@pytest.fixture(scope="session")
+def product_catalog():
+    """Indexed product test data, shared with test_data.products"""
+    return products.catalog
+
+
+@pytest.fixture(scope="session")
+def driver_binary(config, request):
+    """Path of the WebDriver binary, resolved once per session and cached across workers"""
+    resolver = DriverResolver(
+        config.browser,
+        cache_dir=config.webdriver_cache_dir,
+        pinned_path=config.pinned_driver_path,
+        offline=config.webdriver_offline,
+    )
+    path = resolver.resolve()
+    run_summary.record(
+        request.config, "driver_resolution",
+        browser=resolver.browser, browser_version=resolver.browser_version,
+        path=path, source=resolver.source, seconds=resolver.elapsed,
+    )
+    return path
+
+
+@pytest.fixture(scope="session")
+def browser_pool(config, driver_binary, request):
+    """Warm browser sessions shared by every test in this process (one pool per xdist worker)"""
+    pool = BrowserPool(
+        lambda: create_driver(config, driver_binary),
+        size=config.browser_pool_size,
+        max_uses=config.browser_pool_max_tests,
+    )
+    pool.warm_up()
+    yield pool
+    pool.close()
+    run_summary.record(request.config, "browser_pool", created=pool.created, recycled=pool.recycled,
+                       leases=pool.leases)
     
+    page_metrics = config.browser_profile.page_metrics
+    if page_metrics is not None and page_metrics.pages:
+        run_summary.record(request.config, "page_metrics", profile=config.profile, pages=page_metrics.pages)
+
+
+@pytest.fixture(scope="session")
+def screenshot_service(config, request):
+    """Stores screenshots once, deduplicated, from a background writer thread"""
+    service = ScreenshotService(
+        config.screenshot_dir,
+        per_test_bytes=config.screenshot_max_bytes_per_test,
+        per_run_bytes=config.screenshot_max_bytes_per_run,
+        max_width=config.screenshot_max_width,
+        recompress=config.screenshot_recompress,
+    )
+    yield service
+    service.close()
+    if service.stats["captured"]:
+        run_summary.record(request.config, "screenshots", **service.stats)
+
+
+@pytest.fixture(scope="session")
+def session_cache(config, request):
+    """Logged-in browser state, created once per user in this process and restored in later tests"""
+    cache = SessionCache(
+        config,
+        ttl=config.session_cache_ttl,
+        login_via_api=config.session_login_via_api,
+        landing_path=config.session_landing_path,
+    )
+    yield cache
+    if any(cache.stats.values()):
+        run_summary.record(request.config, "session_cache", **cache.stats)
+
+
+@pytest.fixture(scope="function")
+def login_as(driver, session_cache):
+    """Log the test's browser in: ``login_as("customer_user")``; defaults to the admin user"""
+    def login(user_type="admin_user"):
+        return session_cache.login(driver, user_type)
+    return login
+
+
+@pytest.fixture(scope="session")
+def cart_api(config, request):
+    """Cart REST endpoints, for tests that need items in the cart before they start"""
+    from utils.cart_api import CartApi
+
+    api = CartApi(config)
+    yield api
+    api.close()
+    if any(api.stats.values()):
+        run_summary.record(request.config, "cart_seeding", **api.stats)
+
+
+@pytest.fixture(scope="function")
+def seed_cart(driver, cart_api):
+    """Fill a cart through the API and bind its session to the browser: ``seed_cart((product_id, quantity), ...)``
+
+    Logs ``user_type`` (default customer_user) in through the API, so the test
+    can start on ``CartPage.open()``. Seeded carts are emptied with one
+    ``DELETE /cart`` each after the test.
+    """
+    seeded = []
+
+    def seed(*items, user_type="customer_user"):
+        state = cart_api.login(user_type)
+        seeded.append(state)
+        cart = None
+        for product_id, quantity in items:
+            cart = cart_api.add_item(state, product_id, quantity)
+        cart_api.bind(driver, state)
+        return cart
+
+    yield seed
+    for state in seeded:
+        try:
+            cart_api.clear(state)
+        finally:
+            # The API client outlives the test; it must not keep the pooled browser
+            cart_api.unbind(state)
+
+
+def _step_retry_budget(config, request):
+    """Retry budget for the test, or None when step retries are off for it"""
+    marker = request.node.get_closest_marker("step_retry")
+    if marker is None and not config.step_retry_enabled:
+        return None
+    options = marker.kwargs if marker else {}
+    max_attempts, max_retries = options.get("max_attempts"), options.get("max_retries")
+    return StepRetryBudget(
+        max_attempts=config.step_retry_max_attempts if max_attempts is None else max_attempts,
+        max_retries=config.step_retry_max_per_test if max_retries is None else max_retries,
+        delay=config.step_retry_delay,
+    )
+
+
+@pytest.fixture(scope="function")
+def driver(browser_pool, screenshot_service, config, request):
     # Add test name to the driver for logging purposes
-    test_name = request.node.name
-    setattr(driver, "test_name", test_name)
+    driver = browser_pool.lease(test_name=request.node.name)
+    setattr(driver, "wait_ledger", WaitLedger())
+    screenshot_service.start_test(request.node.name)
+    setattr(driver, "screenshots", screenshot_service)
+    setattr(driver, "command_log", CommandLog())
+    setattr(driver, "step_retries", _step_retry_budget(config, request))
+    # Navigation dedup and locator snapshots never carry over from the previous lease
+    setattr(driver, "page_state", None)
+    setattr(driver, "page_snapshot", None)
     
     yield driver
     
-    driver.quit()
+    # Commands of the pool's session reset are not part of the test's budget
+    setattr(driver, "command_log", None)
+    setattr(driver, "step_retries", None)
+    setattr(driver, "page_state", None)
+    setattr(driver, "page_snapshot", None)
+    browser_pool.release(driver)
+
+
+def pytest_sessionfinish(session):
+    run_summary.export_to_controller(session.config)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    run_summary.merge_from_worker(node.config, getattr(node, "workeroutput", None))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    page_metrics = run_summary.records(config, "page_metrics")
+    if page_metrics and getattr(config, "cache", None) is not None:
+        # Keep the latest per-page numbers of each profile so later runs can report savings
+        profile, pages = _merged_page_metrics(page_metrics)
+        config.cache.set(f"{PAGE_METRICS_CACHE_KEY}/{profile}", pages)
+    run_summary.write_terminal_summary(terminalreporter, config)
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -61,27 +342,52 @@ def pytest_runtest_makereport(item, call):
     
     if report.when == "call":
         driver = item.funcargs.get("driver")
+        ledger = getattr(driver, "wait_ledger", None)
+        if ledger is not None and ledger.entries:
+            report.sections.append(("Explicit waits", ledger.format()))
+            report.user_properties.append(("wait_seconds", round(ledger.total_seconds, 3)))
+            run_summary.record(item.config, "wait_time", nodeid=item.nodeid,
+                               waits=len(ledger.entries), seconds=ledger.total_seconds, saved=ledger.saved_seconds)
+        command_log = getattr(driver, "command_log", None)
+        if command_log is not None:
+            marker = item.get_closest_marker("max_commands")
+            budget = marker.args[0] if marker else None
+            report.sections.append(("WebDriver commands", command_log.format()))
+            report.user_properties.append(("webdriver_commands", len(command_log.entries)))
+            run_summary.record(item.config, "webdriver_commands", nodeid=item.nodeid, budget=budget,
+                               commands=len(command_log.entries), seconds=command_log.total_seconds)
+            if budget is not None and report.passed and len(command_log.entries) > budget:
+                report.outcome = "failed"
+                report.longrepr = (f"WebDriver command budget exceeded: {len(command_log.entries)} commands "
+                                   f"sent, max_commands is {budget}\n\n{command_log.format()}")
+        step_retries = getattr(driver, "step_retries", None)
+        if step_retries is not None and step_retries.entries:
+            report.sections.append(("Step retries", step_retries.format()))
+            report.user_properties.append(("step_retries", len(step_retries.entries)))
+            run_summary.record(item.config, "step_retries", nodeid=item.nodeid, retries=len(step_retries.entries),
+                               steps=[step for step, _, _ in step_retries.entries])
         if driver and report.failed:
-            # Take screenshot on test failure
+            # Captured once; the same stored file backs reports/screenshots and the Allure attachment
             try:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 test_name = getattr(driver, "test_name", "unknown_test")
-                screenshot_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "reports", "screenshots")
-                os.makedirs(screenshot_dir, exist_ok=True)
-                screenshot_path = os.path.join(screenshot_dir, f"{test_name}_{timestamp}.png")
-                driver.save_screenshot(screenshot_path)
-                print(f"Screenshot saved to {screenshot_path}")
-                
-                # Attach screenshot to Allure report if Allure is being used
-                try:
-                    import allure
-                    allure.attach(
-                        driver.get_screenshot_as_png(),
-                        name=f"{test_name}_{timestamp}",
-                        attachment_type=allure.attachment_type.PNG
-                    )
-                except ImportError:
-                    # Allure not available, skip attachment
-                    pass
+                path = driver.screenshots.capture(driver, f"{test_name}_failure")
+                if path:
+                    print(f"Screenshot saved to {path}")
             except Exception as e:
-                print(f"Failed to take screenshot: {e}")
\ No newline at end of file
+                print(f"Failed to take screenshot: {e}")
+
+    # After the command budget, so a test failed by it gets its step log and profile too
+    if report.when == "call" or (report.when == "setup" and report.failed):
+        # One compact attachment per test instead of one file per page-object call
+        step_log = instrumentation.finish_test(failed=report.failed)
+        command_log = getattr(item.funcargs.get("driver"), "command_log", None)
+        profile = command_log.format() if report.failed and command_log is not None and command_log.entries else None
+        if step_log or profile:
+            try:
+                import allure
+                if step_log:
+                    allure.attach(step_log, name="Step log", attachment_type=allure.attachment_type.TEXT)
+                if profile:
+                    allure.attach(profile, name="WebDriver commands", attachment_type=allure.attachment_type.TEXT)
+            except ImportError:
+                pass
@@ -0,0 +1,4 @@
+"""Local stand-in for the e-commerce application under test (``--env local``)."""
+from local_app.server import LocalApp
+
+__all__ = ["LocalApp"]
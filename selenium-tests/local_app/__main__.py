@@ -0,0 +1,33 @@
+"""Run the local stand-in application in the foreground.
+
+Examples:
+    python -m local_app --port 8000
+    python -m local_app --port 8000 --latency-ms 20 --jitter-ms 10
+    python -m local_app --port 8000 --users-path ../reports/data/users.jsonl
+"""
+import argparse
+
+from local_app import LocalApp
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in e-commerce application")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on (0 picks a free one)")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Delay added to every response")
+    parser.add_argument("--jitter-ms", type=int, default=0, help="Extra per-path delay of up to this many ms")
+    parser.add_argument("--users-path", default=None,
+                        help="Users to accept: users.json-style JSON or generated JSONL (default: USERS_DATA_PATH "
+                             "or test_data/users.json)")
+    args = parser.parse_args()
+
+    app = LocalApp(args.host, args.port, args.latency_ms, args.jitter_ms, users_path=args.users_path)
+    print(f"🏪 Storefront on {app.base_url}, API on {app.api_url} (Ctrl+C to stop)")
+    try:
+        app.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,424 @@
+"""HTTP server of the local stand-in application.
+
+Serves the storefront pages the page objects drive and the REST API of the
+Postman collection (under ``/api/v1``, which also covers the JMeter plans'
+``/api/v1/products/{id}`` and ``/api/v1/checkout``). A browser is identified
+by its ``session_id`` cookie and an API client by its bearer token; logging in
+through the API returns the session id as the token and sets the same cookie,
+so a cart filled through the API shows up in a browser that carries it.
+"""
+import json
+import re
+import threading
+import time
+import zlib
+from http import cookies
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from local_app import views
+from local_app.store import PROMO_CODES, Session, Store
+
+SESSION_COOKIE = "session_id"
+API_PREFIX = "/api/v1"
+# localStorage key the account page stores the API token under (read by utils.session_cache)
+TOKEN_STORAGE_KEY = "authToken"
+FEATURED_PRODUCTS = 12
+
+_PAGE_ROUTES = []
+_API_ROUTES = []
+
+
+def _route(table, method, pattern):
+    def register(handler):
+        table.append((method, re.compile(f"{pattern}$"), handler))
+        return handler
+    return register
+
+
+def page(method, pattern):
+    return _route(_PAGE_ROUTES, method, pattern)
+
+
+def api(method, pattern):
+    return _route(_API_ROUTES, method, pattern)
+
+
+class Response:
+    __slots__ = ("status", "body", "content_type", "headers")
+
+    def __init__(self, status=200, body=b"", content_type="text/html; charset=utf-8", headers=None):
+        self.status = status
+        self.body = body.encode() if isinstance(body, str) else body
+        self.content_type = content_type
+        self.headers = headers or {}
+
+
+def _json(status, payload):
+    return Response(status, json.dumps(payload), "application/json")
+
+
+def _redirect(location):
+    return Response(303, b"", headers={"Location": location})
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so load tests measure the app rather than TCP setup
+    disable_nagle_algorithm = True  # headers and body are separate writes; don't let them wait for an ACK
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._dispatch()
+
+    def do_POST(self):
+        self._dispatch()
+
+    def do_PUT(self):
+        self._dispatch()
+
+    def do_DELETE(self):
+        self._dispatch()
+
+    def _dispatch(self):
+        app = self.server.app
+        url = urlsplit(self.path)
+        self.query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        self.body = self.rfile.read(length) if length else b""
+        app.delay(url.path)
+
+        is_api = url.path == API_PREFIX or url.path.startswith(API_PREFIX + "/")
+        path = (url.path[len(API_PREFIX):] or "/") if is_api else url.path
+        self.session, created = self._session(is_api)
+        routes = _API_ROUTES if is_api else _PAGE_ROUTES
+        for method, pattern, handler in routes:
+            match = pattern.match(path)
+            if match and method == self.command:
+                args = [unquote(arg) for arg in match.groups()]
+                response = handler(self, app.store, *args)
+                break
+        else:
+            if is_api:
+                response = _json(404, {"error": f"No route for {self.command} {url.path}"})
+            else:
+                response = Response(404, views.not_found(self.session, url.path))
+        if created:
+            app.store.keep(self.session)
+        if created and not is_api:
+            response.headers["Set-Cookie"] = f"{SESSION_COOKIE}={self.session.id}; Path=/; HttpOnly"
+        with app.stats_lock:
+            app.stats["requests"] += 1
+        self._send(response)
+
+    def _session(self, is_api):
+        """The caller's session: bearer token first, then the session cookie"""
+        store = self.server.app.store
+        authorization = self.headers.get("Authorization", "")
+        if authorization.startswith("Bearer "):
+            return store.session(authorization[len("Bearer "):].strip())
+        jar = cookies.SimpleCookie(self.headers.get("Cookie", ""))
+        session_id = jar[SESSION_COOKIE].value if SESSION_COOKIE in jar else None
+        if is_api and session_id is None:
+            return Session("anonymous"), False  # not kept: an anonymous API call has no way back to it
+        return store.session(session_id)
+
+    def _send(self, response):
+        self.send_response(response.status)
+        self.send_header("Content-Type", response.content_type)
+        self.send_header("Content-Length", str(len(response.body)))
+        for name, value in response.headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(response.body)
+
+    def form(self):
+        return {key: values[-1] for key, values in parse_qs(self.body.decode()).items()}
+
+    def json_body(self):
+        try:
+            return json.loads(self.body or b"{}")
+        except ValueError:
+            return None
+
+
+# --- Storefront pages ----------------------------------------------------------
+
+@page("GET", r"/")
+def home_page(request, store):
+    products = [product for _, product in zip(range(FEATURED_PRODUCTS), store.catalog)]
+    return Response(200, views.home(request.session, products))
+
+
+@page("GET", r"/search")
+def search_page(request, store):
+    query = request.query.get("q", "")
+    sort = request.query.get("sort", "relevance")
+    return Response(200, views.search_results(request.session, query, sort, store.search(query, sort)))
+
+
+@page("GET", r"/product/([^/]+)")
+def product_page(request, store, product_id):
+    product = store.product(product_id)
+    if product is None:
+        return Response(404, views.not_found(request.session, request.path))
+    return Response(200, views.product_detail(request.session, product, store.related(product),
+                                              added=request.query.get("added"),
+                                              wishlisted="wishlisted" in request.query))
+
+
+@page("POST", r"/cart/add")
+def add_to_cart(request, store):
+    form = request.form()
+    product = store.product(form.get("product_id", ""))
+    if product is None:
+        return Response(404, views.not_found(request.session, request.path))
+    quantity = max(_int(form.get("quantity"), 1), 1)
+    request.session.add_item(product, quantity)
+    return _redirect(f"/product/{product['id']}?added={quantity}")
+
+
+@page("POST", r"/wishlist/add")
+def add_to_wishlist(request, store):
+    product_id = request.form().get("product_id", "")
+    request.session.add_to_wishlist(product_id)
+    return _redirect(f"/product/{product_id}?wishlisted=1")
+
+
+@page("GET", r"/cart")
+def cart_page(request, store):
+    code = request.query.get("promo")
+    if code is None:
+        return Response(200, views.cart(request.session))
+    accepted = request.session.promo_code == code
+    message = f"Promo code {code} applied" if accepted else f"Promo code {code} is not valid"
+    return Response(200, views.cart(request.session, message, accepted))
+
+
+@page("POST", r"/cart/update")
+def update_cart(request, store):
+    for key, value in request.form().items():
+        if key.startswith("quantity-"):
+            request.session.set_quantity(key[len("quantity-"):], _int(value, 1))
+    return _redirect("/cart")
+
+
+@page("POST", r"/cart/remove/([^/]+)")
+def remove_from_cart(request, store, item_id):
+    request.session.remove_item(item_id)
+    return _redirect("/cart")
+
+
+@page("POST", r"/cart/promo")
+def apply_promo(request, store):
+    code = request.form().get("code", "").strip().upper()
+    if code in PROMO_CODES:
+        request.session.promo_code = code
+    return _redirect(f"/cart?promo={code}")
+
+
+@page("GET", r"/checkout")
+def checkout_page(request, store):
+    return Response(200, views.checkout(request.session))
+
+
+@page("POST", r"/checkout")
+def place_order_page(request, store):
+    form = request.form()
+    order = store.place_order(request.session, {"method": "credit_card"},
+                              {"street": form.get("street"), "city": form.get("city"), "zipCode": form.get("zip_code")})
+    return _redirect(f"/checkout/complete?order={order['orderId']}")
+
+
+@page("GET", r"/checkout/complete")
+def order_complete_page(request, store):
+    order = request.session.last_order
+    if order is None or order["orderId"] != request.query.get("order"):
+        return _redirect("/cart")
+    return Response(200, views.order_confirmation(request.session, order))
+
+
+@page("GET", r"/login")
+def login_page(request, store):
+    return Response(200, views.login(request.session))
+
+
+@page("POST", r"/login")
+def login_submit(request, store):
+    form = request.form()
+    email, password = form.get("email", ""), form.get("password", "")
+    if not email or not password:
+        return Response(200, views.login(request.session, email, "Please enter your email and password"))
+    user = store.authenticate(email, password)
+    if user is None:
+        return Response(200, views.login(request.session, email, "Invalid email or password"))
+    request.session.user = user
+    return _redirect("/account")
+
+
+@page("GET", r"/account")
+def account_page(request, store):
+    if request.session.user is None:
+        return _redirect("/login")
+    return Response(200, views.account(request.session, TOKEN_STORAGE_KEY))
+
+
+@page("GET", r"/logout")
+def logout(request, store):
+    request.session.user = None
+    return _redirect("/")
+
+
+@page("GET", r"/forgot-password")
+def forgot_password_page(request, store):
+    return Response(200, views.forgot_password(request.session))
+
+
+@page("POST", r"/forgot-password")
+def forgot_password_submit(request, store):
+    return Response(200, views.forgot_password(request.session, sent=True))
+
+
+@page("GET", r"/register")
+def register_page(request, store):
+    return Response(200, views.register(request.session))
+
+
+# --- REST API (Postman collection and JMeter plans) ---------------------------
+
+@api("POST", r"/auth/login")
+def api_login(request, store):
+    body = request.json_body() or {}
+    user = store.authenticate(body.get("email"), body.get("password"))
+    if user is None:
+        return _json(401, {"error": "Invalid email or password"})
+    session, _ = store.session()
+    session.user = user
+    store.keep(session)
+    return Response(200, json.dumps({"token": session.id, "user": store.public_user(user)}), "application/json",
+                    headers={"Set-Cookie": f"{SESSION_COOKIE}={session.id}; Path=/; HttpOnly"})
+
+
+@api("GET", r"/users/me")
+def api_me(request, store):
+    if request.session.user is None:
+        return _json(401, {"error": "Not authenticated"})
+    return _json(200, store.public_user(request.session.user))
+
+
+@api("GET", r"/products")
+def api_products(request, store):
+    return _json(200, store.search(request.query.get("q", ""), request.query.get("sort")))
+
+
+@api("GET", r"/products/([^/]+)")
+def api_product(request, store, product_id):
+    product = store.product(product_id)
+    if product is None:
+        return _json(404, {"error": f"Product {product_id} not found"})
+    return _json(200, product)
+
+
+@api("GET", r"/cart")
+def api_cart(request, store):
+    return _json(200, request.session.cart())
+
+
+@api("DELETE", r"/cart")
+def api_clear_cart(request, store):
+    request.session.clear()
+    return Response(204, content_type="application/json")
+
+
+@api("POST", r"/cart/items")
+def api_add_item(request, store):
+    body = request.json_body()
+    if not body or "productId" not in body:
+        return _json(400, {"error": "productId is required"})
+    product = store.product(body["productId"])
+    if product is None:
+        return _json(404, {"error": f"Product {body['productId']} not found"})
+    request.session.add_item(product, max(_int(body.get("quantity"), 1), 1))
+    return _json(201, request.session.cart())
+
+
+@api("PUT", r"/cart/items/([^/]+)")
+def api_update_item(request, store, item_id):
+    body = request.json_body() or {}
+    if not request.session.set_quantity(item_id, _int(body.get("quantity"), 1)):
+        return _json(404, {"error": f"Cart item {item_id} not found"})
+    return _json(200, request.session.cart())
+
+
+@api("DELETE", r"/cart/items/([^/]+)")
+def api_remove_item(request, store, item_id):
+    if not request.session.remove_item(item_id):
+        return _json(404, {"error": f"Cart item {item_id} not found"})
+    return Response(204, content_type="application/json")
+
+
+@api("POST", r"/checkout")
+def api_checkout(request, store):
+    body = request.json_body()
+    if not body or "paymentDetails" not in body:
+        return _json(400, {"error": "paymentDetails is required"})
+    return _json(201, store.place_order(request.session, body["paymentDetails"], body.get("shippingAddress")))
+
+
+def _int(value, default):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+class LocalApp:
+    """The stand-in application on a background thread.
+
+    ``port`` 0 picks a free port, so every test process (xdist worker) can run
+    its own isolated instance. ``latency_ms`` is added to every response, plus
+    up to ``jitter_ms`` derived from the request path, so delays are the same
+    on every run.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency_ms=0, jitter_ms=0, store=None, extra_users=(),
+                 users_path=None):
+        self.store = store or Store(users_path=users_path, extra_users=extra_users)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.stats = {"requests": 0}
+        self.stats_lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), RequestHandler)
+        self._server.daemon_threads = True
+        self._server.app = self
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_url(self):
+        return f"{self.base_url}{API_PREFIX}"
+
+    def delay(self, path):
+        if self.latency_ms or self.jitter_ms:
+            jitter = zlib.crc32(path.encode()) % (self.jitter_ms + 1) if self.jitter_ms else 0
+            time.sleep((self.latency_ms + jitter) / 1000)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="local-app", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
@@ -0,0 +1,196 @@
+"""In-memory state of the local stand-in application: users, sessions, carts and orders."""
+import itertools
+import json
+import os
+import threading
+import uuid
+
+from test_data.catalog import ProductCatalog
+
+_TEST_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'test_data')
+DEFAULT_USERS_PATH = os.path.join(_TEST_DATA_DIR, 'users.json')
+
+TAX_RATE = 0.08
+FREE_SHIPPING_FROM = 50.0
+SHIPPING_FEE = 5.99
+# Promo codes accepted by the cart page, as fractions taken off the subtotal
+PROMO_CODES = {"SAVE10": 0.10, "WELCOME20": 0.20}
+# Example product IDs of the Postman environment and the load test plans, served as catalog products
+PRODUCT_ALIASES = {"prod_123": "1", "prod_12345": "1"}
+
+
+def _money(amount):
+    return round(amount + 1e-9, 2)
+
+
+def _load_users(path):
+    """Users of a JSON file with a ``users`` list or of a JSONL file with one user per line"""
+    with open(path) as f:
+        if path.endswith('.jsonl'):
+            return [json.loads(line) for line in f if line.strip()]
+        return json.load(f)["users"]
+
+
+class Session:
+    """A browser session (cookie) or API token: the logged-in user and the cart.
+
+    ``lock`` guards the cart against concurrent requests of the same client.
+    """
+
+    def __init__(self, session_id):
+        self.id = session_id
+        self.user = None
+        self.items = []
+        self.promo_code = None
+        self.wishlist = []
+        self.last_order = None
+        self._item_ids = itertools.count(1)
+        self.lock = threading.RLock()
+
+    def has_state(self):
+        """Whether there is anything to come back to: a user, a cart, a wishlist or an order"""
+        return bool(self.user or self.items or self.promo_code or self.wishlist or self.last_order)
+
+    def add_item(self, product, quantity):
+        """Add ``quantity`` of ``product``, merging with a line of the same product"""
+        with self.lock:
+            for item in self.items:
+                if item["productId"] == product["id"]:
+                    item["quantity"] += quantity
+                    return item
+            item = {"id": f"item_{next(self._item_ids)}", "productId": product["id"], "name": product["name"],
+                    "price": product["price"], "quantity": quantity}
+            self.items.append(item)
+            return item
+
+    def item(self, item_id):
+        return next((item for item in self.items if item["id"] == item_id), None)
+
+    def set_quantity(self, item_id, quantity):
+        """Change a line's quantity; 0 removes it. Return False for an unknown line"""
+        with self.lock:
+            item = self.item(item_id)
+            if item is None:
+                return False
+            if quantity <= 0:
+                self.items.remove(item)
+            else:
+                item["quantity"] = quantity
+            return True
+
+    def remove_item(self, item_id):
+        return self.set_quantity(item_id, 0)
+
+    def clear(self):
+        with self.lock:
+            self.items = []
+            self.promo_code = None
+
+    def add_to_wishlist(self, product_id):
+        with self.lock:
+            if product_id not in self.wishlist:
+                self.wishlist.append(product_id)
+
+    def totals(self):
+        subtotal = _money(sum(item["price"] * item["quantity"] for item in self.items))
+        discount = _money(subtotal * PROMO_CODES.get(self.promo_code, 0))
+        taxable = subtotal - discount
+        shipping = 0.0 if not self.items or taxable >= FREE_SHIPPING_FROM else SHIPPING_FEE
+        tax = _money(taxable * TAX_RATE)
+        return {"subtotal": subtotal, "discount": discount, "tax": tax, "shipping": shipping,
+                "total": _money(taxable + tax + shipping)}
+
+    def cart(self):
+        """The cart as returned by the REST API"""
+        with self.lock:
+            return {"cartId": self.id, "items": [dict(item) for item in self.items], "promoCode": self.promo_code,
+                    **self.totals()}
+
+
+class Store:
+    """Products (from the test data catalog), users and per-session state, safe to share between threads"""
+
+    def __init__(self, catalog=None, users_path=None, extra_users=()):
+        self.catalog = catalog or ProductCatalog()
+        # Indexed now rather than by whichever request comes first: requests read the catalog concurrently
+        len(self.catalog)
+        users = _load_users(users_path or os.getenv('USERS_DATA_PATH') or DEFAULT_USERS_PATH)
+        self._users = {user["username"].lower(): user for user in users}
+        for index, credentials in enumerate(extra_users, start=1):
+            username = credentials["username"]
+            self._users.setdefault(username.lower(), {
+                "id": f"config-{index}", "username": username, "password": credentials["password"],
+                "first_name": username.split("@")[0].title(), "last_name": "", "role": "customer",
+            })
+        self._sessions = {}
+        self._orders = itertools.count(1)
+        self.lock = threading.RLock()
+
+    def session(self, session_id=None):
+        """Return (session, created); unknown ids (e.g. load test tokens) get a fresh anonymous session.
+
+        A created session is not kept until it is handed to :meth:`keep`, so
+        visitors that never log in or fill a cart take no memory.
+        """
+        with self.lock:
+            session = self._sessions.get(session_id) if session_id else None
+        if session is not None:
+            return session, False
+        return Session(session_id or uuid.uuid4().hex), True
+
+    def keep(self, session):
+        """Remember a created ``session`` once it has state; return the session kept under its id"""
+        if not session.has_state():
+            return session
+        with self.lock:
+            return self._sessions.setdefault(session.id, session)
+
+    def authenticate(self, email, password):
+        user = self._users.get((email or "").strip().lower())
+        if user is not None and user["password"] == password:
+            return user
+        return None
+
+    def product(self, product_id):
+        """Product with the given ID (or example ID from ``PRODUCT_ALIASES``), or None"""
+        product_id = str(product_id)
+        if product_id not in PRODUCT_ALIASES:
+            return self.catalog.by_id(product_id)
+        product = self.catalog.by_id(PRODUCT_ALIASES[product_id])
+        return None if product is None else {**product, "id": product_id}
+
+    def search(self, query, sort=None):
+        """Products whose name, description or category contain ``query`` (all products for an empty query)"""
+        words = (query or "").casefold().split()
+        results = [product for product in self.catalog
+                   if all(word in f"{product['name']} {product.get('description', '')} "
+                                  f"{product.get('category', '')}".casefold() for word in words)]
+        if sort == "price-asc":
+            results.sort(key=lambda product: product["price"])
+        elif sort == "price-desc":
+            results.sort(key=lambda product: product["price"], reverse=True)
+        elif sort == "name":
+            results.sort(key=lambda product: product["name"])
+        return results
+
+    def related(self, product, limit=4):
+        category = product.get("category")
+        others = self.catalog.in_category(category) if category else []
+        product_id = PRODUCT_ALIASES.get(product["id"], product["id"])
+        return [other for other in others if other["id"] != product_id][:limit]
+
+    def place_order(self, session, payment, shipping_address):
+        with self.lock:
+            order_id = f"order_{next(self._orders)}"
+        with session.lock:
+            order = {"orderId": order_id, "status": "confirmed",
+                     "items": [dict(item) for item in session.items], **session.totals(),
+                     "paymentMethod": (payment or {}).get("method", "credit_card"),
+                     "shippingAddress": shipping_address}
+            session.clear()
+            session.last_order = order
+            return order
+
+    @staticmethod
+    def public_user(user):
+        return {**{key: value for key, value in user.items() if key != "password"}, "email": user["username"]}
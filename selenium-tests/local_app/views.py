@@ -0,0 +1,248 @@
+"""HTML pages of the local stand-in application.
+
+Markup carries exactly the ids and classes the page objects in ``pages/``
+locate, and every interaction is a plain link or form post, so pages work
+without any client-side framework.
+"""
+from html import escape
+from urllib.parse import quote
+
+# A tiny inline image, so product pages need no extra requests
+_PLACEHOLDER_IMAGE = ("data:image/svg+xml;utf8," + quote(
+    '<svg xmlns="http://www.w3.org/2000/svg" width="240" height="240">'
+    '<rect width="240" height="240" fill="#e5e7eb"/></svg>'))
+
+_STYLE = """
+body { font-family: sans-serif; margin: 0; }
+header, main { padding: 12px 24px; }
+header { background: #1f2937; color: #fff; display: flex; gap: 16px; align-items: center; }
+header a { color: #fff; }
+.product-list, .related-products { display: flex; flex-wrap: wrap; gap: 12px; }
+.product-item { border: 1px solid #ddd; padding: 8px; width: 200px; }
+.alert-danger, .promo-error { color: #b91c1c; }
+.alert-success, .promo-success { color: #15803d; }
+.size-option.selected, .color-option.selected { outline: 2px solid #1f2937; }
+"""
+
+# Sort dropdown of the search results page: value -> visible text
+SORT_OPTIONS = {"relevance": "Relevance", "price-asc": "Price: Low to High",
+                "price-desc": "Price: High to Low", "name": "Name"}
+
+
+def _price(amount):
+    return f"${amount:,.2f}"
+
+
+def layout(title, body, session, search=True, query=""):
+    """Page shell: header with navigation, and the site search unless ``search`` is False.
+
+    The login page leaves the search out so that its submit button is the only one on the page.
+    """
+    count = sum(item["quantity"] for item in session.items)
+    account = ('<a href="/account">My Account</a> <a href="/logout">Logout</a>' if session.user
+               else '<a href="/login">Login</a>')
+    search_form = (f'<form action="/search" method="get" role="search">'
+                   f'<input id="search-input" name="q" type="search" placeholder="Search products" '
+                   f'value="{escape(query)}">'
+                   f'<button type="submit" aria-label="Search products">Search</button></form>') if search else ""
+    return f"""<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>{escape(title)} | QA Lab Store</title>
+<style>{_STYLE}</style></head>
+<body>
+<header><a href="/" class="logo">QA Lab Store</a>{search_form}
+<nav><a href="/cart" class="cart-link">Cart (<span class="cart-count">{count}</span>)</a> {account}</nav></header>
+<main>
+{body}
+</main>
+</body></html>
+"""
+
+
+def product_card(product):
+    return (f'<div class="product-item" data-product-id="{escape(product["id"])}">'
+            f'<a href="/product/{quote(product["id"])}"><span class="product-name">{escape(product["name"])}</span></a>'
+            f'<span class="product-price">{_price(product["price"])}</span></div>')
+
+
+def home(session, products):
+    cards = "\n".join(product_card(product) for product in products)
+    return layout("Home", f'<h1>Featured products</h1>\n<div class="product-list">\n{cards}\n</div>', session)
+
+
+def search_results(session, query, sort, results):
+    options = "".join(f'<option value="{value}"{" selected" if value == sort else ""}>{text}</option>'
+                      for value, text in SORT_OPTIONS.items())
+    if results:
+        listing = '<div class="product-list">\n' + "\n".join(product_card(p) for p in results) + "\n</div>"
+    else:
+        listing = f'<p id="no-results-message">No products found for "{escape(query)}"</p>'
+    body = f"""<div id="search-results-container">
+<h1>Search results for "{escape(query)}"</h1>
+<form action="/search" method="get" class="search-tools">
+<input type="hidden" name="q" value="{escape(query)}">
+<select id="sort-options" name="sort" onchange="this.form.submit()">{options}</select>
+<button type="button" class="category-filter">Category</button>
+</form>
+{listing}
+</div>"""
+    return layout(f"Search: {query}", body, session, query=query)
+
+
+def product_detail(session, product, related, added=None, wishlisted=False):
+    product_id = escape(product["id"])
+    sizes = "".join(f'<button type="button" class="size-option">{escape(size)}</button>'
+                    for size in product.get("sizes", []))
+    colors = "".join(f'<button type="button" class="color-option" title="{escape(color)}">{escape(color)}</button>'
+                     for color in product.get("colors", []))
+    messages = ""
+    if added:
+        messages += (f'<div class="alert alert-success cart-success">{escape(product["name"])} '
+                     f'(x{escape(added)}) was added to your cart</div>')
+    if wishlisted:
+        messages += (f'<div class="alert alert-success wishlist-success-message">{escape(product["name"])} '
+                     f'was added to your wishlist</div>')
+    related_cards = "\n".join(product_card(other) for other in related)
+    body = f"""<div class="product-detail" data-product-id="{product_id}">
+<div class="product-image"><img src="{_PLACEHOLDER_IMAGE}" alt="{escape(product["name"])}"></div>
+<div class="product-title"><h1>{escape(product["name"])}</h1></div>
+<div class="product-price">{_price(product["price"])}</div>
+<div class="product-rating" data-rating="{product.get("rating", "")}">Rating: {product.get("rating", "n/a")} / 5</div>
+<div class="product-description" id="description">{escape(product.get("description", ""))}</div>
+<div class="size-options">{sizes}</div>
+<div class="color-options">{colors}</div>
+<form method="post" action="/cart/add" class="add-to-cart-form">
+<input type="hidden" name="product_id" value="{product_id}">
+<label for="quantity">Quantity</label> <input id="quantity" name="quantity" type="number" min="1" value="1">
+<button type="submit" class="add-to-cart-btn">Add to Cart</button>
+</form>
+<form method="post" action="/wishlist/add" class="wishlist-form">
+<input type="hidden" name="product_id" value="{product_id}">
+<button type="submit" class="add-to-wishlist-btn">Add to Wishlist</button>
+</form>
+{messages}
+<ul class="product-tabs"><li><a href="#description">Description</a></li><li><a href="#reviews">Reviews</a></li></ul>
+<div id="reviews">No reviews yet.</div>
+</div>
+<h2>Related products</h2>
+<div class="related-products">
+{related_cards}
+</div>
+<script>
+document.querySelectorAll('.size-option, .color-option').forEach(function (option) {{
+    option.addEventListener('click', function () {{
+        option.parentNode.querySelectorAll('.selected').forEach(function (o) {{ o.classList.remove('selected'); }});
+        option.classList.add('selected');
+    }});
+}});
+</script>"""
+    return layout(product["name"], body, session)
+
+
+def cart(session, promo_message=None, promo_ok=False):
+    if not session.items:
+        body = ('<h1>Shopping Cart</h1>\n<p class="empty-cart-message">Your shopping cart is empty.</p>\n'
+                '<a href="/" class="continue-shopping-btn">Continue Shopping</a>')
+        return layout("Shopping Cart", body, session)
+    rows = "\n".join(
+        f'<tr class="cart-item" data-item-id="{escape(item["id"])}">'
+        f'<td class="cart-item-name">{escape(item["name"])}</td>'
+        f'<td class="cart-item-price">{_price(item["price"])}</td>'
+        f'<td class="cart-item-quantity"><input type="number" min="0" name="quantity-{escape(item["id"])}" '
+        f'value="{item["quantity"]}"></td>'
+        f'<td class="cart-item-total">{_price(item["price"] * item["quantity"])}</td>'
+        f'<td><button type="submit" class="cart-item-remove" formaction="/cart/remove/{quote(item["id"])}">'
+        f'Remove</button></td></tr>'
+        for item in session.items)
+    totals = session.totals()
+    promo = ""
+    if promo_message:
+        promo = f'<div class="{"promo-success" if promo_ok else "promo-error"}">{escape(promo_message)}</div>'
+    body = f"""<h1>Shopping Cart</h1>
+<form method="post" action="/cart/update" class="cart-form">
+<table class="cart-table">
+<tr><th>Product</th><th>Price</th><th>Quantity</th><th>Total</th><th></th></tr>
+{rows}
+</table>
+<button type="submit" class="update-cart-btn">Update Cart</button>
+</form>
+<form method="post" action="/cart/promo" class="promo-form">
+<input id="promo-code" name="code" placeholder="Promo code"> <button type="submit" class="apply-promo-btn">Apply</button>
+</form>
+{promo}
+<div class="cart-summary">
+<div class="cart-subtotal">Subtotal: <span class="amount">{_price(totals["subtotal"])}</span></div>
+<div class="cart-discount">Discount: <span class="amount">{_price(totals["discount"])}</span></div>
+<div class="cart-tax">Tax: <span class="amount">{_price(totals["tax"])}</span></div>
+<div class="cart-shipping">Shipping: <span class="amount">{_price(totals["shipping"])}</span></div>
+<div class="cart-total">Total: <span class="amount">{_price(totals["total"])}</span></div>
+</div>
+<a href="/" class="continue-shopping-btn">Continue Shopping</a>
+<a href="/checkout" class="checkout-btn">Proceed to Checkout</a>"""
+    return layout("Shopping Cart", body, session)
+
+
+def checkout(session):
+    totals = session.totals()
+    body = f"""<h1>Checkout</h1>
+<p class="checkout-total">Order total: <span class="amount">{_price(totals["total"])}</span></p>
+<form method="post" action="/checkout" class="checkout-form">
+<input id="card-number" name="card_number" value="4242424242424242">
+<input id="card-expiry" name="card_expiry" value="12/25">
+<input id="card-cvv" name="card_cvv" value="123">
+<input id="street" name="street" value="123 Test St">
+<input id="city" name="city" value="Testville">
+<input id="zip-code" name="zip_code" value="12345">
+<button type="submit" class="place-order-btn">Place Order</button>
+</form>"""
+    return layout("Checkout", body, session)
+
+
+def order_confirmation(session, order):
+    body = (f'<h1>Thank you for your order</h1>\n<p class="order-confirmation">Order '
+            f'<span class="order-id">{escape(order["orderId"])}</span> is {escape(order["status"])}. '
+            f'Total: <span class="amount">{_price(order["total"])}</span></p>')
+    return layout("Order confirmed", body, session)
+
+
+def login(session, email="", error=None):
+    alert = f'<div class="alert alert-danger">{escape(error)}</div>' if error else ""
+    body = f"""<h1>Login</h1>
+{alert}
+<form method="post" action="/login" class="login-form">
+<label for="email">Email</label> <input id="email" name="email" type="email" value="{escape(email)}">
+<label for="password">Password</label> <input id="password" name="password" type="password">
+<button type="submit">Login</button>
+</form>
+<a href="/forgot-password">Forgot Password?</a> <a href="/register">Register</a>"""
+    return layout("Login", body, session, search=False)
+
+
+def account(session, token_key):
+    user = session.user
+    body = f"""<h1>My Account</h1>
+<p class="welcome-message">Welcome, {escape(user.get("first_name") or user["username"])}</p>
+<script>window.localStorage.setItem({token_key!r}, {session.id!r});</script>"""
+    return layout("My Account", body, session)
+
+
+def forgot_password(session, sent=False):
+    message = '<div class="alert alert-success">If the address is registered, a reset link was sent.</div>'
+    body = f"""<h1>Forgot Password</h1>
+{message if sent else ""}
+<form method="post" action="/forgot-password"><input id="reset-email" name="email" type="email">
+<button type="submit" class="reset-password-btn">Send reset link</button></form>"""
+    return layout("Forgot Password", body, session)
+
+
+def register(session):
+    body = """<h1>Register</h1>
+<form method="post" action="/register" class="register-form">
+<input id="first-name" name="first_name"> <input id="last-name" name="last_name">
+<input id="register-email" name="email" type="email"> <input id="register-password" name="password" type="password">
+<button type="button" class="register-btn">Create Account</button>
+</form>"""
+    return layout("Register", body, session)
+
+
+def not_found(session, path):
+    return layout("Not Found", f'<h1>Page not found</h1><p class="not-found">{escape(path)}</p>', session)
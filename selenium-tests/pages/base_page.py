@@ -1,223 +1,345 @@
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support.ui import WebDriverWait, Select
-from selenium.webdriver.support import expected_conditions as EC
+import uuid
+from typing import TYPE_CHECKING
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.common.by import By # Added for search locators
-from selenium.webdriver.common.keys import Keys # Added for search submit
-import allure
+from utils import command_profiler, instrumentation
+from utils.lazy_import import LazyModule
+from utils.step_retry import retryable, will_retry
+from utils.wait_engine import WaitEngine
+from pages import scripts
+from pages.locators import By, declared_locators # Added for search locators
 
-class BasePage:
-    # Default timeout for explicit waits
-    TIMEOUT = 10
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+# Importing selenium.webdriver and allure is deferred until a page object actually uses them
+EC = LazyModule("selenium.webdriver.support.expected_conditions")
+_support_ui = LazyModule("selenium.webdriver.support.ui")
+_action_chains = LazyModule("selenium.webdriver.common.action_chains")
+_keys = LazyModule("selenium.webdriver.common.keys")
+allure = LazyModule("allure")
 
+class BasePage:
     # Common locators (e.g., for header elements like search bar)
     _search_input = (By.ID, "search-input")  # Example ID, adjust as needed
     _search_submit_button = (By.XPATH, "//button[@type='submit' and contains(@aria-label, 'Search')]") # Example XPath
 
-    def __init__(self, driver: WebDriver, config):
+    def __init__(self, driver: "WebDriver", config):
         self.driver = driver
         self.config = config
         self.base_url = config.base_url
-        # Use the default TIMEOUT for explicit waits, or could use config.implicit_wait
-        self.timeout = self.TIMEOUT
+        self.timeout = config.wait_timeout
+        # Single wait subsystem for all page objects; implicit waits are disabled on the driver
+        self.wait = WaitEngine(
+            driver,
+            timeout=self.timeout,
+            poll_interval=config.wait_poll_interval,
+            backoff=config.wait_poll_backoff,
+            max_poll_interval=config.wait_max_poll_interval,
+            ledger=getattr(driver, "wait_ledger", None),
+            backend=config.wait_backend,
+            script_timeout=config.script_timeout,
+        )
+
+    @instrumentation.step("Navigate to URL: {url}")
+    def navigate_to_url(self, url: str, reload: bool = False):
+        """Navigates the browser to the specified URL.
 
-    @allure.step("Navigate to URL: {url}")
-    def navigate_to_url(self, url: str):
-        """Navigates the browser to the specified URL."""
+        The load is skipped when the browser still shows the document it last
+        loaded for ``url``: same location, same page-state token on its window
+        and no navigation, click, typing or cookie change since (see
+        ``utils.command_profiler``), nor a cart change through ``CartApi``.
+        Pass ``reload=True`` after changing what the page shows by other means.
+        """
         try:
+            if not reload and self._is_current_document(url):
+                instrumentation.detail("NavigationSkipped", f"Already on {url} and the page state is unchanged")
+                return
+            self._page_changed()
             self.driver.get(url)
-            allure.attach(self.driver.current_url, name="Current URL after navigation", attachment_type=allure.attachment_type.URI_LIST)
+            page_metrics = getattr(self.driver, "page_metrics", None)
+            if page_metrics is not None:
+                page_metrics.record(self.driver)
+            instrumentation.detail("CurrentURL", self._stamp_document(url))
         except Exception as e:
-            allure.attach(f"Error navigating to {url}: {str(e)}", name="NavigationError", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("NavigationError", f"Error navigating to {url}: {str(e)}")
             raise
             
-    @allure.step("Navigate to path: {path}")
-    def navigate_to(self, path: str):
+    @instrumentation.step("Navigate to path: {path}")
+    def navigate_to(self, path: str, reload: bool = False):
         """Navigates to a path using the base_url. If path is a full URL, it will be used as is."""
         if path.startswith('http'):
-            self.navigate_to_url(path)
+            self.navigate_to_url(path, reload=reload)
         else:
-            self.navigate_to_url(f"{self.base_url}{path}")
+            self.navigate_to_url(f"{self.base_url}{path}", reload=reload)
         return self
 
-    @allure.step("Find element with locator: {locator}")
+    def _is_current_document(self, url):
+        state = getattr(self.driver, "page_state", None)
+        if state is None or state[0] != url:
+            return False
+        try:
+            return self.driver.execute_script(scripts.PAGE_STATE, None) == [state[1], state[2]]
+        except Exception:
+            return False
+
+    def _stamp_document(self, url):
+        """Mark the freshly loaded document with a new page-state token; returns its location"""
+        token = uuid.uuid4().hex
+        try:
+            location, _ = self.driver.execute_script(scripts.PAGE_STATE, token)
+        except Exception:
+            return self.driver.current_url
+        self.driver.page_state = (url, location, token)
+        return location
+
+    def _page_changed(self):
+        """Forget the page state and snapshot: the next navigation reloads, reads go to the browser"""
+        command_profiler.page_changed(self.driver)
+
+    def _snapshot_entry(self, locator):
+        snapshot = getattr(self.driver, "page_snapshot", None)
+        return snapshot.get(locator) if snapshot and isinstance(locator, tuple) else None
+
+    @instrumentation.step("Snapshot locators of {self.__class__.__name__}")
+    def snapshot(self, *names: str):
+        """Reads the text and attributes of the page's declared locators in one round trip.
+
+        ``get_element_text`` and ``get_element_attribute`` are then served from
+        the snapshot until the next navigation, click, text entry or selection. ``names`` limits it to some locator
+        attributes, e.g. ``snapshot("PRODUCT_TITLE", "PRODUCT_PRICE")``; locators
+        without a match are read from the browser as usual.
+        """
+        locators = declared_locators(type(self))
+        if names:
+            locators = {name: locators[name] for name in names}
+        entries = self.driver.execute_script(scripts.SNAPSHOT, [[name, by, value] for name, (by, value) in locators.items()])
+        self.driver.page_snapshot = {locators[name]: entry for name, entry in (entries or {}).items() if entry}
+        instrumentation.detail("Snapshot", f"{len(self.driver.page_snapshot)} of {len(locators)} locators matched")
+        return self
+
+    @instrumentation.step("Find element with locator: {locator}")
     def find_element(self, locator: tuple, timeout: int = None):
         """Finds and returns a web element, waiting until it's present."""
         wait_timeout = timeout if timeout is not None else self.timeout
         try:
-            return WebDriverWait(self.driver, wait_timeout).until(
-                EC.presence_of_element_located(locator)
-            )
+            return self.wait.until_located("present", locator, wait_timeout, label=f"presence of {locator}")
         except TimeoutException:
-            allure.attach(f"Element with locator {locator} not found within {wait_timeout}s.", name="ElementNotFoundError", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("ElementNotFoundError", f"Element with locator {locator} not found within {wait_timeout}s.")
             self.capture_screenshot(f"element_not_found_{locator[0]}_{locator[1]}".replace(' ','_'))
             raise NoSuchElementException(f"Element with locator {locator} not found within {wait_timeout}s.")
 
-    @allure.step("Find multiple elements with locator: {locator}")
+    @instrumentation.step("Find multiple elements with locator: {locator}")
     def find_elements(self, locator: tuple, timeout: int = None):
-        """Finds and returns a list of web elements, waiting until they are present."""
+        """Finds and returns a list of web elements, waiting until they are present.
+
+        Pass ``timeout=0`` once the page is known to be settled (see ``wait_for_any``)
+        to read the current matches, possibly none, in a single round trip.
+        """
         wait_timeout = timeout if timeout is not None else self.timeout
         try:
-            return WebDriverWait(self.driver, wait_timeout).until(
-                EC.presence_of_all_elements_located(locator)
-            )
+            return self.wait.until_located("all_present", locator, wait_timeout, label=f"presence of all {locator}")
         except TimeoutException:
-            allure.attach(f"Elements with locator {locator} not found within {wait_timeout}s.", name="ElementsNotFoundError", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("ElementsNotFoundError", f"Elements with locator {locator} not found within {wait_timeout}s.")
             return [] # Return empty list if no elements found
 
-    @allure.step("Click element with locator: {locator}")
+    @retryable
+    @instrumentation.step("Click element with locator: {locator}")
     def click_element(self, locator: tuple, timeout: int = None):
         """Waits for an element to be clickable and then clicks it."""
         wait_timeout = timeout if timeout is not None else self.timeout
+        self._page_changed()
         try:
-            element = WebDriverWait(self.driver, wait_timeout).until(
-                EC.element_to_be_clickable(locator)
-            )
+            element = self.wait.until_located("clickable", locator, wait_timeout, label=f"clickability of {locator}")
             element.click()
-            allure.attach(f"Clicked element with locator: {locator}", name="ElementClicked", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("ElementClicked", f"Clicked element with locator: {locator}")
         except ElementClickInterceptedException:
-            allure.attach(f"Element click intercepted for locator {locator}. Trying JavaScript click.", name="ClickIntercepted", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("ClickIntercepted", f"Element click intercepted for locator {locator}. Trying JavaScript click.")
             element = self.find_element(locator, timeout=wait_timeout) 
             self.js_click(element)
         except TimeoutException:
-            allure.attach(f"Element with locator {locator} not clickable within {wait_timeout}s.", name="ElementNotClickableError", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("ElementNotClickableError", f"Element with locator {locator} not clickable within {wait_timeout}s.")
             self.capture_screenshot(f"element_not_clickable_{locator[0]}_{locator[1]}".replace(' ','_'))
             raise
 
-    @allure.step("Enter text '{text}' into element with locator: {locator}")
+    @retryable
+    @instrumentation.step("Enter text '{text}' into element with locator: {locator}")
     def enter_text(self, locator: tuple, text: str, timeout: int = None):
         """Finds an element, clears it, and then types text into it."""
+        self._page_changed()
         try:
             element = self.find_element(locator, timeout=timeout)
             element.clear()
             element.send_keys(text)
-            allure.attach(f"Entered text '{text}' into element {locator}", name="TextEntered", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("TextEntered", f"Entered text '{text}' into element {locator}")
         except Exception as e:
-            allure.attach(f"Error entering text into {locator}: {str(e)}", name="EnterTextError", attachment_type=allure.attachment_type.TEXT)
-            self.capture_screenshot(f"enter_text_error_{locator[0]}_{locator[1]}".replace(' ','_'))
+            instrumentation.detail("EnterTextError", f"Error entering text into {locator}: {str(e)}")
+            # Only the attempt that gives up gets a failure screenshot
+            if not will_retry(self.driver, e):
+                self.capture_screenshot(f"enter_text_error_{locator[0]}_{locator[1]}".replace(' ','_'))
             raise
 
-    @allure.step("Get text from element: {locator_or_element}")
+    @instrumentation.step("Get text from element: {locator_or_element}")
     def get_element_text(self, locator_or_element, timeout: int = None):
-        """Retrieves the text content of an element."""
+        """Retrieves the text content of an element (from the page snapshot, if it has the locator)."""
+        entry = self._snapshot_entry(locator_or_element)
+        if entry is not None:
+            instrumentation.detail("GetText", f"Snapshot text '{entry['text']}' of element {locator_or_element}")
+            return entry["text"]
         try:
             if isinstance(locator_or_element, tuple): 
                 element = self.find_element(locator_or_element, timeout=timeout)
             else: 
                 element = locator_or_element
             text = element.text
-            allure.attach(f"Retrieved text '{text}' from element {locator_or_element}", name="GetText", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("GetText", f"Retrieved text '{text}' from element {locator_or_element}")
             return text
         except Exception as e:
-            allure.attach(f"Error getting text from {locator_or_element}: {str(e)}", name="GetTextError", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("GetTextError", f"Error getting text from {locator_or_element}: {str(e)}")
             raise
 
-    @allure.step("Check if element with locator {locator} is visible")
+    @instrumentation.step("Get attribute '{name}' of element: {locator}")
+    def get_element_attribute(self, locator: tuple, name: str, timeout: int = None):
+        """Retrieves an attribute (or property) of an element, from the page snapshot if it has the locator."""
+        entry = self._snapshot_entry(locator)
+        if entry is not None:
+            return entry["attributes"].get(name)
+        return self.find_element(locator, timeout=timeout).get_attribute(name)
+
+    @instrumentation.step("Check if element with locator {locator} is visible")
     def is_element_visible(self, locator: tuple, timeout: int = None):
         """Checks if an element is visible on the page."""
         wait_timeout = timeout if timeout is not None else self.timeout
         try:
-            WebDriverWait(self.driver, wait_timeout).until(
-                EC.visibility_of_element_located(locator)
-            )
+            self.wait.until_located("visible", locator, wait_timeout, label=f"visibility of {locator}")
             return True
         except TimeoutException:
             return False
 
-    @allure.step("Check if element with locator {locator} is present")
+    @instrumentation.step("Check if element with locator {locator} is present")
     def is_element_present(self, locator: tuple, timeout: int = None):
         """Checks if an element is present in the DOM (may not be visible)."""
         wait_timeout = timeout if timeout is not None else self.timeout
         try:
-            WebDriverWait(self.driver, wait_timeout).until(
-                EC.presence_of_element_located(locator)
-            )
+            self.wait.until_located("present", locator, wait_timeout, label=f"presence of {locator}")
             return True
         except TimeoutException:
             return False
 
-    @allure.step("Wait for element with locator {locator} to disappear")
+    @instrumentation.step("Check if element with locator {locator} is absent")
+    def is_element_absent(self, locator: tuple, timeout: int = 0):
+        """Checks that no matching element is displayed; fast path for negative checks.
+
+        An element that is already absent costs a single lookup. With a timeout,
+        a displayed element is given that long to go away.
+        """
+        return self.wait.until_absent(locator, timeout=timeout)
+
+    @instrumentation.step("Wait for any of the locators: {locators}")
+    def wait_for_any(self, *locators, timeout: int = None):
+        """Waits until one of several alternative page states is present.
+
+        Returns the index of the first locator that matched, or None if none
+        did within the timeout.
+        """
+        try:
+            return self.wait.first_present(locators, timeout=timeout)
+        except TimeoutException:
+            return None
+
+    @instrumentation.step("Wait for element with locator {locator} to disappear")
     def wait_for_element_to_disappear(self, locator: tuple, timeout: int = None):
         """Waits for an element to become invisible or not present."""
         wait_timeout = timeout if timeout is not None else self.timeout
         try:
-            WebDriverWait(self.driver, wait_timeout).until(
-                EC.invisibility_of_element_located(locator)
-            )
+            self.wait.until_located("invisible", locator, wait_timeout, label=f"invisibility of {locator}")
             return True
         except TimeoutException:
             return False 
 
-    @allure.step("Get current URL")
+    @instrumentation.step("Get current URL")
     def get_current_url(self):
         """Returns the current URL of the browser."""
         return self.driver.current_url
 
-    @allure.step("Get page title")
+    @instrumentation.step("Get page title")
     def get_page_title(self):
         """Returns the title of the current page."""
         return self.driver.title
 
-    @allure.step("Accept alert")
+    @instrumentation.step("Accept alert")
     def accept_alert(self, timeout: int = None):
         """Waits for an alert and accepts it."""
         wait_timeout = timeout if timeout is not None else self.timeout
         try:
-            WebDriverWait(self.driver, wait_timeout).until(EC.alert_is_present())
+            self.wait.until(EC.alert_is_present(), wait_timeout, label="alert")
             alert = self.driver.switch_to.alert
             alert_text = alert.text
             alert.accept()
-            allure.attach(f"Accepted alert with text: {alert_text}", name="AlertAccepted", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("AlertAccepted", f"Accepted alert with text: {alert_text}")
             return alert_text
         except TimeoutException:
-            allure.attach("No alert present to accept.", name="AlertError", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("AlertError", "No alert present to accept.")
             raise
 
-    @allure.step("Dismiss alert")
+    @instrumentation.step("Dismiss alert")
     def dismiss_alert(self, timeout: int = None):
         """Waits for an alert and dismisses it."""
         wait_timeout = timeout if timeout is not None else self.timeout
         try:
-            WebDriverWait(self.driver, wait_timeout).until(EC.alert_is_present())
+            self.wait.until(EC.alert_is_present(), wait_timeout, label="alert")
             alert = self.driver.switch_to.alert
             alert_text = alert.text
             alert.dismiss()
-            allure.attach(f"Dismissed alert with text: {alert_text}", name="AlertDismissed", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("AlertDismissed", f"Dismissed alert with text: {alert_text}")
             return alert_text
         except TimeoutException:
-            allure.attach("No alert present to dismiss.", name="AlertError", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("AlertError", "No alert present to dismiss.")
             raise
 
-    @allure.step("Switch to iframe with locator: {locator}")
+    @instrumentation.step("Switch to iframe with locator: {locator}")
     def switch_to_iframe(self, locator: tuple, timeout: int = None):
         """Switches focus to an iframe."""
         wait_timeout = timeout if timeout is not None else self.timeout
         try:
-            WebDriverWait(self.driver, wait_timeout).until(
-                EC.frame_to_be_available_and_switch_to_it(locator)
-            )
-            allure.attach(f"Switched to iframe: {locator}", name="IframeSwitch", attachment_type=allure.attachment_type.TEXT)
+            self.wait.until(EC.frame_to_be_available_and_switch_to_it(locator), wait_timeout, label=f"frame {locator}")
+            instrumentation.detail("IframeSwitch", f"Switched to iframe: {locator}")
         except TimeoutException:
-            allure.attach(f"Iframe with locator {locator} not found.", name="IframeError", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("IframeError", f"Iframe with locator {locator} not found.")
             raise
 
-    @allure.step("Switch back to default content from iframe")
+    @instrumentation.step("Switch back to default content from iframe")
     def switch_to_default_content(self):
         """Switches focus back to the main document from an iframe."""
         self.driver.switch_to.default_content()
-        allure.attach("Switched back to default content.", name="IframeSwitchBack", attachment_type=allure.attachment_type.TEXT)
+        instrumentation.detail("IframeSwitchBack", "Switched back to default content.")
 
-    @allure.step("Execute JavaScript: {script}")
+    @instrumentation.step("Execute JavaScript: {script}")
     def execute_script(self, script: str, *args):
         """Executes JavaScript in the current window/frame."""
         try:
             return self.driver.execute_script(script, *args)
         except Exception as e:
-            allure.attach(f"Error executing JavaScript: {script}, Error: {str(e)}", name="JavaScriptError", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("JavaScriptError", f"Error executing JavaScript: {script}, Error: {str(e)}")
             raise
 
-    @allure.step("Scroll to element: {element_or_locator}")
+    @instrumentation.step("Extract items matching {container_locator}")
+    def extract_items(self, container_locator: tuple, fields: dict, include_elements: bool = False):
+        """Extracts structured data from every element matching a locator in one round trip.
+
+        ``fields`` maps a result key to a CSS selector relative to the item, whose
+        trimmed text is returned, or to a ``(css_selector, attribute)`` tuple. A
+        selector of None targets the item itself. Missing fields are None. With
+        ``include_elements`` each dict also holds the item's WebElement under
+        ``"element"``.
+        """
+        spec = {}
+        for name, field in fields.items():
+            selector, attribute = field if isinstance(field, tuple) else (field, None)
+            spec[name] = [selector, attribute]
+        by, value = container_locator
+        return self.execute_script(scripts.EXTRACT_ITEMS, by, value, spec, include_elements) or []
+
+    @instrumentation.step("Scroll to element: {element_or_locator}")
     def scroll_to_element(self, element_or_locator):
         """Scrolls the page to bring the specified element into view."""
         try:
@@ -226,83 +348,93 @@ class BasePage:
             else:
                 element = element_or_locator
             self.execute_script("arguments[0].scrollIntoView(true);", element)
-            allure.attach(f"Scrolled to element: {element_or_locator}", name="ScrollToElement", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("ScrollToElement", f"Scrolled to element: {element_or_locator}")
         except Exception as e:
-            allure.attach(f"Error scrolling to element {element_or_locator}: {str(e)}", name="ScrollError", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("ScrollError", f"Error scrolling to element {element_or_locator}: {str(e)}")
             raise
 
-    @allure.step("Perform JavaScript click on element: {element_or_locator}")
+    @instrumentation.step("Perform JavaScript click on element: {element_or_locator}")
     def js_click(self, element_or_locator):
         """Performs a click using JavaScript, useful for intercepted elements."""
+        self._page_changed()
         try:
             if isinstance(element_or_locator, tuple):
                 element = self.find_element(element_or_locator)
             else:
                 element = element_or_locator
             self.execute_script("arguments[0].click();", element)
-            allure.attach(f"JavaScript click on element: {element_or_locator}", name="JSClick", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("JSClick", f"JavaScript click on element: {element_or_locator}")
         except Exception as e:
-            allure.attach(f"Error performing JavaScript click on {element_or_locator}: {str(e)}", name="JSClickError", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("JSClickError", f"Error performing JavaScript click on {element_or_locator}: {str(e)}")
             raise
 
-    @allure.step("Select dropdown option by visible text: '{text}' from locator: {locator}")
+    @retryable
+    @instrumentation.step("Select dropdown option by visible text: '{text}' from locator: {locator}")
     def select_dropdown_option_by_visible_text(self, locator: tuple, text: str, timeout: int = None):
         """Selects an option from a dropdown by its visible text."""
+        self._page_changed()
         try:
             select_element = self.find_element(locator, timeout=timeout)
-            select = Select(select_element)
+            select = _support_ui.Select(select_element)
             select.select_by_visible_text(text)
-            allure.attach(f"Selected '{text}' from dropdown {locator}", name="DropdownSelect", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("DropdownSelect", f"Selected '{text}' from dropdown {locator}")
         except Exception as e:
-            allure.attach(f"Error selecting '{text}' from dropdown {locator}: {str(e)}", name="DropdownError", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("DropdownError", f"Error selecting '{text}' from dropdown {locator}: {str(e)}")
             raise
 
-    @allure.step("Select dropdown option by value: '{value}' from locator: {locator}")
+    @retryable
+    @instrumentation.step("Select dropdown option by value: '{value}' from locator: {locator}")
     def select_dropdown_option_by_value(self, locator: tuple, value: str, timeout: int = None):
         """Selects an option from a dropdown by its value attribute."""
+        self._page_changed()
         try:
             select_element = self.find_element(locator, timeout=timeout)
-            select = Select(select_element)
+            select = _support_ui.Select(select_element)
             select.select_by_value(value)
-            allure.attach(f"Selected option with value '{value}' from dropdown {locator}", name="DropdownSelectByValue", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("DropdownSelectByValue", f"Selected option with value '{value}' from dropdown {locator}")
         except Exception as e:
-            allure.attach(f"Error selecting option with value '{value}' from dropdown {locator}: {str(e)}", name="DropdownError", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("DropdownError", f"Error selecting option with value '{value}' from dropdown {locator}: {str(e)}")
             raise
 
-    @allure.step("Hover over element with locator: {locator}")
+    @instrumentation.step("Hover over element with locator: {locator}")
     def hover_over_element(self, locator: tuple, timeout: int = None):
         """Hovers the mouse cursor over an element."""
         try:
             element = self.find_element(locator, timeout=timeout)
-            ActionChains(self.driver).move_to_element(element).perform()
-            allure.attach(f"Hovered over element {locator}", name="HoverElement", attachment_type=allure.attachment_type.TEXT)
+            _action_chains.ActionChains(self.driver).move_to_element(element).perform()
+            instrumentation.detail("HoverElement", f"Hovered over element {locator}")
         except Exception as e:
-            allure.attach(f"Error hovering over element {locator}: {str(e)}", name="HoverError", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("HoverError", f"Error hovering over element {locator}: {str(e)}")
             raise
 
-    @allure.step("Capture screenshot: {name}")
+    @instrumentation.step("Capture screenshot: {name}")
     def capture_screenshot(self, name: str = "screenshot"):
         """Captures a screenshot and attaches it to the Allure report."""
         try:
             safe_name = "".join([c if c.isalnum() else "_" for c in name])
+            screenshots = getattr(self.driver, "screenshots", None)
+            if screenshots is not None:
+                # Deduplicated and written in the background; repeated timeouts on one page store one file
+                screenshots.capture(self.driver, safe_name)
+                return
             allure.attach(self.driver.get_screenshot_as_png(), 
                           name=safe_name, 
                           attachment_type=allure.attachment_type.PNG)
         except Exception as e:
-            allure.attach(f"Failed to capture screenshot: {str(e)}", name="ScreenshotError", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("ScreenshotError", f"Failed to capture screenshot: {str(e)}")
             print(f"Error capturing screenshot '{name}': {e}")
 
-    @allure.step("Perform search for term: {search_term}")
+    @instrumentation.step("Perform search for term: {search_term}")
     def perform_search(self, search_term: str):
         """Enters text into the search bar and submits the search."""
         from .search_results_page import SearchResultsPage # Local import to avoid circular dependency
         try:
             self.enter_text(self._search_input, search_term)
             search_input_element = self.find_element(self._search_input)
-            search_input_element.send_keys(Keys.RETURN)
-            allure.attach(f"Performed search for: {search_term}", name="SearchPerformed", attachment_type=allure.attachment_type.TEXT)
+            search_input_element.send_keys(_keys.Keys.RETURN)
+            instrumentation.detail("SearchPerformed", f"Performed search for: {search_term}")
             return SearchResultsPage(self.driver, self.config) 
         except Exception as e:
-            allure.attach(f"Error performing search for '{search_term}': {str(e)}", name="SearchError", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("SearchError", f"Error performing search for '{search_term}': {str(e)}")
             self.capture_screenshot(f"search_error_{search_term}".replace(' ','_'))
             raise
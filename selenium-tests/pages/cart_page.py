@@ -1,4 +1,4 @@
-from selenium.webdriver.common.by import By
+from pages.locators import By
 from pages.base_page import BasePage
 
 
@@ -34,14 +34,19 @@ class CartPage(BasePage):
         self.navigate_to("/cart")
         return self
     
+    def wait_for_cart(self):
+        """Wait until the cart shows either its items or the empty-cart message"""
+        return self.wait_for_any(self.CART_ITEMS, self.EMPTY_CART_MESSAGE)
+    
     def get_cart_items_count(self):
         """Get the number of items in the cart"""
-        cart_items = self.find_elements(self.CART_ITEMS)
+        self.wait_for_cart()
+        cart_items = self.find_elements(self.CART_ITEMS, timeout=0)
         return len(cart_items)
     
     def is_cart_empty(self):
         """Check if the cart is empty"""
-        return self.is_element_visible(self.EMPTY_CART_MESSAGE)
+        return self.wait_for_cart() == 1
     
     def get_item_name(self, index=0):
         """Get the name of an item in the cart by index"""
@@ -49,7 +54,7 @@ class CartPage(BasePage):
         if index < len(cart_items):
             item = cart_items[index]
             name_element = item.find_element(*self.CART_ITEM_NAME)
-            return self.get_element_text((None, name_element))
+            return self.get_element_text(name_element)
         return None
     
     def get_item_price(self, index=0):
@@ -58,7 +63,7 @@ class CartPage(BasePage):
         if index < len(cart_items):
             item = cart_items[index]
             price_element = item.find_element(*self.CART_ITEM_PRICE)
-            price_text = self.get_element_text((None, price_element))
+            price_text = self.get_element_text(price_element)
             return float(price_text.replace("$", "").replace(",", "").strip())
         return None
     
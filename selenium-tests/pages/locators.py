@@ -0,0 +1,27 @@
+class By:
+    """Locator strategies, with the same values as ``selenium.webdriver.common.by.By``.
+
+    Importing Selenium's ``By`` loads the whole ``selenium.webdriver`` package;
+    page objects declare their locators with this class instead so that
+    importing them stays cheap.
+    """
+
+    ID = "id"
+    XPATH = "xpath"
+    LINK_TEXT = "link text"
+    PARTIAL_LINK_TEXT = "partial link text"
+    NAME = "name"
+    TAG_NAME = "tag name"
+    CLASS_NAME = "class name"
+    CSS_SELECTOR = "css selector"
+
+
+def declared_locators(page_class):
+    """Locators declared as class attributes of ``page_class`` and its bases, by attribute name"""
+    locators = {}
+    for klass in reversed(page_class.__mro__):
+        for name, value in vars(klass).items():
+            if (isinstance(value, tuple) and len(value) == 2 and isinstance(value[1], str)
+                    and value[0] in vars(By).values()):
+                locators[name] = value
+    return locators
@@ -1,4 +1,4 @@
-from selenium.webdriver.common.by import By
+from pages.locators import By
 from pages.base_page import BasePage
 
 
@@ -0,0 +1,119 @@
+"""JavaScript snippets executed in the browser by page objects.
+
+Each snippet does in one ``execute_script`` round trip what would otherwise
+take one WebDriver command per element.
+"""
+
+# Resolves a Selenium (by, value) locator inside the page. Shared by the snippets below.
+_QUERY_ALL = """
+function qaQueryAll(by, value, root) {
+    root = root || document;
+    switch (by) {
+        case 'css selector': return Array.prototype.slice.call(root.querySelectorAll(value));
+        case 'id': return Array.prototype.slice.call(root.querySelectorAll('[id="' + value + '"]'));
+        case 'name': return Array.prototype.slice.call(root.querySelectorAll('[name="' + value + '"]'));
+        case 'class name': return Array.prototype.slice.call(root.getElementsByClassName(value));
+        case 'tag name': return Array.prototype.slice.call(root.getElementsByTagName(value));
+        case 'link text':
+        case 'partial link text':
+            return Array.prototype.slice.call(root.querySelectorAll('a')).filter(function (a) {
+                var text = a.innerText.trim();
+                return by === 'link text' ? text === value : text.indexOf(value) !== -1;
+            });
+        case 'xpath':
+            var found = document.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < found.snapshotLength; i++) { nodes.push(found.snapshotItem(i)); }
+            return nodes;
+    }
+    throw new Error('Unsupported locator strategy: ' + by);
+}
+"""
+
+# arguments: by, value, fields ({name: [cssSelector or null, attribute or null]}), includeElements
+EXTRACT_ITEMS = _QUERY_ALL + """
+var by = arguments[0], value = arguments[1], fields = arguments[2], includeElements = arguments[3];
+return qaQueryAll(by, value).map(function (item) {
+    var row = {};
+    Object.keys(fields).forEach(function (name) {
+        var selector = fields[name][0], attribute = fields[name][1];
+        var target = selector ? item.querySelector(selector) : item;
+        if (!target) { row[name] = null; return; }
+        if (!attribute) { row[name] = target.innerText.trim(); return; }
+        // Like WebElement.get_attribute: prefer the (resolved) property, e.g. absolute href
+        row[name] = typeof target[attribute] === 'string' ? target[attribute] : target.getAttribute(attribute);
+    });
+    if (includeElements) { row.element = item; }
+    return row;
+});
+"""
+
+# arguments: token to stamp the current document's window with, or null to only read it.
+# Returns [location.href, token]; a new document (load, reload, navigation) has no token.
+PAGE_STATE = """
+if (arguments[0]) { window.__qaPageToken = arguments[0]; }
+return [window.location.href, window.__qaPageToken || null];
+"""
+
+# arguments: [[name, by, value], ...]. Returns {name: {text, displayed, attributes} or null} for the first match of each.
+SNAPSHOT = _QUERY_ALL + """
+var result = {};
+arguments[0].forEach(function (locator) {
+    var element = qaQueryAll(locator[1], locator[2])[0];
+    if (!element) { result[locator[0]] = null; return; }
+    var displayed = !!(element.offsetWidth || element.offsetHeight || element.getClientRects().length);
+    var attributes = {};
+    Array.prototype.forEach.call(element.attributes, function (attribute) {
+        // Like WebElement.get_attribute: prefer the (resolved) property, e.g. absolute href
+        var property = element[attribute.name];
+        attributes[attribute.name] = typeof property === 'string' ? property : attribute.value;
+    });
+    // Like WebElement.text: the rendered text, empty for hidden elements
+    result[locator[0]] = {text: displayed ? element.innerText.trim() : '', displayed: displayed, attributes: attributes};
+});
+return result;
+"""
+
+# Async script. arguments: kind ('present', 'all_present', 'visible', 'clickable' or 'invisible'), by, value,
+# timeout in ms, callback. Re-checks the condition on every DOM mutation (and every 100 ms for layout-only
+# changes) inside the page and calls back with [met, result, ms waited in the page]: the first element,
+# every element for 'all_present', true for 'invisible'. Mirrors the expected_conditions of the same names.
+OBSERVE_CONDITION = _QUERY_ALL + """
+var kind = arguments[0], by = arguments[1], value = arguments[2], timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+var started = Date.now(), finished = false, observer = null, timer = null, poller = null;
+function displayed(element) {
+    if (!(element.offsetWidth || element.offsetHeight || element.getClientRects().length)) { return false; }
+    var style = window.getComputedStyle(element);
+    return style.visibility !== 'hidden' && style.opacity !== '0';
+}
+function check() {
+    var elements = qaQueryAll(by, value), first = elements[0];
+    switch (kind) {
+        case 'present': return first ? [first] : null;
+        case 'all_present': return elements.length ? [elements] : null;
+        case 'visible': return first && displayed(first) ? [first] : null;
+        case 'clickable': return first && displayed(first) && !first.disabled ? [first] : null;
+        case 'invisible': return !first || !displayed(first) ? [true] : null;
+    }
+    throw new Error('Unsupported wait condition: ' + kind);
+}
+function finish(met, result) {
+    if (finished) { return; }
+    finished = true;
+    if (observer) { observer.disconnect(); }
+    clearTimeout(timer);
+    clearInterval(poller);
+    done([met, result, Date.now() - started]);
+}
+function recheck() {
+    var result = check();
+    if (result) { finish(true, result[0]); }
+}
+var initial = check();
+if (initial) { done([true, initial[0], 0]); return; }
+observer = new MutationObserver(recheck);
+observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+poller = setInterval(recheck, 100);
+timer = setTimeout(function () { finish(false, null); }, timeoutMs);
+"""
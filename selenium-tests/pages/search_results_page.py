@@ -1,7 +1,11 @@
-from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webdriver import WebDriver
+from typing import TYPE_CHECKING
+from selenium.common.exceptions import ElementClickInterceptedException
+from pages.locators import By
 from .base_page import BasePage
-import allure
+from utils import instrumentation
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
 
 class SearchResultsPage(BasePage):
     # Locators
@@ -13,74 +17,92 @@ class SearchResultsPage(BasePage):
     _sort_options_dropdown = (By.ID, "sort-options")
     _filter_category_button = (By.XPATH, "//button[contains(text(), 'Category')]")
 
-    def __init__(self, driver: WebDriver, config):
+    # Fields read from each result item by extract_items (CSS selectors relative to the item)
+    _result_fields = {
+        "name": _product_name[1],
+        "price": _product_price[1],
+        "link": ("a", "href"),
+    }
+
+    def __init__(self, driver: "WebDriver", config):
         super().__init__(driver, config)
         self.config = config
 
-    @allure.step("Verify search results page is loaded")
+    @instrumentation.step("Verify search results page is loaded")
     def is_results_page_loaded(self, timeout=10):
         """Verifies if the search results container is visible."""
         return self.is_element_visible(self._search_results_container, timeout=timeout)
 
-    @allure.step("Get number of search results displayed")
+    def _wait_for_results(self, timeout=None):
+        """Waits until either result items or the 'no results' message are shown.
+
+        Returns True if results are displayed, False for the 'no results' state
+        or if the page settled in neither state.
+        """
+        return self.wait_for_any(self._product_item, self._no_results_message, timeout=timeout) == 0
+
+    @instrumentation.step("Get number of search results displayed")
     def get_results_count(self):
         """Returns the number of product items displayed on the page."""
-        if not self.is_element_visible(self._search_results_container):
+        if not self._wait_for_results():
             return 0
-        results = self.find_elements(self._product_item)
+        results = self.find_elements(self._product_item, timeout=0)
         return len(results)
 
-    @allure.step("Get product names from search results")
+    @instrumentation.step("Get search results")
+    def get_results(self, include_elements: bool = False):
+        """Returns every result as a dict (name, price, link) using a single WebDriver call."""
+        if not self._wait_for_results():
+            return []
+        return self.extract_items(self._product_item, self._result_fields, include_elements=include_elements)
+
+    def _find_result(self, product_name: str, include_elements: bool = False):
+        for result in self.get_results(include_elements=include_elements):
+            if result["name"] and result["name"].lower() == product_name.lower():
+                return result
+        return None
+
+    @instrumentation.step("Get product names from search results")
     def get_product_names(self):
         """Returns a list of product names from the search results."""
-        names = []
-        product_elements = self.find_elements(self._product_item)
-        for elem in product_elements:
-            try:
-                name_element = elem.find_element(*self._product_name)
-                names.append(self.get_element_text(name_element))
-            except Exception:
-                # Handle cases where a product item might not have a name or structure is different
-                pass # Or log a warning
-        return names
-
-    @allure.step("Verify if product '{product_name}' is listed in search results")
+        # Items without a name element are skipped
+        return [result["name"] for result in self.get_results() if result["name"]]
+
+    @instrumentation.step("Verify if product '{product_name}' is listed in search results")
     def is_product_listed(self, product_name: str):
         """Checks if a product with the given name is present in the search results."""
-        product_names = self.get_product_names()
-        return product_name.lower() in [name.lower() for name in product_names]
+        return self._find_result(product_name) is not None
 
-    @allure.step("Click on product '{product_name}' from search results")
+    @instrumentation.step("Click on product '{product_name}' from search results")
     def click_product_by_name(self, product_name: str):
         """Clicks on a product link/image from the search results based on its name."""
-        product_elements = self.find_elements(self._product_item)
-        for elem in product_elements:
-            try:
-                name_element = elem.find_element(*self._product_name)
-                if self.get_element_text(name_element).lower() == product_name.lower():
-                    self.click_element(elem) # Click the whole product item container
-                    # Or click a specific link within the item: self.click_element(name_element)
-                    return True
-            except Exception:
-                pass
-        allure.attach(f"Product '{product_name}' not found to click.", name="ClickProductError", attachment_type=allure.attachment_type.TEXT)
-        return False
-
-    @allure.step("Verify 'no results found' message is displayed")
+        result = self._find_result(product_name, include_elements=True)
+        if result is None:
+            instrumentation.detail("ClickProductError", f"Product '{product_name}' not found to click.")
+            return False
+        try:
+            result["element"].click() # Click the whole product item container
+        except ElementClickInterceptedException:
+            self.js_click(result["element"])
+        return True
+
+    @instrumentation.step("Verify 'no results found' message is displayed")
     def is_no_results_message_displayed(self, timeout=5):
         """Checks if the 'no results found' message is visible."""
-        return self.is_element_visible(self._no_results_message, timeout=timeout)
+        if self._wait_for_results(timeout=timeout):
+            return False  # results are listed, no need to wait for the message
+        return self.is_element_visible(self._no_results_message, timeout=0)
 
-    @allure.step("Select sort option: {option_text}")
+    @instrumentation.step("Select sort option: {option_text}")
     def select_sort_option(self, option_text: str):
         """Selects an option from the sort dropdown (e.g., 'Price: Low to High')."""
         if self.is_element_visible(self._sort_options_dropdown):
             self.select_dropdown_option_by_visible_text(self._sort_options_dropdown, option_text)
-            allure.attach(f"Selected sort option: {option_text}", name="SortSelection", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("SortSelection", f"Selected sort option: {option_text}")
         else:
-            allure.attach("Sort options dropdown not found.", name="SortSelectionError", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("SortSelectionError", "Sort options dropdown not found.")
 
-    @allure.step("Apply category filter: {category_name}")
+    @instrumentation.step("Apply category filter: {category_name}")
     def apply_category_filter(self, category_name: str):
         """Applies a category filter. Assumes filters are links or buttons."""
         # This is a placeholder; actual filter interaction can be complex
@@ -90,21 +112,13 @@ class SearchResultsPage(BasePage):
             # Add logic to find and click the specific category_name filter
             # category_filter_locator = (By.LINK_TEXT, category_name) # Example
             # self.click_element(category_filter_locator)
-            allure.attach(f"Attempted to apply category filter: {category_name}", name="FilterSelection", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("FilterSelection", f"Attempted to apply category filter: {category_name}")
         else:
-            allure.attach("Category filter button not found.", name="FilterSelectionError", attachment_type=allure.attachment_type.TEXT)
+            instrumentation.detail("FilterSelectionError", "Category filter button not found.")
 
     def get_search_result_item_details(self, product_name: str):
         """Retrieves details (e.g., name, price) for a specific product in search results."""
-        product_elements = self.find_elements(self._product_item)
-        for elem in product_elements:
-            try:
-                name_element = elem.find_element(*self._product_name)
-                current_product_name = self.get_element_text(name_element)
-                if current_product_name.lower() == product_name.lower():
-                    price_element = elem.find_element(*self._product_price)
-                    price = self.get_element_text(price_element)
-                    return {"name": current_product_name, "price": price}
-            except Exception:
-                pass
-        return None
+        result = self._find_result(product_name)
+        if result is None:
+            return None
+        return {"name": result["name"], "price": result["price"]}
\ No newline at end of file
@@ -0,0 +1 @@
+# Pytest plugins package initialization
\ No newline at end of file
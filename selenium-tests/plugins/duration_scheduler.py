@@ -0,0 +1,152 @@
+"""Duration-aware test distribution for pytest-xdist.
+
+Durations of every test (setup + call + teardown) are kept in the pytest cache.
+With ``--duration-scheduling`` and ``-n N`` the collected tests are assigned to
+workers up front, longest first, each one going to the worker with the least
+estimated work (LPT scheduling). Tests that use the same expensive fixtures
+(``duration_scheduling_group_fixtures`` in pytest.ini) form one unit and land on
+the same worker. Without any recorded history xdist's default load scheduler
+is used.
+"""
+import statistics
+
+import pytest
+
+from utils import run_summary
+
+try:
+    from xdist.scheduler import LoadScheduling
+except ImportError:  # pytest-xdist is optional for serial runs
+    LoadScheduling = object
+
+HISTORY_CACHE_KEY = "duration_scheduler/history"
+
+# Weight of the newest measurement in the moving average kept per test
+_SMOOTHING = 0.5
+
+
+def pytest_addoption(parser):
+    parser.addoption("--duration-scheduling", action="store_true", default=False,
+                     help="Distribute tests across xdist workers longest-first using recorded durations")
+    parser.addini("duration_scheduling_group_fixtures", type="linelist", default=[],
+                  help="Expensive fixtures whose tests are kept on the same xdist worker")
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(DurationRecorder(config), "duration_recorder")
+    run_summary.register_formatter("duration_scheduling", "Duration-aware scheduling", _format_plan)
+
+
+def _format_plan(records, config):
+    for r in records:
+        yield f"{r['node']}: {r['tests']} tests, estimated {r['estimated_seconds']:.1f}s"
+
+
+class DurationRecorder:
+    """Collects per-test durations in the controller (or the only process) and saves them"""
+
+    def __init__(self, config):
+        self.config = config
+        self.measured = {}
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        expensive = set(self.config.getini("duration_scheduling_group_fixtures"))
+        # Travels with the report from the xdist worker to the controller
+        report.scheduling_group = "|".join(sorted(expensive.intersection(item.fixturenames)))
+
+    def pytest_runtest_logreport(self, report):
+        if hasattr(self.config, "workerinput"):
+            return
+        entry = self.measured.setdefault(report.nodeid, {"duration": 0.0, "group": ""})
+        entry["duration"] += report.duration
+        entry["group"] = getattr(report, "scheduling_group", "") or entry["group"]
+
+    def pytest_sessionfinish(self, session):
+        if hasattr(self.config, "workerinput") or getattr(self.config, "cache", None) is None or not self.measured:
+            return
+        history = self.config.cache.get(HISTORY_CACHE_KEY, {})
+        for nodeid, entry in self.measured.items():
+            previous = history.get(nodeid)
+            if previous:
+                entry["duration"] = _SMOOTHING * entry["duration"] + (1 - _SMOOTHING) * previous["duration"]
+            history[nodeid] = entry
+        self.config.cache.set(HISTORY_CACHE_KEY, history)
+
+
+def plan_assignment(collection, history, num_nodes):
+    """Split ``collection`` into ``num_nodes`` lists of indices with balanced estimated durations.
+
+    Returns the index lists and the estimated total duration of each.
+    """
+    known = [history[nodeid]["duration"] for nodeid in collection if nodeid in history]
+    default_duration = statistics.median(known) if known else 1.0
+
+    units = {}
+    for index, nodeid in enumerate(collection):
+        entry = history.get(nodeid, {})
+        key = entry.get("group") or nodeid
+        unit = units.setdefault(key, {"indices": [], "duration": 0.0})
+        unit["indices"].append(index)
+        unit["duration"] += entry.get("duration", default_duration)
+
+    assignment = [[] for _ in range(num_nodes)]
+    loads = [0.0] * num_nodes
+    for unit in sorted(units.values(), key=lambda u: u["duration"], reverse=True):
+        target = loads.index(min(loads))
+        assignment[target].extend(unit["indices"])
+        loads[target] += unit["duration"]
+    return assignment, loads
+
+
+class DurationScheduling(LoadScheduling):
+    """LoadScheduling that hands every worker its full LPT share on the first schedule() call.
+
+    Crash recovery is inherited: items pending on a dead worker go back to
+    ``pending`` and are sent to its replacement.
+    """
+
+    def __init__(self, config, log=None, history=None):
+        super().__init__(config, log)
+        self.history = history or {}
+
+    def schedule(self):
+        assert self.collection_is_completed
+
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = list(next(iter(self.node2collection.values())))
+        if not self.collection:
+            return
+        if self.maxschedchunk is None:
+            self.maxschedchunk = len(self.collection)
+
+        assignment, loads = plan_assignment(self.collection, self.history, len(self.nodes))
+        for node, indices, load in zip(self.nodes, assignment, loads):
+            run_summary.record(self.config, "duration_scheduling", node=node.gateway.id,
+                               tests=len(indices), estimated_seconds=load)
+            if indices:
+                self.node2pending[node].extend(indices)
+                node.send_runtest_some(indices)
+        for node in self.nodes:
+            node.shutdown()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if not config.getoption("--duration-scheduling") or config.getvalue("dist") != "load":
+        return None
+    history = config.cache.get(HISTORY_CACHE_KEY, {}) if getattr(config, "cache", None) else {}
+    if not history:
+        # Nothing recorded yet: let xdist use its default scheduler
+        return None
+    return DurationScheduling(config, log, history=history)
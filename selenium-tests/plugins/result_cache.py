@@ -0,0 +1,169 @@
+"""Incremental result cache: skip passing tests whose inputs have not changed.
+
+With ``--result-cache`` every test gets a content fingerprint of its inputs:
+its test module, the page-object and test-data files it touched (from the
+impact map of ``plugins/test_impact.py``; every ``pages/`` and ``test_data/``
+file while a test has not been recorded), the core files listed in
+``impact_core_files``, the resolved environment (browser, env, profile and the
+URLs from ``config.json``/``.env``) and the build of the application under test
+(``--build-id`` or ``APP_BUILD_ID``). Passes are stored in the pytest cache with
+their fingerprint; a later run reports a test whose fingerprint still matches as
+"cached" instead of running it. Any input change, a failure or an entry older
+than ``result_cache_ttl_hours`` (pytest.ini) runs the test again.
+"""
+import fnmatch
+import hashlib
+import json
+import os
+import time
+
+import pytest
+
+from plugins.test_impact import MAP_CACHE_KEY, TRACKED_DIRS
+from utils import run_summary
+from utils.config import Config
+
+RESULTS_CACHE_KEY = "result_cache/results"
+
+# Directories never holding inputs of a test run
+_SKIPPED_DIRS = {"__pycache__", ".pytest_cache", "reports", "allure-results", "screenshots"}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("result cache")
+    group.addoption("--result-cache", action="store_true", default=False,
+                    help="Report passing tests whose inputs are unchanged as cached instead of running them")
+    group.addoption("--build-id", action="store", default=os.getenv("APP_BUILD_ID"),
+                    help="Build identifier of the application under test, part of the result cache key "
+                         "(default: APP_BUILD_ID)")
+    parser.addini("result_cache_ttl_hours", default="24",
+                  help="Hours a cached pass stays valid with --result-cache")
+
+
+def pytest_configure(config):
+    if config.getoption("--result-cache"):
+        config.pluginmanager.register(ResultCache(config), "result_cache")
+        run_summary.register_formatter("result_cache", "Result cache", _format_cache)
+
+
+def _format_cache(records, config):
+    cached = [r for r in records if r["cached"]]
+    stored = len(records) - len(cached)
+    saved = sum(r["duration"] for r in cached)
+    build = config.getoption("--build-id") or "no build id"
+    yield (f"{len(cached)} cached passes skipped (~{saved:.1f}s saved), {stored} results stored "
+           f"({build}, TTL {config.getini('result_cache_ttl_hours')}h)")
+
+
+class ResultCache:
+    """Fingerprints tests, skips unchanged cached passes and stores new outcomes"""
+
+    def __init__(self, config):
+        self.config = config
+        self.rootdir = str(config.rootpath)
+        self.ttl = float(config.getini("result_cache_ttl_hours")) * 3600
+        self.results = config.cache.get(RESULTS_CACHE_KEY, {}) if getattr(config, "cache", None) else {}
+        self.impact_map = config.cache.get(MAP_CACHE_KEY, {}) if getattr(config, "cache", None) else {}
+        self.outcomes = {}
+        self._digests = {}
+        self._shared = None
+
+    def fingerprint(self, nodeid):
+        """Content hash of everything the outcome of test ``nodeid`` depends on"""
+        if self._shared is None:
+            self._shared = self._shared_fingerprint()
+        entry = self.impact_map.get(nodeid)
+        if entry is None:
+            files = self._files_under(TRACKED_DIRS)
+        else:
+            files = {symbol.split("::", 1)[0] for symbol in entry["symbols"]}
+            files.update(data.split("#", 1)[0] for data in entry["data"])
+        files.add(nodeid.split("::", 1)[0])
+        digest = hashlib.sha256(self._shared.encode())
+        for path in sorted(files):
+            digest.update(f"\0{path}\0{self._digest(path)}".encode())
+        return digest.hexdigest()
+
+    def _shared_fingerprint(self):
+        options = self.config.option
+        env = Config(options.browser, options.env, options.profile)
+        core = sorted(path for path in self._files_under([""])
+                      if any(fnmatch.fnmatch(path, pattern) for pattern in self.config.getini("impact_core_files")))
+        return json.dumps({
+            "browser": env.browser, "env": env.env, "profile": env.profile,
+            "base_url": env.base_url, "api_url": env.api_url,
+            "build": self.config.getoption("--build-id"),
+            "core": {path: self._digest(path) for path in core},
+        }, sort_keys=True)
+
+    def _files_under(self, directories):
+        files = set()
+        for directory in directories:
+            for dirpath, dirnames, filenames in os.walk(os.path.join(self.rootdir, directory)):
+                dirnames[:] = [d for d in dirnames if d not in _SKIPPED_DIRS and not d.startswith(".")]
+                for filename in filenames:
+                    if not filename.endswith((".pyc", ".log")):
+                        files.add(os.path.relpath(os.path.join(dirpath, filename), self.rootdir).replace(os.sep, "/"))
+        return files
+
+    def _digest(self, path):
+        digest = self._digests.get(path)
+        if digest is None:
+            try:
+                with open(os.path.join(self.rootdir, path), "rb") as f:
+                    digest = hashlib.sha256(f.read()).hexdigest()
+            except OSError:
+                digest = "missing"
+            self._digests[path] = digest
+        return digest
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item):
+        cached = self.results.get(item.nodeid)
+        if (cached and cached["fingerprint"] == self.fingerprint(item.nodeid)
+                and time.time() - cached["passed_at"] < self.ttl):
+            item.result_cached = cached
+            age = (time.time() - cached["passed_at"]) / 3600
+            pytest.skip(f"cached pass from {age:.1f}h ago, inputs unchanged")
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        # Travels with the report from the xdist worker to the controller
+        cached = getattr(item, "result_cached", None)
+        report.result_cached_duration = cached["duration"] if cached else None
+
+    def pytest_report_teststatus(self, report, config):
+        if report.when == "setup" and getattr(report, "result_cached_duration", None) is not None:
+            return "cached", "c", ("CACHED", {"cyan": True})
+
+    def pytest_runtest_logreport(self, report):
+        if hasattr(self.config, "workerinput"):
+            return
+        if getattr(report, "result_cached_duration", None) is not None:
+            if report.when == "setup":
+                run_summary.record(self.config, "result_cache", nodeid=report.nodeid, cached=True,
+                                   duration=report.result_cached_duration)
+            return
+        outcome = self.outcomes.setdefault(report.nodeid, {"passed": True, "ran": False, "duration": 0.0})
+        outcome["passed"] = outcome["passed"] and report.passed
+        outcome["ran"] = outcome["ran"] or (report.when == "call" and report.passed)
+        outcome["duration"] += report.duration
+
+    def pytest_sessionfinish(self, session):
+        if hasattr(self.config, "workerinput") or getattr(self.config, "cache", None) is None:
+            return
+        # Fingerprint with what the tests touched in this run, as the next run will
+        impact = self.config.pluginmanager.get_plugin("test_impact")
+        self.impact_map.update(getattr(impact, "recorded", {}))
+        results = self.config.cache.get(RESULTS_CACHE_KEY, {})
+        for nodeid, outcome in self.outcomes.items():
+            if outcome["passed"] and outcome["ran"]:
+                results[nodeid] = {"fingerprint": self.fingerprint(nodeid), "passed_at": time.time(),
+                                   "duration": outcome["duration"]}
+                run_summary.record(self.config, "result_cache", nodeid=nodeid, cached=False,
+                                   duration=outcome["duration"])
+            else:
+                results.pop(nodeid, None)
+        self.config.cache.set(RESULTS_CACHE_KEY, results)
@@ -0,0 +1,455 @@
+"""Test impact analysis: run only the tests a change can affect.
+
+While a test runs (setup, call and teardown), a profile hook records what it
+touches: the page-object methods it calls, the locators handed to them, and the
+``test_data`` products the catalog gives out. The mapping is kept in the pytest
+cache together with the commit each test was recorded on.
+
+With ``--changed-only`` the changes since that commit (``git diff`` of the
+working tree plus untracked files, or since ``--changed-since REF``) are mapped
+to page-object methods and locators (by changed line), products (by id) and
+test modules. Only the tests that touched one of them, the tests of changed
+test modules and tests never recorded are run. A change to a core file
+(``impact_core_files`` in pytest.ini: ``pages/base_page.py``, ``conftest.py``,
+``utils/``...), to an unmapped Python file, or a missing map runs the whole suite.
+"""
+import ast
+import fnmatch
+import json
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+from test_data.catalog import ProductCatalog
+from utils import run_summary
+
+MAP_CACHE_KEY = "test_impact/map"
+WORKER_OUTPUT_KEY = "test_impact"
+
+# Directories whose code is recorded per test and mapped back from diffs line by line
+TRACKED_DIRS = ("pages", "test_data")
+
+DEFAULT_CORE_FILES = [
+    "conftest.py",
+    "*/conftest.py",
+    "pytest.ini",
+    "config.json",
+    "pages/__init__.py",
+    "pages/base_page.py",
+    "pages/locators.py",
+    "pages/scripts.py",
+    "tests/base_test.py",
+    "test_data/users.json",
+    "utils/*",
+    "plugins/*",
+    "local_app/*",
+]
+
+_LOCATOR_STRATEGIES = frozenset(("id", "xpath", "link text", "partial link text", "name", "tag name",
+                                 "class name", "css selector"))
+_HUNK = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("test impact")
+    group.addoption("--changed-only", action="store_true", default=False,
+                    help="Only run tests impacted by changes since they were recorded (git diff)")
+    group.addoption("--changed-since", action="store", default=None, metavar="REF",
+                    help="With --changed-only, diff against this git ref instead of the recorded commits")
+    group.addoption("--no-impact-recording", action="store_true", default=False,
+                    help="Do not record what each test touches")
+    parser.addini("impact_core_files", type="linelist", default=DEFAULT_CORE_FILES,
+                  help="Files (globs relative to the rootdir) whose change runs the whole suite with --changed-only")
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(ImpactAnalysis(config), "test_impact")
+    run_summary.register_formatter("test_impact", "Test impact analysis", _format_selection)
+
+
+def _format_selection(records, config):
+    # Every xdist worker selects the same tests; one record says it all
+    r = records[0]
+    yield f"{r['selected']} of {r['collected']} tests selected, {len(r['changed'])} changed files since {r['base']}"
+    if r["reason"]:
+        yield f"Whole suite: {r['reason']}"
+
+
+class ImpactRecord:
+    """What one test touched: page-object symbols, locators and test data entries"""
+
+    def __init__(self):
+        self.symbols = set()
+        self.locators = set()
+        self.data = set()
+
+    def as_dict(self, commit):
+        return {"commit": commit, "symbols": sorted(self.symbols),
+                "locators": sorted(self.locators), "data": sorted(self.data)}
+
+
+class ImpactRecorder:
+    """``sys.setprofile`` hook that fills an :class:`ImpactRecord` from calls into ``TRACKED_DIRS``"""
+
+    def __init__(self, rootdir):
+        self.rootdir = rootdir
+        self.prefixes = tuple(os.path.join(rootdir, d) + os.sep for d in TRACKED_DIRS)
+        self.recording = None
+        self._files = {}
+        self._locators = {}
+
+    def __call__(self, frame, event, arg):
+        if event != "call" and event != "return":
+            return
+        code = frame.f_code
+        path = self._files.get(code.co_filename, False)
+        if path is False:
+            filename = code.co_filename
+            path = os.path.relpath(filename, self.rootdir).replace(os.sep, "/") if filename.startswith(self.prefixes) else None
+            self._files[code.co_filename] = path
+        if path is None:
+            return
+        owner = frame.f_locals.get("self")
+        if isinstance(owner, ProductCatalog):
+            self._record_data(owner, code.co_name, event, arg)
+        if event != "call":
+            return
+        qualname = getattr(code, "co_qualname", code.co_name).split(".<locals>", 1)[0]
+        if qualname != "<module>":
+            self.recording.symbols.add(f"{path}::{qualname}")
+        if owner is not None:
+            locators = self._locator_names(type(owner))
+            for value in frame.f_locals.values():
+                if _is_locator(value) and value in locators:
+                    self.recording.locators.add(locators[value])
+
+    def _record_data(self, catalog, method, event, value):
+        if method == "__init__":
+            return
+        path = os.path.abspath(catalog.path)
+        # Catalogs outside the project (a test's tmp_path) move on every run and never show up in a diff
+        if not path.startswith(self.rootdir + os.sep):
+            return
+        source = os.path.relpath(path, self.rootdir).replace(os.sep, "/")
+        if event == "call":
+            if method in ("__iter__", "__len__"):
+                self.recording.data.add(f"{source}#*")
+            return
+        for product in value if isinstance(value, list) else [value]:
+            if isinstance(product, dict) and "id" in product:
+                self.recording.data.add(f"{source}#{product['id']}")
+
+    def _locator_names(self, cls):
+        """Locator values of a page class mapped to ``Owner.attribute``; subclasses override their bases"""
+        names = self._locators.get(cls)
+        if names is None:
+            names = {}
+            for klass in reversed(cls.__mro__):
+                for attribute, value in vars(klass).items():
+                    if _is_locator(value):
+                        names[value] = f"{klass.__name__}.{attribute}"
+            self._locators[cls] = names
+        return names
+
+
+def _is_locator(value):
+    return (type(value) is tuple and len(value) == 2 and value[0] in _LOCATOR_STRATEGIES
+            and isinstance(value[1], str))
+
+
+class ImpactAnalysis:
+    """Records the impact map while tests run and deselects unaffected tests with ``--changed-only``"""
+
+    def __init__(self, config):
+        self.config = config
+        self.rootdir = str(config.rootpath)
+        self.recorder = ImpactRecorder(self.rootdir)
+        self.recorded = {}
+        self._commit = None
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item):
+        # Leave other profilers (cProfile, debuggers) alone rather than replacing them
+        if self.config.getoption("--no-impact-recording") or sys.getprofile() is not None:
+            yield
+            return
+        self.recorder.recording = ImpactRecord()
+        item.impact_ran = False
+        sys.setprofile(self.recorder)
+        try:
+            yield
+        finally:
+            sys.setprofile(None)
+            if item.impact_ran:
+                self.recorded[item.nodeid] = self.recorder.recording.as_dict(self._head())
+            self.recorder.recording = None
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        if call.when == "call" and not outcome.get_result().skipped:
+            item.impact_ran = True
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        if not config.getoption("--changed-only"):
+            return
+        impact_map = config.cache.get(MAP_CACHE_KEY, {}) if getattr(config, "cache", None) else {}
+        base = config.getoption("--changed-since")
+        selected, reason, changed = select(items, impact_map, self.rootdir, config.getini("impact_core_files"), base)
+        keep = {item.nodeid for item in selected}
+        deselected = [item for item in items if item.nodeid not in keep]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+        run_summary.record(config, "test_impact", collected=len(selected) + len(deselected), selected=len(selected),
+                           changed=sorted(changed), base=base or "the recorded commits", reason=reason)
+
+    def pytest_sessionfinish(self, session):
+        if hasattr(self.config, "workeroutput"):
+            self.config.workeroutput[WORKER_OUTPUT_KEY] = self.recorded
+        elif self.recorded and getattr(self.config, "cache", None) is not None:
+            impact_map = self.config.cache.get(MAP_CACHE_KEY, {})
+            impact_map.update(self.recorded)
+            self.config.cache.set(MAP_CACHE_KEY, impact_map)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        self.recorded.update((getattr(node, "workeroutput", None) or {}).get(WORKER_OUTPUT_KEY, {}))
+
+    def _head(self):
+        if self._commit is None:
+            self._commit = (_git(self.rootdir, "rev-parse", "HEAD") or "").strip()
+        return self._commit or None
+
+
+def select(items, impact_map, rootdir, core_files, base=None):
+    """Items impacted by the changes since their recorded commit (or ``base``).
+
+    Returns the selected items, the reason the whole suite was selected (or
+    None) and the changed paths.
+    """
+    if not impact_map:
+        return list(items), "no impact map recorded yet (run the suite once)", set()
+    bases = {base} if base else {entry["commit"] for entry in impact_map.values() if entry.get("commit")}
+    impacts, changed = {}, set()
+    for ref in bases:
+        changes = changed_files(rootdir, ref)
+        if changes is None:
+            return list(items), f"git diff against {ref} failed", changed
+        changed.update(changes)
+        reason = next((f"core file {path} changed" for path in sorted(changes) if _is_core(path, core_files)), None)
+        if reason is None:
+            impact = Impact.from_changes(changes, rootdir, ref)
+            reason = impact.reason
+        if reason:
+            return list(items), reason, changed
+        impacts[ref] = impact
+
+    selected = []
+    for item in items:
+        entry = impact_map.get(item.nodeid)
+        ref = base or (entry or {}).get("commit")
+        if entry is None or ref not in impacts or impacts[ref].affects(item.nodeid, entry):
+            selected.append(item)
+    return selected, None, changed
+
+
+def _is_core(path, core_files):
+    return any(fnmatch.fnmatch(path, pattern) for pattern in core_files)
+
+
+class Impact:
+    """What a set of changed files affects: symbols, locators, data entries, whole files and test modules"""
+
+    def __init__(self):
+        self.symbols = set()
+        self.members = set()
+        self.data = set()
+        self.files = set()
+        self.test_modules = set()
+        self.reason = None
+
+    @classmethod
+    def from_changes(cls, changes, rootdir, base):
+        impact = cls()
+        for path, lines in changes.items():
+            top = path.split("/", 1)[0]
+            if top == "tests" and path.endswith(".py"):
+                impact.test_modules.add(path)
+            elif top in TRACKED_DIRS and path.endswith(".py"):
+                impact._add_source(path, lines, rootdir)
+            elif top in TRACKED_DIRS and path.endswith(".json"):
+                impact._add_data(path, rootdir, base)
+            elif path.endswith(".py"):
+                impact.reason = f"{path} changed and is not mapped to tests"
+                return impact
+        if impact.members:
+            impact.symbols.update(_methods_using({member.rsplit(".", 1)[1] for member in impact.members}, rootdir))
+        return impact
+
+    def _add_source(self, path, lines, rootdir):
+        source = _read(os.path.join(rootdir, path))
+        symbols = None if source is None or lines is None else changed_symbols(source, lines)
+        if symbols is None:
+            self.files.add(path)
+            return
+        for symbol in symbols:
+            self.symbols.add(f"{path}::{symbol}")
+            if "." in symbol:
+                # A changed class member (a locator, a helper) also affects the page-object methods referring to it
+                self.members.add(symbol)
+
+    def _add_data(self, path, rootdir, base):
+        new = _products(_read(os.path.join(rootdir, path)))
+        old = _products(_git(rootdir, "show", f"{base}:./{path}"))
+        if new is None or old is None:
+            self.files.add(path)
+            return
+        # Tests that read the whole catalog are affected by any change
+        self.data.add(f"{path}#*")
+        for product_id in set(new) | set(old):
+            if new.get(product_id) != old.get(product_id):
+                self.data.add(f"{path}#{product_id}")
+
+    def affects(self, nodeid, entry):
+        if nodeid.split("::", 1)[0] in self.test_modules:
+            return True
+        for symbol in entry["symbols"]:
+            if symbol in self.symbols or symbol.split("::", 1)[0] in self.files:
+                return True
+        if any(locator in self.members for locator in entry["locators"]):
+            return True
+        for data in entry["data"]:
+            if data in self.data or data.split("#", 1)[0] in self.files:
+                return True
+        return False
+
+
+def changed_symbols(source, lines):
+    """``Class.member`` / function names defined on the changed ``lines`` of ``source``.
+
+    Returns None when a change is outside any definition (imports, module
+    constants, a class statement itself) and so affects the whole module.
+    """
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return None
+    spans = []
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            spans.append((_first_line(node), node.body[0].lineno - 1, None))
+            for member in node.body:
+                for name in _defined_names(member):
+                    spans.append((_first_line(member), member.end_lineno, f"{node.name}.{name}"))
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            spans.append((_first_line(node), node.end_lineno, node.name))
+        else:
+            spans.append((_first_line(node), node.end_lineno, None))
+    symbols = set()
+    for line in lines:
+        hits = [name for start, end, name in spans if start <= line <= end]
+        if None in hits:
+            return None
+        symbols.update(hits)
+    return symbols
+
+
+def _first_line(node):
+    return min([node.lineno] + [d.lineno for d in getattr(node, "decorator_list", [])])
+
+
+def _defined_names(node):
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return [node.name]
+    if isinstance(node, (ast.Assign, ast.AnnAssign)):
+        targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+        return [t.id for t in targets if isinstance(t, ast.Name)]
+    return []
+
+
+def _methods_using(attributes, rootdir):
+    """``path::Class.method`` of every page-object method that reads one of ``attributes``"""
+    methods = set()
+    directory = os.path.join(rootdir, "pages")
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith(".py"):
+            continue
+        source = _read(os.path.join(directory, filename))
+        try:
+            tree = ast.parse(source or "")
+        except SyntaxError:
+            continue
+        for cls in (node for node in tree.body if isinstance(node, ast.ClassDef)):
+            for method in cls.body:
+                if not isinstance(method, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    continue
+                if any(isinstance(n, ast.Attribute) and n.attr in attributes for n in ast.walk(method)):
+                    methods.add(f"pages/{filename}::{cls.name}.{method.name}")
+    return methods
+
+
+def changed_files(rootdir, base):
+    """Paths (relative to ``rootdir``) changed since ``base``, with their changed line numbers.
+
+    Line numbers refer to the current file; None stands for the whole file
+    (added, deleted, binary or untracked). Returns None if git fails.
+    """
+    diff = _git(rootdir, "diff", "-U0", "--no-color", "--no-renames", "--relative", base, "--")
+    untracked = _git(rootdir, "ls-files", "--others", "--exclude-standard")
+    if diff is None or untracked is None:
+        return None
+    changes = {}
+    path = None
+    for line in diff.splitlines():
+        if line.startswith("diff --git"):
+            path = None
+        elif line.startswith("--- "):
+            old = line[4:]
+        elif line.startswith("+++ "):
+            new = line[4:]
+            path = (new if new != "/dev/null" else old)[2:]
+            # Added and deleted files are changed as a whole
+            changes[path] = None if "/dev/null" in (old, new) else set()
+        elif line.startswith("Binary files") and path is None:
+            match = re.search(r" b/(.*) differ$", line)
+            if match:
+                changes[match.group(1)] = None
+        elif path is not None and changes[path] is not None:
+            match = _HUNK.match(line)
+            if match:
+                start, count = int(match.group(1)), int(match.group(2) if match.group(2) is not None else 1)
+                # A pure deletion sits between line ``start`` and the next one
+                changes[path].update(range(start, start + count) if count else (start, start + 1))
+    for path in untracked.splitlines():
+        changes[path] = None
+    return changes
+
+
+def _products(text):
+    """Products of a ``products.json`` document by id, or None if it is not one"""
+    try:
+        products = json.loads(text)["products"]
+        return {str(product["id"]): product for product in products}
+    except (TypeError, ValueError, KeyError):
+        return None
+
+
+def _read(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _git(cwd, *args):
+    try:
+        result = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, timeout=60)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout if result.returncode == 0 else None
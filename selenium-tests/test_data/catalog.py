@@ -0,0 +1,135 @@
+import copy
+import json
+import mmap
+import os
+
+_CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CATALOG_PATH = os.path.join(_CURRENT_DIR, 'products.json')
+
+
+class ProductCatalog:
+    """Product test data, loaded on first use and indexed for constant-time lookups.
+
+    ``path`` is either a JSON file with a ``products`` list (loaded whole) or a
+    JSONL file with one product per line. A JSONL file is memory-mapped and only
+    the byte offsets of its lines are kept in the indexes; a product is parsed
+    when it is looked up, so catalogs of 100k+ products stay cheap.
+
+    Every lookup and iteration returns fresh product dicts: a test may change
+    the one it gets without affecting later tests sharing the catalog.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.getenv('PRODUCT_CATALOG_PATH') or DEFAULT_CATALOG_PATH
+        self._products = None  # JSON source: the parsed list
+        self._map = None       # JSONL source: the memory map of the file
+        self._refs = None
+        self._by_id = None
+        self._by_name = None
+        self._by_category = None
+
+    @property
+    def is_streaming(self):
+        return self.path.endswith('.jsonl')
+
+    def by_id(self, product_id):
+        """Product with the given ID, or None"""
+        self._ensure_indexed()
+        ref = self._by_id.get(str(product_id))
+        return None if ref is None else self._load(ref)
+
+    def by_name(self, name):
+        """Product with the given name (case-insensitive), or None"""
+        self._ensure_indexed()
+        ref = self._by_name.get(name.casefold())
+        return None if ref is None else self._load(ref)
+
+    def in_category(self, category):
+        """All products of a category (case-insensitive)"""
+        self._ensure_indexed()
+        return [self._load(ref) for ref in self._by_category.get(category.casefold(), [])]
+
+    def first(self):
+        """The first product of the catalog, or None if it is empty"""
+        self._ensure_indexed()
+        return self._load(self._refs[0]) if self._refs else None
+
+    def __len__(self):
+        self._ensure_indexed()
+        return len(self._refs)
+
+    def __iter__(self):
+        """Iterate over all products; a JSONL catalog is streamed without building the indexes"""
+        if self.is_streaming:
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+        else:
+            self._ensure_loaded()
+            for product in self._products:
+                yield copy.deepcopy(product)
+
+    def close(self):
+        """Release the memory map of a JSONL catalog"""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+            self._refs = self._by_id = self._by_name = self._by_category = None
+
+    def _ensure_loaded(self):
+        if self._products is not None:
+            return
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Product data file not found: {self.path}")
+        if 'products' not in data or not isinstance(data['products'], list):
+            raise ValueError("Product data JSON must contain a 'products' list.")
+        self._products = data['products']
+
+    def _ensure_indexed(self):
+        if self._refs is not None:
+            return
+        if self.is_streaming:
+            pairs = self._scan_lines()
+        else:
+            self._ensure_loaded()
+            pairs = enumerate(self._products)
+
+        refs, by_id, by_name, by_category = [], {}, {}, {}
+        for ref, product in pairs:
+            refs.append(ref)
+            # First occurrence wins, like the linear scans this replaces
+            by_id.setdefault(str(product.get('id')), ref)
+            by_name.setdefault(product.get('name', '').casefold(), ref)
+            if product.get('category'):
+                by_category.setdefault(product['category'].casefold(), []).append(ref)
+        self._refs, self._by_id, self._by_name, self._by_category = refs, by_id, by_name, by_category
+
+    def _scan_lines(self):
+        """Yield the (offset, length) of every product line with the parsed product.
+
+        Products are parsed once for indexing and then dropped; only the offsets stay in memory.
+        """
+        with open(self.path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            # The map keeps its own handle to the file
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        position = 0
+        while True:
+            line = self._map.readline()
+            if not line:
+                return
+            if line.strip():
+                yield (position, len(line)), json.loads(line)
+            position += len(line)
+
+    def _load(self, ref):
+        if self._map is None:
+            return copy.deepcopy(self._products[ref])
+        offset, length = ref
+        return json.loads(self._map[offset:offset + length])
+
@@ -0,0 +1,230 @@
+"""Seeded synthetic test data: users, products, carts and checkout payloads.
+
+Records have the shapes of ``users.json``, ``products.json``, the Postman cart
+requests and the checkout JMeter plan. Generation is deterministic: record
+``i`` of a kind only depends on the seed and ``i`` (random generators are
+reseeded every ``SEED_BLOCK`` records), so the output is the same whatever the
+number of processes and the chunk size. Records are produced in chunks by a
+process pool and written in order, so millions of records stream through
+constant memory; chunk sizes that are multiples of ``SEED_BLOCK`` never
+generate a record twice.
+
+``--format jsonl`` output loads into the local stand-in app: users with
+``USERS_DATA_PATH`` or ``python -m local_app --users-path``, products with
+``PRODUCT_CATALOG_PATH``.
+
+Usage (from selenium-tests/):
+    python -m test_data.generator --users 1000000 --products 100000 --carts 500000 \\
+        --checkouts 500000 --format csv --output-dir ../reports/data
+"""
+import argparse
+import csv
+import io
+import json
+import multiprocessing
+import os
+import random
+
+from faker import Faker
+
+KINDS = ("users", "products", "carts", "checkouts")
+FORMATS = ("jsonl", "csv")
+
+CATEGORIES = {
+    "Electronics": ["Headphones", "Speaker", "Smart Watch", "Charger", "Keyboard", "Camera"],
+    "Clothing": ["T-Shirt", "Hoodie", "Jeans", "Jacket", "Sneakers", "Cap"],
+    "Home": ["Lamp", "Blender", "Cookware Set", "Throw Pillow", "Coffee Maker"],
+    "Sports": ["Yoga Mat", "Water Bottle", "Dumbbell Set", "Running Shorts"],
+    "Books": ["Novel", "Cookbook", "Travel Guide", "Biography"],
+}
+_CLOTHING_SIZES = ["S", "M", "L", "XL"]
+_COLORS = ["Black", "White", "Blue", "Red", "Green", "Gray", "Navy"]
+
+# Records generated from one seeding of the random generators; part of the data, unlike the chunk size
+SEED_BLOCK = 1000
+DEFAULT_CHUNK_SIZE = 10000
+
+
+def _rng(seed, kind, block):
+    """Faker and Random instances for one seed block, independent of every other block"""
+    block_seed = ((seed * 1_000_003 + KINDS.index(kind)) * 1_000_003 + block) & 0xFFFFFFFF
+    fake = Faker("en_US")
+    fake.seed_instance(block_seed)
+    return fake, random.Random(block_seed)
+
+
+def _user(index, fake, rng):
+    first_name, last_name = fake.first_name(), fake.last_name()
+    return {
+        "id": str(index + 1),
+        "username": f"{first_name}.{last_name}.{index + 1}@example.com".lower(),
+        "password": fake.password(length=12),
+        "first_name": first_name,
+        "last_name": last_name,
+        "role": "customer",
+        "address": {
+            "street": fake.street_address(),
+            "city": fake.city(),
+            "state": fake.state_abbr(),
+            "zip": fake.zipcode(),
+            "country": "USA",
+        },
+        "phone": fake.numerify("555-###-####"),
+    }
+
+
+def _product(index, fake, rng):
+    category = rng.choice(list(CATEGORIES))
+    noun = rng.choice(CATEGORIES[category])
+    return {
+        "id": str(index + 1),
+        "name": f"{fake.word().capitalize()} {noun} {index + 1}",
+        "price": round(rng.uniform(4.99, 499.99), 2),
+        "description": fake.sentence(nb_words=12),
+        "category": category,
+        "sizes": _CLOTHING_SIZES if category == "Clothing" else ["One Size"],
+        "colors": rng.sample(_COLORS, rng.randint(1, 3)),
+        "stock": rng.randint(0, 500),
+        "rating": round(rng.uniform(1.0, 5.0), 1),
+    }
+
+
+def _cart(index, fake, rng, users, products):
+    return {
+        "id": str(index + 1),
+        "user_id": str(rng.randint(1, users)),
+        "items": [
+            {"productId": str(rng.randint(1, products)), "quantity": rng.randint(1, 3)}
+            for _ in range(rng.randint(1, 5))
+        ],
+    }
+
+
+def _checkout(index, fake, rng, users, products):
+    return {
+        "id": str(index + 1),
+        "user_id": str(rng.randint(1, users)),
+        "paymentDetails": {
+            "method": "credit_card",
+            "cardNumber": fake.credit_card_number(card_type="visa16"),
+            "expiryDate": fake.credit_card_expire(),
+            "cvv": fake.credit_card_security_code(card_type="visa16"),
+        },
+        "shippingAddress": {
+            "street": fake.street_address(),
+            "city": fake.city(),
+            "zipCode": fake.zipcode(),
+            "country": "USA",
+        },
+    }
+
+
+def _make(kind, index, fake, rng, users, products):
+    if kind == "users":
+        return _user(index, fake, rng)
+    if kind == "products":
+        return _product(index, fake, rng)
+    if kind == "carts":
+        return _cart(index, fake, rng, users, products)
+    return _checkout(index, fake, rng, users, products)
+
+
+def iter_records(kind, count, seed=42, users=1000, products=100, start=0):
+    """Yield records ``start`` to ``count - 1`` of ``kind`` one by one.
+
+    ``users`` and ``products`` bound the ids carts and checkouts refer to.
+    """
+    if kind not in KINDS:
+        raise ValueError(f"Unknown record kind '{kind}', expected one of {', '.join(KINDS)}")
+    for block in range(start // SEED_BLOCK, (count + SEED_BLOCK - 1) // SEED_BLOCK):
+        fake, rng = _rng(seed, kind, block)
+        first = block * SEED_BLOCK
+        for index in range(first, min(first + SEED_BLOCK, count)):
+            record = _make(kind, index, fake, rng, users, products)
+            if index >= start:
+                yield record
+
+
+def flatten(record, prefix=""):
+    """Flatten nested dicts to dotted keys; lists of scalars are joined with '|', others JSON-encoded"""
+    flat = {}
+    for key, value in record.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{name}."))
+        elif isinstance(value, list):
+            scalars = all(not isinstance(item, (dict, list)) for item in value)
+            flat[name] = "|".join(str(item) for item in value) if scalars else json.dumps(value)
+        else:
+            flat[name] = value
+    return flat
+
+
+def _render_chunk(task):
+    """Serialize one chunk of records (runs in a worker process)"""
+    kind, chunk, count, seed, users, products, chunk_size, output_format = task
+    first = chunk * chunk_size
+    records = iter_records(kind, min(first + chunk_size, count), seed, users, products, start=first)
+    if output_format == "jsonl":
+        return "".join(json.dumps(record) + "\n" for record in records)
+    buffer = io.StringIO()
+    writer = None
+    for record in records:
+        row = flatten(record)
+        if writer is None:
+            writer = csv.DictWriter(buffer, fieldnames=list(row), lineterminator="\n")
+        writer.writerow(row)
+    return buffer.getvalue()
+
+
+def _csv_header(kind, seed, users, products):
+    row = flatten(next(iter_records(kind, 1, seed, users, products)))
+    return ",".join(row) + "\n"
+
+
+def write(kind, count, path, output_format="jsonl", seed=42, users=1000, products=100,
+          processes=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Generate ``count`` records of ``kind`` into ``path`` using a pool of ``processes`` workers"""
+    if output_format not in FORMATS:
+        raise ValueError(f"Unknown format '{output_format}', expected one of {', '.join(FORMATS)}")
+    tasks = [(kind, chunk, count, seed, users, products, chunk_size, output_format)
+             for chunk in range((count + chunk_size - 1) // chunk_size)]
+    with open(path, "w", newline="") as f:
+        if output_format == "csv" and count:
+            f.write(_csv_header(kind, seed, users, products))
+        if processes == 1 or len(tasks) <= 1:
+            for task in tasks:
+                f.write(_render_chunk(task))
+            return
+        with multiprocessing.Pool(processes) as pool:
+            # imap keeps chunk order while workers run ahead
+            for text in pool.imap(_render_chunk, tasks):
+                f.write(text)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate seeded synthetic e-commerce test data")
+    for kind in KINDS:
+        parser.add_argument(f"--{kind}", type=int, default=0, help=f"Number of {kind} to generate")
+    parser.add_argument("--format", choices=FORMATS, default="jsonl", help="Output format")
+    parser.add_argument("--seed", type=int, default=42, help="Seed; the same seed gives the same data")
+    parser.add_argument("--processes", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Records per work unit (does not change the data)")
+    parser.add_argument("--output-dir", default=".", help="Directory the <kind>.<format> files are written to")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    # Carts and checkouts refer to generated users/products, or to the hand-written files' ids
+    users = args.users or 3
+    products = args.products or 5
+    for kind in KINDS:
+        count = getattr(args, kind)
+        if not count:
+            continue
+        path = os.path.join(args.output_dir, f"{kind}.{args.format}")
+        write(kind, count, path, args.format, args.seed, users, products, args.processes, args.chunk_size)
+        print(f"Wrote {count} {kind} to {path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,7 @@
 import pytest
 import logging
 import allure
+from utils import instrumentation
 from utils.config import Config
 
 # Configure logging
@@ -22,16 +23,11 @@ class BaseTest:
         self.logger.info(f"Testing environment: {config.env}")
         self.logger.info(f"Base URL: {self.base_url}")
         
-        # Add allure environment info if using allure
-        try:
-            allure.attach(
-                f"Browser: {config.browser}\nEnvironment: {config.env}\nBase URL: {self.base_url}",
-                name="Environment Info",
-                attachment_type=allure.attachment_type.TEXT
-            )
-        except Exception:
-            # Allure might not be available
-            pass
+        # Recorded in the buffered step log rather than as a separate attachment per test
+        instrumentation.detail(
+            "Environment Info",
+            f"Browser: {config.browser}, Environment: {config.env}, Base URL: {self.base_url}"
+        )
         
         yield
         
@@ -41,6 +37,10 @@ class BaseTest:
     def take_screenshot(self, name="screenshot"):
         """Take a screenshot and attach to allure report"""
         try:
+            screenshots = getattr(self.driver, "screenshots", None)
+            if screenshots is not None:
+                screenshots.capture(self.driver, name)
+                return
             allure.attach(
                 self.driver.get_screenshot_as_png(),
                 name=name,
@@ -52,8 +52,4 @@ class BaseTest:
     def log_step(self, description):
         """Log a test step with description"""
         self.logger.info(f"Step: {description}")
-        try:
-            allure.step(description)
-        except Exception:
-            # Allure might not be available
-            pass
\ No newline at end of file
+        instrumentation.note(description)
\ No newline at end of file
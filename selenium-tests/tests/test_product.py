@@ -1,7 +1,5 @@
 import pytest
 import allure
-import json
-import os
 from pages.product_page import ProductPage
 from pages.cart_page import CartPage
 from tests.base_test import BaseTest
@@ -13,34 +11,20 @@ class TestProduct(BaseTest):
     """Test cases for product details and cart operations"""
     
     @pytest.fixture
-    def product_data(self):
-        """Load product test data from JSON file"""
-        test_data_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'test_data', 'products.json')
-        try:
-            with open(test_data_path, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            # Return default test data if file not found
-            return {
-                "products": [
-                    {
-                        "id": "1",
-                        "name": "Test Product 1",
-                        "price": 29.99,
-                        "description": "This is a test product description"
-                    }
-                ]
-            }
+    def product_data(self, product_catalog):
+        """First product of the session-wide product catalog"""
+        return product_catalog.first()
     
     @allure.title("View product details")
     @allure.severity(allure.severity_level.NORMAL)
     def test_view_product_details(self, driver, config, product_data):
         """Test viewing product details"""
-        product_id = product_data["products"][0]["id"]
-        expected_name = product_data["products"][0]["name"]
+        product_id = product_data["id"]
+        expected_name = product_data["name"]
         
         self.log_step(f"Open product page for product ID: {product_id}")
-        product_page = ProductPage(driver, config).open_product(product_id)
+        # Title, description and price are then read from one snapshot of the page instead of three lookups
+        product_page = ProductPage(driver, config).open_product(product_id).snapshot()
         
         self.log_step("Verify product title")
         actual_title = product_page.get_product_title()
@@ -60,7 +44,7 @@ class TestProduct(BaseTest):
     @allure.severity(allure.severity_level.CRITICAL)
     def test_add_product_to_cart(self, driver, config, product_data):
         """Test adding a product to the cart"""
-        product_id = product_data["products"][0]["id"]
+        product_id = product_data["id"]
         
         self.log_step(f"Open product page for product ID: {product_id}")
         product_page = ProductPage(driver, config).open_product(product_id)
@@ -92,8 +76,8 @@ class TestProduct(BaseTest):
     @allure.severity(allure.severity_level.NORMAL)
     def test_add_to_wishlist(self, driver, config, product_data):
         """Test adding a product to the wishlist"""
-        product_id = product_data["products"][0]["id"]
-        expected_product_name = product_data["products"][0]["name"]
+        product_id = product_data["id"]
+        expected_product_name = product_data["name"]
 
         self.log_step(f"Open product page for product ID: {product_id}")
         product_page = ProductPage(driver, config).open_product(product_id)
@@ -115,17 +99,14 @@ class TestProduct(BaseTest):
     
     @allure.title("Update product quantity in cart")
     @allure.severity(allure.severity_level.NORMAL)
-    def test_update_product_quantity_in_cart(self, driver, config, product_data):
+    def test_update_product_quantity_in_cart(self, driver, config, product_data, seed_cart):
         """Test updating product quantity in the cart"""
-        product_id = product_data["products"][0]["id"]
+        product_id = product_data["id"]
         
-        self.log_step(f"Open product page for product ID: {product_id}")
-        product_page = ProductPage(driver, config).open_product(product_id)
-        
-        self.log_step("Add product to cart")
-        product_page.add_to_cart()
+        self.log_step(f"Seed the cart with product ID {product_id} through the API")
+        seed_cart((product_id, 1))
         
-        self.log_step("Navigate to cart page")
+        self.log_step("Open cart page")
         cart_page = CartPage(driver, config).open()
         
         self.log_step("Update item quantity to 3")
@@ -139,17 +120,14 @@ class TestProduct(BaseTest):
     
     @allure.title("Remove product from cart")
     @allure.severity(allure.severity_level.NORMAL)
-    def test_remove_product_from_cart(self, driver, config, product_data):
+    def test_remove_product_from_cart(self, driver, config, product_data, seed_cart):
         """Test removing a product from the cart"""
-        product_id = product_data["products"][0]["id"]
+        product_id = product_data["id"]
         
-        self.log_step(f"Open product page for product ID: {product_id}")
-        product_page = ProductPage(driver, config).open_product(product_id)
+        self.log_step(f"Seed the cart with product ID {product_id} through the API")
+        seed_cart((product_id, 1))
         
-        self.log_step("Add product to cart")
-        product_page.add_to_cart()
-        
-        self.log_step("Navigate to cart page")
+        self.log_step("Open cart page")
         cart_page = CartPage(driver, config).open()
         
         initial_count = cart_page.get_cart_items_count()
@@ -168,17 +146,15 @@ class TestProduct(BaseTest):
     
     @allure.title("Proceed to checkout from cart")
     @allure.severity(allure.severity_level.CRITICAL)
-    def test_proceed_to_checkout(self, driver, config, product_data):
+    @pytest.mark.step_retry
+    def test_proceed_to_checkout(self, driver, config, product_data, seed_cart):
         """Test proceeding to checkout from the cart"""
-        product_id = product_data["products"][0]["id"]
+        product_id = product_data["id"]
         
-        self.log_step(f"Open product page for product ID: {product_id}")
-        product_page = ProductPage(driver, config).open_product(product_id)
+        self.log_step(f"Seed the cart with product ID {product_id} through the API")
+        seed_cart((product_id, 1))
         
-        self.log_step("Add product to cart")
-        product_page.add_to_cart()
-        
-        self.log_step("Navigate to cart page")
+        self.log_step("Open cart page")
         cart_page = CartPage(driver, config).open()
         
         self.log_step("Proceed to checkout")
@@ -20,7 +20,7 @@ class TestSearch(BaseTest):
             "This test verifies that a user can search for an existing product "
             "and the product is displayed in the search results."
         )
-        driver.get(self.base_url) # Start at the homepage or a page with search
+        base_page = BasePage(driver, config).navigate_to("/") # Start at the homepage or a page with search
         
         # For this example, let's assume the search bar is available on the login page or homepage
         # If login is required to search, perform login first
@@ -30,8 +30,6 @@ class TestSearch(BaseTest):
 
         # Using BasePage's perform_search, assuming search bar is globally accessible
         # If search is on a specific page, instantiate that page first
-        base_page = BasePage(driver, config) # Or any page object that inherits BasePage
-        
         searchable_product = get_product_by_name("Premium Wireless Headphones") # Get a product from test data
         if not searchable_product:
             pytest.fail("Test data 'Premium Wireless Headphones' not found for search test.")
@@ -61,8 +59,7 @@ class TestSearch(BaseTest):
         allure.dynamic.description(
             "This test verifies that searching for a non-existent product displays a 'no results' message."
         )
-        driver.get(self.base_url)
-        base_page = BasePage(driver, config)
+        base_page = BasePage(driver, config).navigate_to("/")
         search_term = "NonExistentProductXYZ123"
 
         with allure.step(f"Perform search for non-existent product: {search_term}"):
@@ -83,8 +80,7 @@ class TestSearch(BaseTest):
         allure.dynamic.description(
             "This test verifies that searching with a partial term returns relevant products."
         )
-        driver.get(self.base_url)
-        base_page = BasePage(driver, config)
+        base_page = BasePage(driver, config).navigate_to("/")
         
         # Assuming 'Premium Wireless Headphones' and 'Smart Fitness Watch' exist from products.json
         partial_search_term = "Wireless"
@@ -116,9 +112,8 @@ class TestSearch(BaseTest):
             "This test verifies the application's behavior when an empty search term is submitted. "
             "(e.g., stays on the page, shows a message, or shows all products - depends on app behavior)"
         )
-        driver.get(self.base_url)
+        base_page = BasePage(driver, config).navigate_to("/")
         initial_url = driver.current_url
-        base_page = BasePage(driver, config)
         search_term = ""
 
         with allure.step(f"Perform search with empty term"):
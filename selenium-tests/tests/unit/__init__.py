@@ -0,0 +1 @@
+# Browserless page-object tests on utils.fake_driver
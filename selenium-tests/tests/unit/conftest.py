@@ -0,0 +1,67 @@
+import os
+import sys
+
+import pytest
+
+from local_app import views
+from local_app.store import Session
+from utils.config import Config
+
+# The load and API test tools next to selenium-tests are run as scripts; their modules are imported from there
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+for _tool_dir in ("load-tests", "postman-tests"):
+    sys.path.append(os.path.join(_REPO_ROOT, _tool_dir))
+
+
+@pytest.fixture
+def storefront(product_catalog):
+    """Static pages of the stand-in app: an empty session's cart and the catalog's search and product pages"""
+    session = Session("unit")
+    products = list(product_catalog)
+    wireless = [product for product in products if "wireless" in product["name"].lower()]
+    pages = {
+        "/": views.home(session, products),
+        "/cart": views.cart(session),
+        "/search?q=Wireless": views.search_results(session, "Wireless", "relevance", wireless),
+        "/search?q=Wireless&sort=price-asc": views.search_results(session, "Wireless", "price-asc", wireless),
+        "/search?q=nothing-matches": views.search_results(session, "nothing-matches", "relevance", []),
+    }
+    for product in products:
+        pages[f"/product/{product['id']}"] = views.product_detail(session, product, [])
+    return pages
+
+
+@pytest.fixture
+def fake_driver(storefront):
+    from utils.fake_driver import FakeDriver
+
+    return FakeDriver(storefront)
+
+
+@pytest.fixture(scope="module")
+def live_app(config):
+    from local_app import LocalApp
+
+    app = LocalApp(extra_users=[config.get_credentials(user_type) for user_type in config.user_types]).start()
+    yield app
+    app.stop()
+
+
+@pytest.fixture
+def live_config(config, live_app):
+    """Its own Config pointed at the stand-in app; the session's config is left untouched"""
+    live = Config(config.browser, "local", config.profile)
+    live.use_local_app(live_app.base_url, live_app.api_url)
+    return live
+
+
+@pytest.fixture
+def live_driver(live_app):
+    """A fake driver that fetches pages from the stand-in app, so links and forms really navigate"""
+    # Imported here so that collecting the suite never loads bs4 or requests
+    import requests
+    from utils.fake_driver import FakeDriver
+
+    driver = FakeDriver(session=requests.Session())
+    yield driver
+    driver.quit()
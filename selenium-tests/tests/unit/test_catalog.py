@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from test_data.catalog import ProductCatalog
+
+pytestmark = pytest.mark.unit
+
+PRODUCTS = [
+    {"id": "1", "name": "Wireless Mouse", "price": 19.99, "category": "Electronics", "colors": ["Black"]},
+    {"id": "2", "name": "Desk Lamp", "price": 34.5, "category": "Home"},
+    {"id": "3", "name": "USB Hub", "price": 12.0, "category": "electronics"},
+]
+
+
+@pytest.fixture(params=["json", "jsonl"])
+def catalog(request, tmp_path):
+    """The same products from a JSON and from a JSONL catalog"""
+    path = tmp_path / f"products.{request.param}"
+    if request.param == "json":
+        path.write_text(json.dumps({"products": PRODUCTS}))
+    else:
+        path.write_text("".join(json.dumps(product) + "\n" for product in PRODUCTS))
+    catalog = ProductCatalog(str(path))
+    yield catalog
+    catalog.close()
+
+
+def test_lookups_by_id_name_and_category(catalog):
+    assert catalog.by_id(2)["name"] == "Desk Lamp"
+    assert catalog.by_name("wireless mouse")["id"] == "1"
+    assert [product["id"] for product in catalog.in_category("ELECTRONICS")] == ["1", "3"]
+    assert catalog.by_id("404") is None
+    assert len(catalog) == 3 and [product["id"] for product in catalog] == ["1", "2", "3"]
+
+
+def test_changing_a_returned_product_leaves_the_catalog_intact(catalog):
+    product = catalog.by_id("1")
+    product["price"] = 0
+    product["colors"].append("Pink")
+    next(iter(catalog))["name"] = "Changed"
+
+    assert catalog.by_id("1") == PRODUCTS[0]
@@ -0,0 +1,29 @@
+import pytest
+
+from plugins.duration_scheduler import plan_assignment
+
+pytestmark = pytest.mark.unit
+
+
+def test_longest_tests_are_spread_first():
+    collection = ["t::slow", "t::medium", "t::fast", "t::quick"]
+    history = {"t::slow": {"duration": 10.0}, "t::medium": {"duration": 6.0},
+               "t::fast": {"duration": 3.0}, "t::quick": {"duration": 2.0}}
+
+    assignment, loads = plan_assignment(collection, history, 2)
+
+    assert assignment == [[0], [1, 2, 3]]
+    assert loads == [10.0, 11.0]
+
+
+def test_groups_stay_on_one_worker_and_unknown_tests_take_the_median():
+    collection = ["t::login_a", "t::login_b", "t::new", "t::other"]
+    history = {"t::login_a": {"duration": 4.0, "group": "login_as"},
+               "t::login_b": {"duration": 4.0, "group": "login_as"},
+               "t::other": {"duration": 2.0}}
+
+    assignment, loads = plan_assignment(collection, history, 2)
+
+    # The median of the known durations (4.0) stands in for t::new
+    assert assignment == [[0, 1], [2, 3]]
+    assert loads == [8.0, 6.0]
@@ -0,0 +1,33 @@
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def generator():
+    # Imported here so that collecting the suite never loads faker
+    from test_data import generator
+
+    return generator
+
+
+@pytest.mark.parametrize("output_format", ["jsonl", "csv"])
+def test_output_is_the_same_for_any_number_of_processes_and_chunk_size(generator, tmp_path, output_format):
+    serial, parallel = tmp_path / f"serial.{output_format}", tmp_path / f"parallel.{output_format}"
+
+    generator.write("checkouts", 25, str(serial), output_format, seed=7, processes=1, chunk_size=4)
+    generator.write("checkouts", 25, str(parallel), output_format, seed=7, processes=3, chunk_size=7)
+
+    assert serial.read_bytes() == parallel.read_bytes()
+    assert len(serial.read_text().splitlines()) == 25 + (output_format == "csv")
+
+
+def test_records_depend_only_on_seed_and_index(generator):
+    count = generator.SEED_BLOCK + 10
+    records = list(generator.iter_records("carts", count, seed=3, users=5, products=8))
+
+    # Starting anywhere, in the first seed block or the next, yields the same records
+    for start in (6, generator.SEED_BLOCK - 2, generator.SEED_BLOCK + 3):
+        assert list(generator.iter_records("carts", count, seed=3, users=5, products=8, start=start)) == records[start:]
+    assert records != list(generator.iter_records("carts", count, seed=4, users=5, products=8))
+    assert all(1 <= int(item["productId"]) <= 8 for record in records for item in record["items"])
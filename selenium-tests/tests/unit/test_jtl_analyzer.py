@@ -0,0 +1,42 @@
+import pytest
+
+from jtl_analyzer import analyze, detect_format, read_csv_samples, read_xml_samples
+
+pytestmark = pytest.mark.unit
+
+# (timeStamp, elapsed, label, success): two 10s buckets of GET Home, one failed POST Checkout
+SAMPLES = [
+    (1_000, 100, "GET Home", True),
+    (2_000, 300, "GET Home", True),
+    (3_000, 1_200, "GET Home", True),
+    (4_000, 3_000, "GET Home", True),
+    (12_000, 200, "GET Home", True),
+    (13_000, 400, "POST Checkout", False),
+]
+
+
+def test_apdex_percentiles_and_time_series():
+    summary = analyze(iter(SAMPLES), bucket_seconds=10, apdex_t=500)
+
+    home = summary["labels"]["GET Home"]
+    # 3 satisfied (<= 500 ms), 1 tolerating (<= 2 s), 1 frustrated
+    assert home["apdex"] == pytest.approx((3 + 1 / 2) / 5)
+    assert home["p50_ms"] == pytest.approx(300, rel=0.01)
+    assert home["max_ms"] == 3000
+    assert summary["total"]["errors"] == 1 and summary["labels"]["POST Checkout"]["apdex"] == 0
+    assert [bucket["start"] for bucket in summary["time_series"]] == [0, 10_000]
+    assert summary["time_series"][0]["GET Home"]["throughput_per_second"] == 0.4
+
+
+def test_csv_and_xml_results_read_the_same(tmp_path):
+    csv_path, xml_path = tmp_path / "results.jtl", tmp_path / "results.xml"
+    csv_path.write_text("timeStamp,elapsed,label,success\n"
+                        + "".join(f"{ts},{t},{label},{str(ok).lower()}\n" for ts, t, label, ok in SAMPLES))
+    # Sub-samples (embedded resources) are not counted on their own
+    xml_path.write_text("<testResults>" + "".join(
+        f'<httpSample ts="{ts}" t="{t}" lb="{label}" s="{str(ok).lower()}">'
+        f'<httpSample ts="{ts}" t="1" lb="resource" s="true"/></httpSample>'
+        for ts, t, label, ok in SAMPLES) + "</testResults>")
+
+    assert (detect_format(str(csv_path)), detect_format(str(xml_path))) == ("csv", "xml")
+    assert list(read_csv_samples(str(csv_path))) == SAMPLES == list(read_xml_samples(str(xml_path)))
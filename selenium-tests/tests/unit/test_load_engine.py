@@ -0,0 +1,43 @@
+import pytest
+
+from load_engine import LatencyHistogram, arrival_offsets
+from scenarios import CheckoutScenario, ProductScenario
+
+pytestmark = pytest.mark.unit
+
+
+def test_histogram_percentiles_stay_within_the_bucket_error():
+    histogram, other = LatencyHistogram(), LatencyHistogram()
+    for microseconds in range(1, 10001):
+        (histogram if microseconds % 2 else other).record(microseconds * 100)
+    histogram.merge(other)
+
+    assert histogram.total == 10000
+    assert histogram.percentile(50) == pytest.approx(500_000, rel=1 / 256)
+    assert histogram.percentile(99.9) == pytest.approx(999_000, rel=1 / 256)
+    assert histogram.summary()["max"] == 1000.0
+
+
+def test_arrival_schedules_are_open_loop_and_seeded():
+    assert list(arrival_offsets(4, 1)) == [0.0, 0.25, 0.5, 0.75]
+
+    poisson = list(arrival_offsets(200, 5, "poisson", seed=1))
+    assert poisson == list(arrival_offsets(200, 5, "poisson", seed=1))
+    assert 900 < len(poisson) < 1100 and poisson == sorted(poisson)
+
+
+def test_scenarios_cycle_their_inputs(tmp_path):
+    products = ProductScenario(["1", "2"])
+    assert [products.build_request(i).path for i in range(3)] == [
+        "/api/v1/products/1", "/api/v1/products/2", "/api/v1/products/1"]
+
+    data = tmp_path / "checkouts.csv"
+    data.write_text("id,paymentDetails.cvv,shippingAddress.city\n1,111,Springfield\n")
+    checkout = CheckoutScenario(data_file=str(data))
+    assert [checkout.build_request(i).body for i in range(2)] == [
+        b'{"paymentDetails": {"cvv": "111"}, "shippingAddress": {"city": "Springfield"}}'] * 2
+    assert checkout.check(None, 500, b"") == (False, "Expected response code 200 or 201, got 500")
+
+    data.write_text("id,paymentDetails.cvv,shippingAddress.city\n\n")
+    with pytest.raises(ValueError, match="has no rows"):
+        CheckoutScenario(data_file=str(data))
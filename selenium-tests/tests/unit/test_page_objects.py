@@ -0,0 +1,186 @@
+import pytest
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, WebDriverException
+
+from local_app import views
+from local_app.store import Session
+from pages.base_page import BasePage
+from pages.cart_page import CartPage
+from pages.locators import By
+from pages.login_page import LoginPage
+from pages.product_page import ProductPage
+from pages.search_results_page import SearchResultsPage
+from utils.cart_api import CartApi
+from utils.command_profiler import CommandLog
+
+pytestmark = pytest.mark.unit
+
+
+def test_cart_page_parses_prices_quantities_and_totals(fake_driver, config):
+    session = Session("cart")
+    session.add_item({"id": "99", "name": "Grand Piano", "price": 1299.99}, 2)
+    fake_driver.pages["/cart"] = views.cart(session)
+
+    cart_page = CartPage(fake_driver, config).open()
+
+    assert cart_page.get_cart_items_count() == 1
+    assert cart_page.get_item_name(0) == "Grand Piano"
+    assert cart_page.get_item_price(0) == 1299.99
+    assert cart_page.get_item_quantity(0) == 2
+    assert cart_page.get_subtotal() == 2599.98
+    assert cart_page.get_total() == session.totals()["total"]
+    assert not cart_page.is_cart_empty()
+
+
+def test_empty_cart(fake_driver, config):
+    cart_page = CartPage(fake_driver, config).open()
+
+    assert cart_page.is_cart_empty()
+    assert cart_page.get_cart_items_count() == 0
+
+
+def test_search_results_are_extracted_and_clicked_by_name(fake_driver, config):
+    results_page = SearchResultsPage(fake_driver, config)
+    results_page.navigate_to("/search?q=Wireless")
+
+    results = results_page.get_results()
+    assert [result["name"] for result in results] == ["Premium Wireless Headphones"]
+    assert results[0]["price"] == "$129.99"
+    assert results[0]["link"] == f"{config.base_url}/product/1"
+    assert results_page.is_product_listed("premium wireless HEADPHONES")
+    assert not results_page.is_product_listed("Leather Wallet")
+
+    assert results_page.click_product_by_name("premium wireless headphones")
+    assert fake_driver.current_url.endswith("/product/1")
+    assert ProductPage(fake_driver, config).get_product_title() == "Premium Wireless Headphones"
+
+
+def test_search_without_results(fake_driver, config):
+    results_page = SearchResultsPage(fake_driver, config)
+    results_page.navigate_to("/search?q=nothing-matches")
+
+    assert results_page.is_no_results_message_displayed()
+    assert results_page.get_results() == []
+    assert results_page.get_results_count() == 0
+
+
+def test_perform_search_submits_the_header_form(fake_driver, config):
+    home = BasePage(fake_driver, config).navigate_to("/")
+
+    results_page = home.perform_search("Wireless")
+
+    assert fake_driver.current_url == f"{config.base_url}/search?q=Wireless"
+    assert results_page.get_product_names() == ["Premium Wireless Headphones"]
+
+
+def test_sort_option_resubmits_the_search(fake_driver, config):
+    results_page = SearchResultsPage(fake_driver, config)
+    results_page.navigate_to("/search?q=Wireless")
+
+    results_page.select_sort_option("Price: Low to High")
+
+    assert fake_driver.current_url.endswith("/search?q=Wireless&sort=price-asc")
+
+
+def test_product_page_reads_details_and_options(fake_driver, config):
+    product_page = ProductPage(fake_driver, config).open_product("1")
+
+    assert product_page.get_product_price() == 129.99
+    assert product_page.select_color("blue") is product_page
+    with pytest.raises(ValueError):
+        product_page.select_color("Purple")
+
+
+def test_xpath_and_link_text_locators(fake_driver, config):
+    BasePage(fake_driver, config).navigate_to("/search?q=Wireless")
+
+    assert fake_driver.find_element(*BasePage._search_submit_button).text == "Search"
+    assert fake_driver.find_element(*SearchResultsPage._filter_category_button).text == "Category"
+    assert fake_driver.find_element(By.LINK_TEXT, "Cart (0)").get_attribute("href") == f"{config.base_url}/cart"
+    with pytest.raises(NoSuchElementException):
+        fake_driver.find_element(By.XPATH, "//button[@type='reset']")
+
+
+def test_elements_go_stale_after_navigation(fake_driver, config):
+    page = BasePage(fake_driver, config).navigate_to("/")
+    search_input = page.find_element(BasePage._search_input)
+
+    page.navigate_to("/cart")
+
+    with pytest.raises(StaleElementReferenceException):
+        search_input.get_attribute("value")
+
+
+def test_commands_are_counted_and_unknown_scripts_rejected(fake_driver, config):
+    results_page = SearchResultsPage(fake_driver, config)
+    results_page.navigate_to("/search?q=Wireless")
+    fake_driver.command_log = CommandLog()
+
+    results_page.get_results()
+
+    assert [command for command, _, _ in fake_driver.command_log.entries] == ["findElements", "executeScript"]
+    with pytest.raises(WebDriverException):
+        fake_driver.execute_script("return window.innerWidth")
+
+
+def test_navigation_to_the_unchanged_current_page_is_skipped(fake_driver, config):
+    product_page = ProductPage(fake_driver, config).open_product("1")
+    fake_driver.command_log = CommandLog()
+
+    product_page.open_product("1")
+    assert [command for command, _, _ in fake_driver.command_log.entries] == ["executeScript"]
+
+    product_page.set_quantity(3)
+    product_page.open_product("1")
+    assert "get" in [command for command, _, _ in fake_driver.command_log.entries]
+    assert product_page.get_element_attribute(ProductPage.QUANTITY_INPUT, "value") == "1"
+
+    # Commands sent around the page objects count too
+    fake_driver.find_element(*ProductPage.QUANTITY_INPUT).send_keys("2")
+    fake_driver.command_log = CommandLog()
+    product_page.open_product("1")
+    assert "get" in [command for command, _, _ in fake_driver.command_log.entries]
+
+
+def test_snapshot_serves_reads_until_the_next_action(fake_driver, config):
+    product_page = ProductPage(fake_driver, config).open_product("1").snapshot()
+    fake_driver.command_log = CommandLog()
+
+    assert product_page.get_product_title() == "Premium Wireless Headphones"
+    assert product_page.get_product_price() == 129.99
+    assert product_page.get_element_attribute(ProductPage.QUANTITY_INPUT, "value") == "1"
+    assert fake_driver.command_log.entries == []
+
+    product_page.set_quantity(2)
+    assert product_page.get_element_attribute(ProductPage.QUANTITY_INPUT, "value") == "2"
+
+
+def test_login_against_the_local_app(live_driver, live_config):
+    login_page = LoginPage(live_driver, live_config).open()
+    login_page.login("customer@example.com", "wrong-password")
+    assert login_page.get_error_message()
+
+    login_page.login("customer@example.com", "customer123")
+
+    assert login_page.is_logged_in()
+    assert any(cookie["name"] == "session_id" for cookie in live_driver.get_cookies())
+
+
+def test_cart_seeded_through_the_api(live_driver, live_config):
+    cart_api = CartApi(live_config)
+    state = cart_api.login("customer_user")
+    cart_api.add_item(state, "1", 2)
+    cart_api.bind(live_driver, state)
+    assert live_driver.local_storage == {"authToken": state.token}
+
+    cart_page = CartPage(live_driver, live_config).open()
+    assert cart_page.get_item_quantity(0) == 2
+
+    cart_api.clear(state)
+    assert cart_page.open().is_cart_empty()
+
+    # An unbound browser keeps its page state through later cart changes
+    cart_api.unbind(state)
+    page_state = live_driver.page_state
+    cart_api.add_item(state, "1", 1)
+    assert page_state is not None and live_driver.page_state is page_state
+    cart_api.close()
@@ -0,0 +1,80 @@
+import datetime
+import json
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+class Response:
+    """The parts of a requests.Response the sandbox reads"""
+
+    def __init__(self, status_code, body, reason="OK"):
+        self.status_code = status_code
+        self.reason = reason
+        self.text = json.dumps(body)
+        self.elapsed = datetime.timedelta(milliseconds=42)
+
+    def json(self):
+        return json.loads(self.text)
+
+
+@pytest.fixture(scope="module")
+def runner():
+    # Imported here so that collecting the suite never loads requests
+    import run_collection
+
+    return run_collection
+
+
+def _run(runner, response, script, variables=None):
+    sandbox = runner.Sandbox(response, variables or runner.Variables({}))
+    sandbox.run(script.strip().splitlines())
+    return sandbox.results
+
+
+def test_passing_tests_and_variables_set_by_scripts(runner):
+    variables = runner.Variables({"variable": [{"key": "baseUrl", "value": "http://localhost"}]})
+    results = _run(runner, Response(200, {"token": "abc", "items": [{"id": "item_1"}]}), """
+        pm.test("Status code is 200", function () { pm.response.to.have.status(200); });
+        var jsonData = pm.response.json();
+        pm.test("Token returned", function () {
+            pm.expect(jsonData).to.have.property('token');
+            pm.expect(jsonData.items.length).to.be.above(0);
+        });
+        if (jsonData.token) { pm.environment.set("authToken", jsonData.token); }
+        pm.environment.set("cartItemId", jsonData.items[0].id);
+        // Basic schema validation
+        pm.test("Schema is valid", function() { pm.response.to.have.jsonSchema({type: 'object', required: ['token']}); });
+    """, variables)
+
+    assert results == [("Status code is 200", None), ("Token returned", None), ("Schema is valid", None)]
+    assert variables.resolve("{{baseUrl}}/cart/items/{{cartItemId}}?t={{authToken}}&x={{unknown}}") == (
+        "http://localhost/cart/items/item_1?t=abc&x={{unknown}}")
+
+
+def test_failures_are_reported_per_test_and_unsupported_statements_as_script_errors(runner):
+    results = _run(runner, Response(404, {"error": "not found"}, reason="Not Found"), """
+        pm.test("Status code is 200", function () { pm.response.to.have.status(200); });
+        pm.test("Has id", function () { pm.expect(pm.response.json()).to.not.have.property('error'); });
+        console.log(pm.response.code);
+    """)
+
+    assert results[0] == ("Status code is 200", "expected response to have status 200 but got 404")
+    assert results[1] == ("Has id", "expected {'error': 'not found'} to not have property 'error'")
+    assert results[2][1].startswith("ScriptError: Unsupported statement")
+
+
+def test_folders_wait_for_the_variables_they_read_and_for_earlier_state_changes(runner):
+    def folder(*requests):
+        return {"item": [{"request": {"method": method, "url": url},
+                          "event": [{"listen": "test", "script": {"exec": [script]}}]}
+                         for method, url, script in requests]}
+
+    folders = [
+        folder(("POST", "{{baseUrl}}/auth/login", "pm.environment.set('authToken', 'x')")),
+        folder(("GET", "{{baseUrl}}/products", "")),
+        folder(("POST", "{{baseUrl}}/cart/items?token={{authToken}}", "")),
+    ]
+
+    assert runner.folder_dependencies(folders) == {0: set(), 1: set(), 2: {0}}
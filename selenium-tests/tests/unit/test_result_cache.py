@@ -0,0 +1,87 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from plugins.result_cache import ResultCache
+from plugins.test_impact import MAP_CACHE_KEY
+
+pytestmark = pytest.mark.unit
+
+NODEID = "tests/test_home.py::test_home"
+# What test_home touched when it was recorded
+RECORDED = {NODEID: {"commit": None, "symbols": ["pages/home_page.py::HomePage.open"], "locators": [],
+                     "data": ["test_data/products.json#1"]}}
+
+
+class Cache:
+    """In-memory stand-in for the pytest cache; values go through JSON like the real one"""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key, default):
+        return json.loads(self.values[key]) if key in self.values else default
+
+    def set(self, key, value):
+        self.values[key] = json.dumps(value)
+
+
+@pytest.fixture
+def pytest_config(tmp_path):
+    for path in ("tests/test_home.py", "pages/home_page.py", "pages/cart_page.py", "test_data/products.json"):
+        (tmp_path / path).parent.mkdir(exist_ok=True)
+        (tmp_path / path).write_text(path)
+    ini = {"result_cache_ttl_hours": "24", "impact_core_files": ["conftest.py"]}
+    options = {"--build-id": "1.0"}
+    return SimpleNamespace(rootpath=tmp_path, cache=Cache(), getini=ini.get, getoption=options.get, ini=ini,
+                           options=options, option=SimpleNamespace(browser="chrome", env="qa", profile=None),
+                           pluginmanager=SimpleNamespace(get_plugin=lambda name: None))
+
+
+def _run(config, passed=True):
+    """One session running test_home; returns True when it was reported as a cached pass"""
+    cache = ResultCache(config)
+    try:
+        cache.pytest_runtest_setup(SimpleNamespace(nodeid=NODEID))
+    except pytest.skip.Exception:
+        return True
+    for when in ("setup", "call", "teardown"):
+        cache.pytest_runtest_logreport(SimpleNamespace(nodeid=NODEID, when=when, duration=0.5,
+                                                       passed=passed or when != "call"))
+    # The impact map is recorded while the test runs and saved when the session ends
+    config.pluginmanager.get_plugin = {"test_impact": SimpleNamespace(recorded=RECORDED)}.get
+    cache.pytest_sessionfinish(None)
+    config.cache.set(MAP_CACHE_KEY, RECORDED)
+    return False
+
+
+def test_pass_is_cached_from_the_next_run_until_a_touched_file_changes(pytest_config):
+    assert [_run(pytest_config), _run(pytest_config)] == [False, True]
+
+    # Not touched by the test
+    (pytest_config.rootpath / "pages/cart_page.py").write_text("changed")
+    assert _run(pytest_config)
+
+    (pytest_config.rootpath / "pages/home_page.py").write_text("changed")
+    assert [_run(pytest_config), _run(pytest_config)] == [False, True]
+
+
+def test_build_id_and_ttl_changes_run_the_test_again(pytest_config):
+    _run(pytest_config)
+
+    pytest_config.options["--build-id"] = "1.1"
+    assert [_run(pytest_config), _run(pytest_config)] == [False, True]
+
+    pytest_config.ini["result_cache_ttl_hours"] = "0"
+    assert not _run(pytest_config)
+
+
+def test_failures_are_not_stored_and_drop_the_cached_pass(pytest_config):
+    assert not _run(pytest_config, passed=False)
+    assert not _run(pytest_config)
+
+    (pytest_config.rootpath / "test_data/products.json").write_text("changed")
+    assert not _run(pytest_config, passed=False)
+    (pytest_config.rootpath / "test_data/products.json").write_text("test_data/products.json")
+    assert not _run(pytest_config)
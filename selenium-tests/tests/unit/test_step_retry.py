@@ -0,0 +1,78 @@
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+
+from pages.product_page import ProductPage
+from utils.fake_driver import FakeElement
+from utils.step_retry import StepRetryBudget
+
+pytestmark = pytest.mark.unit
+
+
+class Screenshots:
+    """Stand-in for the screenshot service: the names of the captures"""
+
+    def __init__(self):
+        self.names = []
+
+    def capture(self, driver, name):
+        self.names.append(name)
+
+
+@pytest.fixture
+def flaky_element(monkeypatch):
+    """The next ``count`` calls of a ``FakeElement`` method fail as if the element had been re-rendered"""
+    failures = {}
+
+    def fail(count, method="click"):
+        if method not in failures:
+            original = getattr(FakeElement, method)
+
+            def flaky(element, *args):
+                if failures[method]:
+                    failures[method] -= 1
+                    raise StaleElementReferenceException("element re-rendered")
+                return original(element, *args)
+
+            monkeypatch.setattr(FakeElement, method, flaky)
+        failures[method] = count
+    return fail
+
+
+def test_transient_click_failure_is_retried_in_place(fake_driver, config, flaky_element):
+    fake_driver.step_retries = StepRetryBudget(max_attempts=3, max_retries=5, delay=0)
+    product_page = ProductPage(fake_driver, config).open_product("1")
+    flaky_element(2)
+
+    product_page.click_reviews_tab()
+
+    assert fake_driver.current_url.endswith("/product/1#reviews")
+    assert [(step, attempt) for step, attempt, _ in fake_driver.step_retries.entries] == [
+        ("BasePage.click_element", 1), ("BasePage.click_element", 2)]
+
+
+def test_retries_are_off_without_a_budget_and_bounded_with_one(fake_driver, config, flaky_element):
+    product_page = ProductPage(fake_driver, config).open_product("1")
+    flaky_element(1)
+    with pytest.raises(StaleElementReferenceException):
+        product_page.click_reviews_tab()
+
+    fake_driver.step_retries = StepRetryBudget(max_attempts=5, max_retries=1, delay=0)
+    flaky_element(2)
+    with pytest.raises(StaleElementReferenceException):
+        product_page.click_reviews_tab()
+    assert fake_driver.step_retries.remaining == 0
+
+
+def test_failure_screenshot_is_taken_only_when_the_step_gives_up(fake_driver, config, flaky_element):
+    fake_driver.screenshots = Screenshots()
+    fake_driver.step_retries = StepRetryBudget(max_attempts=2, max_retries=5, delay=0)
+    product_page = ProductPage(fake_driver, config).open_product("1")
+
+    flaky_element(1, "send_keys")
+    product_page.set_quantity(2)
+    assert fake_driver.screenshots.names == []
+
+    flaky_element(2, "send_keys")
+    with pytest.raises(StaleElementReferenceException):
+        product_page.set_quantity(3)
+    assert fake_driver.screenshots.names == ["enter_text_error_id_quantity"]
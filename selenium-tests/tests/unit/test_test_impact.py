@@ -0,0 +1,58 @@
+import inspect
+import json
+import os
+import sys
+
+import pytest
+
+from pages import cart_page
+from plugins.test_impact import Impact, ImpactRecord, ImpactRecorder, changed_symbols
+from test_data.catalog import ProductCatalog
+
+pytestmark = pytest.mark.unit
+
+ROOTDIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _line_of(source, text):
+    return next(number for number, line in enumerate(source.splitlines(), 1) if text in line)
+
+
+def test_changed_lines_map_to_page_object_members():
+    source = inspect.getsource(cart_page)
+
+    assert changed_symbols(source, {_line_of(source, "CART_ITEMS = ")}) == {"CartPage.CART_ITEMS"}
+    assert changed_symbols(source, {_line_of(source, "def get_item_price")}) == {"CartPage.get_item_price"}
+    # Imports affect the whole module
+    assert changed_symbols(source, {1}) is None
+
+
+def test_changed_locator_affects_tests_using_it_or_its_methods():
+    line = _line_of(inspect.getsource(cart_page), "CART_ITEMS = ")
+    impact = Impact.from_changes({"pages/cart_page.py": {line}}, ROOTDIR, "HEAD")
+
+    def entry(symbols=(), locators=()):
+        return {"symbols": list(symbols), "locators": list(locators), "data": []}
+
+    assert impact.affects("tests/test_product.py::test_a", entry(locators=["CartPage.CART_ITEMS"]))
+    assert impact.affects("tests/test_product.py::test_b", entry(["pages/cart_page.py::CartPage.get_item_price"]))
+    assert not impact.affects("tests/test_product.py::test_c", entry(["pages/cart_page.py::CartPage.get_tax"]))
+    assert not impact.affects("tests/test_login.py::test_d", entry(["pages/login_page.py::LoginPage.login"]))
+
+
+def test_catalogs_outside_the_rootdir_are_not_recorded(tmp_path):
+    outside = tmp_path / "products.json"
+    outside.write_text(json.dumps({"products": [{"id": "1", "name": "Wireless Mouse"}]}))
+    recorder = ImpactRecorder(ROOTDIR)
+    recorder.recording = ImpactRecord()
+
+    # This test's own recording is put back afterwards
+    previous = sys.getprofile()
+    sys.setprofile(recorder)
+    try:
+        ProductCatalog(str(outside)).by_id("1")
+        ProductCatalog(os.path.join(ROOTDIR, "test_data", "products.json")).by_id("1")
+    finally:
+        sys.setprofile(previous)
+
+    assert recorder.recording.data == {"test_data/products.json#1"}
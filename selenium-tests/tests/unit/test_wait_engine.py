@@ -0,0 +1,54 @@
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from pages import scripts
+from pages.locators import By
+from pages.product_page import ProductPage
+from utils.command_profiler import CommandLog
+from utils.wait_engine import WaitEngine, WaitLedger
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def observed_page(fake_driver, config, monkeypatch):
+    """Product page whose locator waits use the observer backend"""
+    monkeypatch.setenv("WAIT_BACKEND", "observer")
+    fake_driver.wait_ledger = WaitLedger()
+    product_page = ProductPage(fake_driver, config).open_product("1")
+    fake_driver.command_log = CommandLog()
+    return product_page
+
+
+def test_locator_waits_resolve_in_the_page(observed_page, fake_driver):
+    assert observed_page.is_element_visible(ProductPage.PRODUCT_TITLE)
+    assert not observed_page.is_element_visible((By.ID, "not-on-the-page"), timeout=0.05)
+
+    assert [command for command, _, _ in fake_driver.command_log.entries] == ["executeAsyncScript"] * 2
+    assert [(entry["backend"], entry["outcome"]) for entry in fake_driver.wait_ledger.entries[-2:]] == [
+        ("observer", "met"), ("observer", "timeout")]
+
+
+def test_waits_fall_back_to_polling_when_the_script_fails(observed_page, fake_driver):
+    def unloaded(*args):
+        raise WebDriverException("document unloaded while waiting for result")
+    fake_driver.stub_script(scripts.OBSERVE_CONDITION, unloaded)
+
+    assert observed_page.get_product_title() == "Premium Wireless Headphones"
+    assert fake_driver.wait_ledger.entries[-1]["backend"] == "poll"
+
+
+def test_waits_are_polled_when_the_script_timeout_leaves_no_slice(observed_page, fake_driver):
+    observed_page.wait.script_timeout = 1
+
+    assert observed_page.is_element_visible(ProductPage.PRODUCT_TITLE)
+    assert "executeAsyncScript" not in [command for command, _, _ in fake_driver.command_log.entries]
+    assert fake_driver.wait_ledger.entries[-1]["backend"] == "poll"
+
+
+def test_polling_delay_follows_the_backoff_schedule():
+    # Polls at 0, 0.1, 0.25, 0.475, ... seconds
+    engine = WaitEngine(None, poll_interval=0.1, backoff=1.5, max_poll_interval=1.0)
+
+    assert engine.polling_delay(0) == 0
+    assert engine.polling_delay(0.3) == pytest.approx(0.175)
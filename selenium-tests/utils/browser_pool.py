@@ -0,0 +1,138 @@
+import logging
+import threading
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.command_profiler import origin
+
+logger = logging.getLogger(__name__)
+
+# Clears web storage for the current origin; throws on about:blank and data: URLs
+_CLEAR_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+class PooledSession:
+    """A live browser session owned by the pool"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+
+
+class BrowserPool:
+    """Pool of warm browser sessions leased to tests one at a time.
+
+    Every pytest process (the controller or a single xdist worker) owns its own
+    pool, so sessions are never shared across processes. Between leases a session
+    is reset (extra windows, cookies, web storage) and it is recycled after
+    ``max_uses`` tests, as soon as a reset fails, which usually means the
+    browser crashed, or when the test loaded pages of an origin other than the
+    one it ended on: web storage can only be cleared for the current origin.
+    """
+
+    def __init__(self, factory, size=1, max_uses=25):
+        self._factory = factory
+        self.size = max(1, size)
+        self.max_uses = max(1, max_uses)
+        self._idle = []
+        self._leased = {}
+        self._lock = threading.Condition()
+        self.created = 0
+        self.recycled = 0
+        self.leases = 0
+
+    def lease(self, test_name=None):
+        """Return a clean driver, starting a new browser if no warm one is idle"""
+        with self._lock:
+            while not self._idle and len(self._leased) >= self.size:
+                self._lock.wait()
+            session = self._idle.pop() if self._idle else None
+            if session is None:
+                session = PooledSession(self._factory())
+                self.created += 1
+            session.uses += 1
+            self.leases += 1
+            self._leased[id(session.driver)] = session
+
+        setattr(session.driver, "test_name", test_name)
+        # Filled by the command hook (utils.command_profiler.navigated) with every origin the test loads
+        setattr(session.driver, "visited_origins", set())
+        return session.driver
+
+    def release(self, driver, discard=False):
+        """Return a driver to the pool, resetting or recycling it"""
+        with self._lock:
+            session = self._leased.get(id(driver))
+        if session is None:
+            raise ValueError("Driver was not leased from this pool")
+
+        keep = (not discard and session.uses < self.max_uses
+                and self._single_origin(driver) and self._reset(driver))
+        if not keep:
+            self._quit(driver)
+
+        with self._lock:
+            del self._leased[id(driver)]
+            if keep:
+                self._idle.append(session)
+            else:
+                self.recycled += 1
+            self._lock.notify()
+
+    def warm_up(self):
+        """Start browsers up to the pool size ahead of the first lease"""
+        with self._lock:
+            while len(self._idle) + len(self._leased) < self.size:
+                self._idle.append(PooledSession(self._factory()))
+                self.created += 1
+
+    def close(self):
+        """Quit every browser owned by the pool"""
+        with self._lock:
+            sessions = self._idle + list(self._leased.values())
+            self._idle = []
+            self._leased = {}
+        for session in sessions:
+            self._quit(session.driver)
+
+    @staticmethod
+    def _single_origin(driver):
+        """True if the lease left web storage on no origin but the current one, where the reset clears it"""
+        try:
+            current = origin(driver.current_url)
+        except WebDriverException:
+            return False
+        others = set(getattr(driver, "visited_origins", ())) - {current}
+        if others:
+            logger.debug(f"Browser session visited {sorted(others)} besides {current}, recycling it")
+        return not others
+
+    def _reset(self, driver):
+        """Bring a session back to a blank state; return False if the browser is unusable"""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            driver.execute_script(_CLEAR_STORAGE_SCRIPT)
+            if hasattr(driver, "execute_cdp_cmd"):
+                # Chromium can drop cookies for every domain, not only the current one
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            return True
+        except WebDriverException as e:
+            logger.warning(f"Browser session failed to reset, recycling it: {e}")
+            return False
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            logger.warning(f"Failed to quit browser session: {e}")
@@ -0,0 +1,141 @@
+import logging
+import re
+import threading
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# URL patterns blocked through CDP for each disabled resource type
+_FEATURE_URL_PATTERNS = {
+    "images": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico"],
+    "fonts": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "media": ["*.mp4", "*.webm", "*.mp3", "*.ogg", "*.m3u8"],
+}
+
+# Firefox has no URL blocking without an extension, so features map to prefs instead
+_FIREFOX_FEATURE_PREFS = {
+    "images": {"permissions.default.image": 2},
+    "fonts": {"browser.display.use_document_fonts": 0, "gfx.downloadable_fonts.enabled": False},
+    "media": {"media.autoplay.default": 5, "media.autoplay.blocking_policy": 2},
+    "notifications": {"dom.webnotifications.enabled": False},
+}
+
+_CHROME_FEATURE_ARGUMENTS = {
+    "images": ["--blink-settings=imagesEnabled=false"],
+    "media": ["--autoplay-policy=user-gesture-required"],
+    "notifications": ["--disable-notifications"],
+}
+
+# Navigation Timing + Resource Timing totals for the current document
+_PAGE_METRICS_SCRIPT = """
+var nav = performance.getEntriesByType('navigation')[0];
+var bytes = nav ? nav.transferSize : 0;
+performance.getEntriesByType('resource').forEach(function (r) { bytes += r.transferSize || 0; });
+var loaded = nav ? (nav.loadEventEnd || nav.domContentLoadedEventEnd) : 0;
+return {bytes: bytes, load_ms: loaded, resources: performance.getEntriesByType('resource').length};
+"""
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+# Profile whose page metrics the others are compared against in the run summary
+BASELINE_PROFILE = "full-fidelity"
+
+
+class BrowserProfile:
+    """Named browser configuration from the ``profiles`` section of config.json"""
+
+    def __init__(self, name, settings):
+        self.name = name
+        self.headless = bool(settings.get("headless", False))
+        self.window_size = settings.get("window_size")
+        self.disabled_features = list(settings.get("disabled_features", []))
+        self.blocked_urls = list(settings.get("blocked_urls", []))
+        self.page_metrics = PageMetrics() if settings.get("collect_page_metrics", False) else None
+
+    @property
+    def blocked_url_patterns(self):
+        """URL patterns blocked in Chrome: explicit ones plus those implied by disabled features"""
+        patterns = []
+        for feature in self.disabled_features:
+            patterns.extend(_FEATURE_URL_PATTERNS.get(feature, []))
+        patterns.extend(self.blocked_urls)
+        return patterns
+
+    def apply_to_chrome_options(self, options):
+        if self.headless:
+            options.add_argument("--headless=new")
+        if self.window_size:
+            options.add_argument(f"--window-size={self.window_size[0]},{self.window_size[1]}")
+        else:
+            options.add_argument("--start-maximized")
+        for feature in self.disabled_features:
+            for argument in _CHROME_FEATURE_ARGUMENTS.get(feature, []):
+                options.add_argument(argument)
+
+    def apply_to_firefox_options(self, options):
+        if self.headless:
+            options.add_argument("-headless")
+        if self.window_size:
+            options.add_argument(f"--width={self.window_size[0]}")
+            options.add_argument(f"--height={self.window_size[1]}")
+        else:
+            options.add_argument("--start-maximized")
+        for feature in self.disabled_features:
+            for pref, value in _FIREFOX_FEATURE_PREFS.get(feature, {}).items():
+                options.set_preference(pref, value)
+        if self.blocked_urls:
+            logger.info(f"Profile '{self.name}': URL pattern blocking is only applied in Chrome")
+
+    def apply_to_session(self, driver):
+        """Apply settings that need a running browser (CDP URL blocking in Chrome)"""
+        patterns = self.blocked_url_patterns
+        if patterns and hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        setattr(driver, "browser_profile", self)
+        setattr(driver, "page_metrics", self.page_metrics)
+
+
+class PageMetrics:
+    """Per-page transfer size and load time collected by every session of a profile"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.pages = {}
+
+    def record(self, driver):
+        """Read timing data for the page that was just loaded"""
+        try:
+            metrics = driver.execute_script(_PAGE_METRICS_SCRIPT)
+            page = _ID_SEGMENT.sub("/{id}", urlparse(driver.current_url).path) or "/"
+        except Exception as e:
+            logger.debug(f"Could not read page metrics: {e}")
+            return
+        with self._lock:
+            totals = self.pages.setdefault(page, {"bytes": 0, "load_ms": 0.0, "samples": 0})
+            totals["bytes"] += int(metrics.get("bytes") or 0)
+            totals["load_ms"] += float(metrics.get("load_ms") or 0)
+            totals["samples"] += 1
+
+
+def merge_page_metrics(target, pages):
+    """Add per-page totals from ``pages`` into ``target``"""
+    for page, totals in pages.items():
+        merged = target.setdefault(page, {"bytes": 0, "load_ms": 0.0, "samples": 0})
+        for key in merged:
+            merged[key] += totals[key]
+    return target
+
+
+def page_savings(current, baseline):
+    """Average bytes and milliseconds saved per page load versus a baseline profile"""
+    savings = {}
+    for page, totals in current.items():
+        base = baseline.get(page)
+        if not base or not base["samples"] or not totals["samples"]:
+            continue
+        savings[page] = {
+            "bytes": base["bytes"] / base["samples"] - totals["bytes"] / totals["samples"],
+            "load_ms": base["load_ms"] / base["samples"] - totals["load_ms"] / totals["samples"],
+        }
+    return savings
@@ -0,0 +1,84 @@
+"""Cart preconditions through the REST API instead of the product pages.
+
+:class:`CartApi` logs a user in through ``/auth/login``, fills the cart with
+``POST /cart/items`` (the requests of the Postman collection), binds the
+resulting session cookie and token to the browser, and empties the cart again
+with one ``DELETE /cart``. A UI test then starts directly on ``CartPage.open()``.
+Cart changes made after :meth:`CartApi.bind` drop the bound browser's page state,
+so the next ``open()`` loads the page again instead of keeping the stale document.
+"""
+from utils.command_profiler import page_changed
+from utils.session_cache import api_login, restore
+
+
+class CartApiError(Exception):
+    """Raised when the cart API rejects a request"""
+
+
+class CartApi:
+    """Cart endpoints of the application API, over one keep-alive HTTP session"""
+
+    def __init__(self, config):
+        import requests
+
+        self.config = config
+        self.http = requests.Session()
+        self.stats = {"logins": 0, "items_added": 0, "carts_cleared": 0}
+        # Browser bound to each session, by token: its pages show that session's cart
+        self._browsers = {}
+
+    def login(self, user_type="customer_user"):
+        """Fresh API session (token and cookies) for ``user_type``"""
+        state = api_login(self.config, self.config.get_credentials(user_type), http=self.http)
+        # Requests are authorized by the token alone; the shared session must not carry one user's cookie to the next
+        self.http.cookies.clear()
+        if not state.token:
+            raise CartApiError("/auth/login returned no token to authorize cart requests with")
+        self.stats["logins"] += 1
+        return state
+
+    def add_item(self, state, product_id, quantity=1):
+        """Add ``quantity`` of a product to the cart of ``state``; return the cart"""
+        response = self._request("POST", "/cart/items", state,
+                                 json={"productId": str(product_id), "quantity": quantity})
+        self._cart_changed(state)
+        self.stats["items_added"] += 1
+        return response.json()
+
+    def get_cart(self, state):
+        return self._request("GET", "/cart", state).json()
+
+    def clear(self, state):
+        """Empty the cart of ``state`` with a single request"""
+        self._request("DELETE", "/cart", state)
+        self._cart_changed(state)
+        self.stats["carts_cleared"] += 1
+
+    def bind(self, driver, state):
+        """Make the browser use the API session: its cookies and the token in local storage"""
+        restore(driver, self.config, state)
+        self._browsers[state.token] = driver
+
+    def unbind(self, state):
+        """Forget the browser bound to ``state``; later cart changes leave its page state alone"""
+        self._browsers.pop(state.token, None)
+
+    def close(self):
+        self._browsers.clear()
+        self.http.close()
+
+    def _cart_changed(self, state):
+        driver = self._browsers.get(state.token)
+        if driver is not None:
+            page_changed(driver)
+
+    def _request(self, method, path, state, **kwargs):
+        response = self.http.request(
+            method, f"{self.config.api_url}{path}",
+            headers={"Authorization": f"Bearer {state.token}"},
+            timeout=self.config.page_load_timeout,
+            **kwargs,
+        )
+        if response.status_code >= 400:
+            raise CartApiError(f"{method} {path} failed with HTTP {response.status_code}: {response.text[:200]}")
+        return response
@@ -0,0 +1,154 @@
+"""WebDriver command profiling.
+
+:func:`install` wraps the remote connection of a driver so that every
+WebDriver HTTP command is timed and attributed to the page-object method that
+issued it. Commands are recorded in the :class:`CommandLog` set as
+``driver.command_log`` (one per test, like the wait ledger); nothing is
+recorded while no log is set. In-process drivers (``utils.fake_driver``) report
+their commands through :func:`record`.
+
+Commands that may change what the browser shows (navigation, element input,
+cookies) also drop the page state and snapshot kept on the driver by
+``BasePage``, whoever sends them: page objects, tests or utilities. URLs
+loaded with ``get`` are noted in ``driver.visited_origins`` while the browser
+pool has set one (see :func:`navigated`).
+"""
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from urllib.parse import urlsplit
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_PAGES_DIR = os.path.join(_PROJECT_ROOT, "pages") + os.sep
+_TESTS_DIR = os.path.join(_PROJECT_ROOT, "tests") + os.sep
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended
+HISTOGRAM_BOUNDS_MS = (5, 10, 25, 50, 100, 250, 500, 1000)
+
+# Commands after which the current document, or what a reload would show, may have changed
+PAGE_CHANGING_COMMANDS = frozenset({
+    "get", "goBack", "goForward", "refresh",
+    "clickElement", "clearElement", "sendKeysToElement", "submitElement", "actions",
+    "addCookie", "deleteCookie", "deleteAllCookies",
+})
+
+
+class CommandLog:
+    """Per-test record of WebDriver commands: name, latency and calling method"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.entries = []
+
+    def add(self, command, seconds, caller):
+        with self._lock:
+            self.entries.append((command, seconds, caller))
+
+    @property
+    def total_seconds(self):
+        return sum(seconds for _, seconds, _ in self.entries)
+
+    def histogram(self):
+        """Command counts per latency bucket, as (label, count) pairs"""
+        counts = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        for _, seconds, _ in self.entries:
+            ms = seconds * 1000
+            index = next((i for i, bound in enumerate(HISTOGRAM_BOUNDS_MS) if ms < bound), len(HISTOGRAM_BOUNDS_MS))
+            counts[index] += 1
+        labels = [f"<{bound} ms" for bound in HISTOGRAM_BOUNDS_MS] + [f">={HISTOGRAM_BOUNDS_MS[-1]} ms"]
+        return list(zip(labels, counts))
+
+    def format(self, limit=10):
+        """Text report of command counts, the latency histogram and the top callers"""
+        lines = [f"{len(self.entries)} commands, {self.total_seconds:.2f}s total"]
+
+        lines.append("Commands:")
+        for command, count in Counter(command for command, _, _ in self.entries).most_common(limit):
+            lines.append(f"  {count:5d}  {command}")
+
+        lines.append("Latency:")
+        peak = max((count for _, count in self.histogram()), default=0)
+        for label, count in self.histogram():
+            bar = "#" * round(30 * count / peak) if peak else ""
+            lines.append(f"  {label:>10}  {count:5d}  {bar}")
+
+        lines.append("Top callers:")
+        per_caller = {}
+        for _, seconds, caller in self.entries:
+            totals = per_caller.setdefault(caller, [0, 0.0])
+            totals[0] += 1
+            totals[1] += seconds
+        for caller, (count, seconds) in sorted(per_caller.items(), key=lambda item: item[1][0], reverse=True)[:limit]:
+            lines.append(f"  {count:5d}  {seconds:7.3f}s  {caller}")
+        return "\n".join(lines)
+
+
+def _caller():
+    """Name of the outermost page-object method on the stack, else the test function"""
+    page_method = None
+    test_function = None
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(_PAGES_DIR):
+            page_method = frame
+        elif test_function is None and filename.startswith(_TESTS_DIR):
+            test_function = frame
+        frame = frame.f_back
+    frame = page_method or test_function
+    if frame is None:
+        return "<framework>"
+    owner = frame.f_locals.get("self")
+    name = frame.f_code.co_name
+    return f"{type(owner).__name__}.{name}" if owner is not None else name
+
+
+def page_changed(driver):
+    """Forget ``driver``'s page state and snapshot: the next navigation reloads, reads go to the browser"""
+    driver.page_state = None
+    driver.page_snapshot = None
+
+
+def origin(url):
+    """``scheme://host[:port]`` of an http(s) URL, or None (about:blank, data: URLs)"""
+    parts = urlsplit(url or "")
+    return f"{parts.scheme}://{parts.netloc}" if parts.scheme in ("http", "https") and parts.netloc else None
+
+
+def navigated(driver, url):
+    """Note the origin of a URL the browser loaded in the set of origins the pool tracks for the lease"""
+    origins = getattr(driver, "visited_origins", None)
+    if origins is not None and origin(url):
+        origins.add(origin(url))
+
+
+def record(driver, command, call, *args, **kwargs):
+    """Run ``call(*args, **kwargs)`` as the WebDriver command ``command`` of ``driver``, timed into its log"""
+    if command in PAGE_CHANGING_COMMANDS:
+        page_changed(driver)
+    log = getattr(driver, "command_log", None)
+    if log is None:
+        return call(*args, **kwargs)
+    started = time.perf_counter()
+    try:
+        return call(*args, **kwargs)
+    finally:
+        log.add(command, time.perf_counter() - started, _caller())
+
+
+def install(driver):
+    """Time every command sent through ``driver``'s remote connection"""
+    executor = driver.command_executor
+    if getattr(executor, "_profiled", False):
+        return
+    execute = executor.execute
+
+    def profiled_execute(command, params):
+        if command == "get":
+            navigated(driver, (params or {}).get("url"))
+        return record(driver, command, execute, command, params)
+
+    executor.execute = profiled_execute
+    executor._profiled = True
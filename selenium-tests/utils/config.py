@@ -1,17 +1,30 @@
 import os
 import json
-from dotenv import load_dotenv
+from utils.browser_profiles import BrowserProfile
+
+_dotenv_loaded = False
+
+
+def _load_dotenv():
+    """Load environment variables from the .env file, once per process"""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _dotenv_loaded = True
 
-# Load environment variables from .env file
-load_dotenv()
 
 class Config:
     """Configuration class for test environment settings"""
     
-    def __init__(self, browser, env):
+    def __init__(self, browser, env, profile=None):
+        _load_dotenv()
         self.browser = browser
         self.env = env
         self._config = self._load_config()
+        self.profile = profile or os.getenv('BROWSER_PROFILE') or self._config.get('default_profile', 'full-fidelity')
+        self._browser_profile = None
+        self._local_app_urls = None
         
     def _load_config(self):
         """Load configuration from config.json file"""
@@ -35,6 +48,10 @@ class Config:
                     "prod": {
                         "base_url": "http://ecommerce.example.com",
                         "api_url": "http://api.example.com"
+                    },
+                    "local": {
+                        "base_url": "http://127.0.0.1:8000",
+                        "api_url": "http://127.0.0.1:8000/api/v1"
                     }
                 },
                 "timeouts": {
@@ -42,6 +59,56 @@ class Config:
                     "page_load": 30,
                     "script": 30
                 },
+                "reporting": {
+                    "instrumentation_level": "failures"
+                },
+                "waits": {
+                    "timeout": 10,
+                    "poll_interval": 0.1,
+                    "poll_backoff": 1.5,
+                    "max_poll_interval": 1.0,
+                    "backend": "poll"
+                },
+                "step_retry": {
+                    "enabled": False,
+                    "max_attempts": 2,
+                    "max_retries_per_test": 5,
+                    "delay_seconds": 0.25
+                },
+                "browser_pool": {
+                    "size": 1,
+                    "max_tests_per_session": 25
+                },
+                "screenshots": {
+                    "directory": "reports/screenshots",
+                    "max_bytes_per_test": 5000000,
+                    "max_bytes_per_run": 200000000,
+                    "max_width": None,
+                    "recompress": False
+                },
+                "session_cache": {
+                    "ttl_seconds": 1800,
+                    "login_via_api": False,
+                    "landing_path": "/account"
+                },
+                "local_app": {
+                    "host": "127.0.0.1",
+                    "port": 0,
+                    "latency_ms": 0,
+                    "jitter_ms": 0
+                },
+                "default_profile": "full-fidelity",
+                "profiles": {
+                    "full-fidelity": {
+                        "headless": False,
+                        "window_size": None
+                    }
+                },
+                "webdriver": {
+                    "cache_dir": "~/.cache/ecommerce-qa-lab/webdriver",
+                    "offline": False,
+                    "pinned_paths": {}
+                },
                 "test_data": {
                     "admin_user": {
                         "username": "admin@example.com",
@@ -53,13 +120,21 @@ class Config:
     @property
     def base_url(self):
         """Get base URL for the current environment"""
+        if self._local_app_urls:
+            return self._local_app_urls[0]
         return os.getenv('BASE_URL') or self._config['environments'][self.env]['base_url']
     
     @property
     def api_url(self):
         """Get API URL for the current environment"""
+        if self._local_app_urls:
+            return self._local_app_urls[1]
         return os.getenv('API_URL') or self._config['environments'][self.env]['api_url']
     
+    def use_local_app(self, base_url, api_url):
+        """Point base_url and api_url at a running local stand-in application"""
+        self._local_app_urls = (base_url, api_url)
+    
     @property
     def implicit_wait(self):
         """Get implicit wait timeout"""
@@ -75,6 +150,176 @@ class Config:
         """Get script timeout"""
         return int(os.getenv('SCRIPT_TIMEOUT') or self._config['timeouts']['script'])
     
+    @property
+    def instrumentation_level(self):
+        """Get the step logging level: off, failures, steps or verbose"""
+        return os.getenv('INSTRUMENTATION_LEVEL') or self._config.get('reporting', {}).get('instrumentation_level', 'failures')
+    
+    @property
+    def wait_timeout(self):
+        """Get the default explicit wait timeout used by page objects"""
+        return float(os.getenv('WAIT_TIMEOUT') or self._config.get('waits', {}).get('timeout', 10))
+    
+    @property
+    def wait_poll_interval(self):
+        """Get the initial poll interval of explicit waits"""
+        return float(os.getenv('WAIT_POLL_INTERVAL') or self._config.get('waits', {}).get('poll_interval', 0.1))
+    
+    @property
+    def wait_poll_backoff(self):
+        """Get the factor the poll interval grows by after each unsuccessful poll"""
+        return float(os.getenv('WAIT_POLL_BACKOFF') or self._config.get('waits', {}).get('poll_backoff', 1.5))
+    
+    @property
+    def wait_max_poll_interval(self):
+        """Get the upper bound of the poll interval"""
+        return float(os.getenv('WAIT_MAX_POLL_INTERVAL') or self._config.get('waits', {}).get('max_poll_interval', 1.0))
+    
+    @property
+    def wait_backend(self):
+        """Get how locator waits run: "poll" over WebDriver, or "observer" (MutationObserver in the page)"""
+        return os.getenv('WAIT_BACKEND') or self._config.get('waits', {}).get('backend', 'poll')
+    
+    @property
+    def step_retry_enabled(self):
+        """Check whether retryable page-object actions are re-run in place after transient errors"""
+        enabled = os.getenv('STEP_RETRY')
+        if enabled is not None:
+            return enabled.lower() in ('1', 'true', 'yes')
+        return bool(self._config.get('step_retry', {}).get('enabled', False))
+    
+    @property
+    def step_retry_max_attempts(self):
+        """Get how many times one retryable action runs at most (first attempt included)"""
+        return int(os.getenv('STEP_RETRY_MAX_ATTEMPTS') or self._config.get('step_retry', {}).get('max_attempts', 2))
+    
+    @property
+    def step_retry_max_per_test(self):
+        """Get how many step retries one test may use in total"""
+        return int(os.getenv('STEP_RETRY_MAX_PER_TEST') or self._config.get('step_retry', {}).get('max_retries_per_test', 5))
+    
+    @property
+    def step_retry_delay(self):
+        """Get the pause (seconds) before a step is retried"""
+        return float(os.getenv('STEP_RETRY_DELAY') or self._config.get('step_retry', {}).get('delay_seconds', 0.25))
+    
+    @property
+    def browser_pool_size(self):
+        """Get the number of warm browser sessions kept per test process"""
+        return int(os.getenv('BROWSER_POOL_SIZE') or self._config.get('browser_pool', {}).get('size', 1))
+    
+    @property
+    def browser_pool_max_tests(self):
+        """Get the number of tests a pooled browser session serves before it is recycled"""
+        return int(os.getenv('BROWSER_POOL_MAX_TESTS') or self._config.get('browser_pool', {}).get('max_tests_per_session', 25))
+    
+    @property
+    def screenshot_dir(self):
+        """Get the directory failure screenshots are stored in (relative to the project root)"""
+        directory = os.getenv('SCREENSHOT_DIR') or self._config.get('screenshots', {}).get('directory', 'reports/screenshots')
+        return os.path.join(os.path.dirname(os.path.dirname(__file__)), directory)
+    
+    @property
+    def screenshot_max_bytes_per_test(self):
+        """Get the screenshot byte budget of a single test"""
+        return int(os.getenv('SCREENSHOT_MAX_BYTES_PER_TEST') or self._config.get('screenshots', {}).get('max_bytes_per_test', 5000000))
+    
+    @property
+    def screenshot_max_bytes_per_run(self):
+        """Get the screenshot byte budget of a whole run (per test process)"""
+        return int(os.getenv('SCREENSHOT_MAX_BYTES_PER_RUN') or self._config.get('screenshots', {}).get('max_bytes_per_run', 200000000))
+    
+    @property
+    def screenshot_max_width(self):
+        """Get the width screenshots are downscaled to (requires Pillow), or None to keep them as captured"""
+        width = os.getenv('SCREENSHOT_MAX_WIDTH') or self._config.get('screenshots', {}).get('max_width')
+        return int(width) if width else None
+    
+    @property
+    def screenshot_recompress(self):
+        """Check whether stored screenshots are recompressed (requires Pillow)"""
+        recompress = os.getenv('SCREENSHOT_RECOMPRESS')
+        if recompress is not None:
+            return recompress.lower() in ('1', 'true', 'yes')
+        return bool(self._config.get('screenshots', {}).get('recompress', False))
+    
+    @property
+    def session_cache_ttl(self):
+        """Get how long (seconds) a cached login is reused before logging in again"""
+        return float(os.getenv('SESSION_CACHE_TTL') or self._config.get('session_cache', {}).get('ttl_seconds', 1800))
+    
+    @property
+    def session_login_via_api(self):
+        """Check whether cached sessions are created through the login API instead of the login form"""
+        via_api = os.getenv('SESSION_LOGIN_VIA_API')
+        if via_api is not None:
+            return via_api.lower() in ('1', 'true', 'yes')
+        return bool(self._config.get('session_cache', {}).get('login_via_api', False))
+    
+    @property
+    def session_landing_path(self):
+        """Get the page opened after restoring a session (a redirect to /login means it was rejected)"""
+        return os.getenv('SESSION_LANDING_PATH') or self._config.get('session_cache', {}).get('landing_path', '/account')
+    
+    @property
+    def local_app_host(self):
+        """Get the interface the local stand-in application listens on"""
+        return os.getenv('LOCAL_APP_HOST') or self._config.get('local_app', {}).get('host', '127.0.0.1')
+    
+    @property
+    def local_app_port(self):
+        """Get the port of the local stand-in application (0 picks a free port per test process)"""
+        return int(os.getenv('LOCAL_APP_PORT') or self._config.get('local_app', {}).get('port', 0))
+    
+    @property
+    def local_app_latency_ms(self):
+        """Get the delay the local stand-in application adds to every response"""
+        return float(os.getenv('LOCAL_APP_LATENCY_MS') or self._config.get('local_app', {}).get('latency_ms', 0))
+    
+    @property
+    def local_app_jitter_ms(self):
+        """Get the upper bound of the extra, per-path delay of the local stand-in application"""
+        return int(os.getenv('LOCAL_APP_JITTER_MS') or self._config.get('local_app', {}).get('jitter_ms', 0))
+    
+    @property
+    def user_types(self):
+        """Get the user types that have credentials in the test data (admin_user, customer_user, ...)"""
+        return list(self._config.get('test_data', {}))
+    
+    @property
+    def browser_profile(self):
+        """Get the selected browser profile (headless, window size, blocked resources)"""
+        if self._browser_profile is None:
+            profiles = self._config.get('profiles', {})
+            if self.profile not in profiles:
+                raise ValueError(f"Browser profile '{self.profile}' is not defined in config.json")
+            self._browser_profile = BrowserProfile(self.profile, profiles[self.profile])
+            headless = os.getenv('HEADLESS')
+            if headless is not None:
+                self._browser_profile.headless = headless.lower() in ('1', 'true', 'yes')
+        return self._browser_profile
+    
+    @property
+    def webdriver_cache_dir(self):
+        """Get the directory where resolved WebDriver binaries are recorded"""
+        cache_dir = os.getenv('WEBDRIVER_CACHE_DIR') or self._config.get('webdriver', {}).get('cache_dir', '~/.cache/ecommerce-qa-lab/webdriver')
+        return os.path.expanduser(cache_dir)
+    
+    @property
+    def webdriver_offline(self):
+        """Check whether WebDriver binaries must be resolved without network access"""
+        offline = os.getenv('WEBDRIVER_OFFLINE')
+        if offline is not None:
+            return offline.lower() in ('1', 'true', 'yes')
+        return bool(self._config.get('webdriver', {}).get('offline', False))
+    
+    @property
+    def pinned_driver_path(self):
+        """Get the pinned WebDriver binary for the current browser, if any"""
+        env_var = 'GECKODRIVER_PATH' if self.browser.lower() == 'firefox' else 'CHROMEDRIVER_PATH'
+        path = os.getenv(env_var) or self._config.get('webdriver', {}).get('pinned_paths', {}).get(self.browser.lower())
+        return os.path.expanduser(path) if path else None
+    
     def get_credentials(self, user_type='admin_user'):
         """Get credentials for the specified user type"""
         username = os.getenv(f'{user_type.upper()}_USERNAME') or self._config['test_data'][user_type]['username']
@@ -0,0 +1,39 @@
+from utils import command_profiler
+
+
+def create_driver(config, driver_path):
+    """Launch a new browser session for the browser configured in ``config``
+
+    ``driver_path`` is the chromedriver/geckodriver binary, resolved once per
+    session by :class:`utils.driver_resolver.DriverResolver`.
+    """
+    # Imported here so that collection and non-UI runs never load selenium.webdriver
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service as ChromeService
+    from selenium.webdriver.firefox.service import Service as FirefoxService
+
+    browser = config.browser.lower()
+    profile = config.browser_profile
+
+    if browser == "chrome":
+        options = webdriver.ChromeOptions()
+        options.add_argument("--disable-extensions")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--no-sandbox")
+        profile.apply_to_chrome_options(options)
+        driver = webdriver.Chrome(service=ChromeService(driver_path), options=options)
+    elif browser == "firefox":
+        options = webdriver.FirefoxOptions()
+        profile.apply_to_firefox_options(options)
+        driver = webdriver.Firefox(service=FirefoxService(driver_path), options=options)
+    else:
+        raise ValueError(f"Browser {browser} is not supported")
+
+    # Synchronisation is done by BasePage's wait engine; an implicit wait would stack on every poll
+    driver.implicitly_wait(0)
+    # Observed waits are sliced to stay under this timeout, so it must be the one the driver enforces
+    driver.set_script_timeout(config.script_timeout)
+    profile.apply_to_session(driver)
+    command_profiler.install(driver)
+    return driver
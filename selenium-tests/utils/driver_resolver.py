@@ -0,0 +1,150 @@
+import json
+import logging
+import os
+import re
+import subprocess
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+# Commands probed, in order, to find the installed browser version
+_BROWSER_VERSION_COMMANDS = {
+    "chrome": [
+        ["google-chrome", "--version"],
+        ["google-chrome-stable", "--version"],
+        ["chromium", "--version"],
+        ["chromium-browser", "--version"],
+        ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome", "--version"],
+    ],
+    "firefox": [
+        ["firefox", "--version"],
+        ["/Applications/Firefox.app/Contents/MacOS/firefox", "--version"],
+    ],
+}
+
+_VERSION_PATTERN = re.compile(r"(\d+)\.[\d.]+")
+
+
+class DriverResolutionError(RuntimeError):
+    """Raised when no driver binary can be found for the requested browser"""
+
+
+@contextmanager
+def _file_lock(path):
+    """Exclusive inter-process lock so parallel xdist workers download a driver only once"""
+    with open(path, "a+") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def detect_browser_version(browser):
+    """Return the major version of the installed browser, or None if it cannot be probed"""
+    for command in _BROWSER_VERSION_COMMANDS.get(browser, []):
+        try:
+            output = subprocess.run(command, capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = _VERSION_PATTERN.search(output)
+        if match:
+            return match.group(1)
+    return None
+
+
+def _download_driver(browser):
+    """Resolve a driver through webdriver-manager (network access may be needed)"""
+    if browser == "chrome":
+        from webdriver_manager.chrome import ChromeDriverManager
+        return ChromeDriverManager().install()
+    if browser == "firefox":
+        from webdriver_manager.firefox import GeckoDriverManager
+        return GeckoDriverManager().install()
+    raise ValueError(f"Browser {browser} is not supported")
+
+
+class DriverResolver:
+    """Resolves the WebDriver binary for a browser once and caches it on disk.
+
+    Resolution order: a pinned path (config or environment), the on-disk cache
+    entry for the installed browser version, then webdriver-manager. Cache
+    lookups and downloads happen under a file lock shared by all xdist workers.
+    In offline mode the download step is never attempted.
+    """
+
+    def __init__(self, browser, cache_dir, pinned_path=None, offline=False):
+        self.browser = browser.lower()
+        self.cache_dir = cache_dir
+        self.pinned_path = pinned_path
+        self.offline = offline
+        self.browser_version = None
+        self.source = None
+        self.elapsed = 0.0
+
+    def resolve(self):
+        """Return the path of a usable driver binary"""
+        started = time.perf_counter()
+        try:
+            return self._resolve()
+        finally:
+            self.elapsed = time.perf_counter() - started
+
+    def _resolve(self):
+        if self.pinned_path:
+            if not self._is_executable(self.pinned_path):
+                raise DriverResolutionError(f"Pinned {self.browser} driver not found at {self.pinned_path}")
+            self.source = "pinned"
+            return self.pinned_path
+
+        self.browser_version = detect_browser_version(self.browser) or "unknown"
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entry_path = os.path.join(self.cache_dir, f"{self.browser}-{self.browser_version}.json")
+
+        with _file_lock(os.path.join(self.cache_dir, f"{self.browser}.lock")):
+            cached = self._read_entry(entry_path)
+            if cached:
+                self.source = "cache"
+                return cached
+
+            if self.offline:
+                raise DriverResolutionError(
+                    f"No cached {self.browser} driver for browser version {self.browser_version} "
+                    f"and offline mode is enabled; pin a driver path in config.json"
+                )
+
+            path = _download_driver(self.browser)
+            with open(entry_path, "w") as f:
+                json.dump({"path": path, "browser_version": self.browser_version, "resolved_at": time.time()}, f)
+            self.source = "download"
+            return path
+
+    def _read_entry(self, entry_path):
+        try:
+            with open(entry_path, "r") as f:
+                path = json.load(f).get("path")
+        except (OSError, ValueError):
+            return None
+        if path and self._is_executable(path):
+            return path
+        logger.info(f"Discarding stale driver cache entry {entry_path}")
+        return None
+
+    @staticmethod
+    def _is_executable(path):
+        return os.path.isfile(path) and os.access(path, os.X_OK)
@@ -0,0 +1,749 @@
+"""In-memory WebDriver over static HTML, for page-object tests without a browser.
+
+:class:`FakeDriver` parses pages with BeautifulSoup and implements the part of
+the WebDriver API the page objects and the wait engine use: ``find_element(s)``
+by id, name, class name, tag name, CSS, link text and a subset of XPath,
+``.text``, ``get_attribute``, ``send_keys``/``clear``, ``click`` that follows
+links and submits forms, and stubs for the ``execute_script`` snippets of
+``pages.scripts`` and the session cache. No JavaScript runs; the only inline handler honoured is
+``onchange="this.form.submit()"``.
+
+Pages come from a mapping of URL or path to HTML (static fixtures, e.g. the
+markup of ``local_app.views``) and, for anything not in the mapping, from an
+optional ``requests.Session`` (e.g. against the local stand-in app). Commands
+are reported to ``driver.command_log`` like those of a real browser.
+"""
+import functools
+import re
+import time
+from urllib.parse import urldefrag, urlencode, urljoin, urlsplit
+
+from bs4 import BeautifulSoup, NavigableString
+from bs4.element import Comment, Tag
+from selenium.common.exceptions import (
+    ElementNotInteractableException,
+    InvalidSelectorException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
+
+from pages import scripts
+from utils import command_profiler, session_cache
+
+# Keys.RETURN and Keys.ENTER submit the form of the focused field; other special keys are ignored
+_SUBMIT_KEYS = ("\ue006", "\ue007")
+_SPECIAL_KEYS = re.compile("[\ue000-\uf8ff]")
+
+_NOT_RENDERED = {"head", "script", "style", "template", "title", "meta", "link", "noscript"}
+_BOOLEAN_ATTRIBUTES = {"checked", "selected", "disabled", "readonly", "required", "multiple", "hidden", "autofocus"}
+_URL_ATTRIBUTES = {"href", "src", "action", "formaction"}
+_CONTROLS = {"a", "button", "input", "select", "textarea", "option", "label"}
+
+# A 1x1 transparent PNG returned as every screenshot
+_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000001e221bc330000000049454e44ae426082"
+)
+
+
+def _command(name):
+    """Report calls of the decorated driver or element method as WebDriver command ``name``"""
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            driver = self if isinstance(self, FakeDriver) else self.parent
+            return command_profiler.record(driver, name, method, self, *args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def _attribute(tag, name):
+    value = tag.get(name)
+    return " ".join(value) if isinstance(value, list) else value
+
+
+def _is_displayed(tag):
+    for node in [tag, *tag.parents]:
+        if not isinstance(node, Tag) or node.name == "[document]":
+            continue
+        style = (_attribute(node, "style") or "").replace(" ", "").lower()
+        if (node.name in _NOT_RENDERED or node.has_attr("hidden") or "display:none" in style
+                or "visibility:hidden" in style or (node.name == "input" and node.get("type") == "hidden")):
+            return False
+    return True
+
+
+def _visible_text(tag):
+    """Rendered text of ``tag`` with whitespace collapsed, like a trimmed ``innerText``"""
+    if not _is_displayed(tag):
+        return ""
+    parts = []
+
+    def collect(node):
+        for child in node.children:
+            if isinstance(child, Comment):
+                continue
+            if isinstance(child, NavigableString):
+                parts.append(str(child))
+            elif isinstance(child, Tag) and child.name not in _NOT_RENDERED and not child.has_attr("hidden") \
+                    and "display:none" not in (_attribute(child, "style") or "").replace(" ", "").lower():
+                collect(child)
+
+    collect(tag)
+    return " ".join("".join(parts).split())
+
+
+def _string_value(tag):
+    return " ".join(tag.get_text(" ").split()) if isinstance(tag, Tag) else str(tag)
+
+
+class _XPath:
+    """Compiles the XPath subset used by locators into a matcher over a BeautifulSoup tree.
+
+    Supported: ``/`` and ``//`` steps (optionally starting with ``.``), element
+    names and ``*``, and predicates combining ``@attr``, ``text()``, ``.``,
+    string and number literals, ``=``/``!=``, ``and``/``or``/``not()``,
+    ``contains()``, ``starts-with()``, ``normalize-space()`` and positions.
+    """
+
+    _TOKEN = re.compile(r"""\s*(?:(//|/|\[|\]|\(|\)|,|!=|=|@|\*|\.)|('[^']*'|"[^"]*")|(\d+)|([A-Za-z_][\w-]*))""")
+
+    def __init__(self, expression):
+        self.expression = expression
+        self.tokens = self._tokenize(expression)
+        self.position = 0
+        self.relative = self._accept(".")
+        self.steps = []
+        while self.position < len(self.tokens):
+            self.steps.append(self._step())
+
+    def _tokenize(self, expression):
+        tokens, index = [], 0
+        expression = expression.strip()
+        while index < len(expression):
+            match = self._TOKEN.match(expression, index)
+            if not match or match.end() == index:
+                raise InvalidSelectorException(f"Unsupported XPath: {expression}")
+            symbol, string, number, name = match.groups()
+            if symbol:
+                tokens.append(symbol)
+            elif string:
+                tokens.append(("string", string[1:-1]))
+            elif number:
+                tokens.append(("number", int(number)))
+            else:
+                tokens.append(("name", name))
+            index = match.end()
+        return tokens
+
+    def _peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _accept(self, token):
+        if self._peek() == token:
+            self.position += 1
+            return True
+        return False
+
+    def _expect(self, token):
+        if not self._accept(token):
+            raise InvalidSelectorException(f"Unsupported XPath: {self.expression}")
+
+    def _step(self):
+        if self._accept("//"):
+            axis = "descendant"
+        elif self._accept("/"):
+            axis = "child"
+        else:
+            raise InvalidSelectorException(f"Unsupported XPath: {self.expression}")
+        token = self._peek()
+        self.position += 1
+        if token == "*":
+            name = None
+        elif isinstance(token, tuple) and token[0] == "name":
+            name = token[1]
+        else:
+            raise InvalidSelectorException(f"Unsupported XPath: {self.expression}")
+        predicates = []
+        while self._accept("["):
+            predicates.append(self._or())
+            self._expect("]")
+        return axis, name, predicates
+
+    def _or(self):
+        left = self._and()
+        while self._peek() == ("name", "or"):
+            self.position += 1
+            right, first = self._and(), left
+            left = lambda tag, pos, first=first, right=right: bool(first(tag, pos)) or bool(right(tag, pos))
+        return left
+
+    def _and(self):
+        left = self._comparison()
+        while self._peek() == ("name", "and"):
+            self.position += 1
+            right, first = self._comparison(), left
+            left = lambda tag, pos, first=first, right=right: bool(first(tag, pos)) and bool(right(tag, pos))
+        return left
+
+    def _comparison(self):
+        left = self._value()
+        for operator in ("=", "!="):
+            if self._accept(operator):
+                right = self._value()
+
+                def compare(tag, pos, left=left, right=right, equal=operator == "="):
+                    a, b = left(tag, pos), right(tag, pos)
+                    if a is None or b is None:
+                        return False
+                    return (str(a) == str(b)) == equal
+                return compare
+        return left
+
+    def _value(self):
+        token = self._peek()
+        self.position += 1
+        if token == "@":
+            name = self._peek()[1]
+            self.position += 1
+            return lambda tag, pos: _attribute(tag, name)
+        if token == ".":
+            return lambda tag, pos: _string_value(tag)
+        if token == "(":
+            inner = self._or()
+            self._expect(")")
+            return inner
+        if isinstance(token, tuple) and token[0] in ("string", "number"):
+            value = token[1]
+            return lambda tag, pos: value
+        if isinstance(token, tuple) and token[0] == "name" and self._accept("("):
+            args = []
+            while not self._accept(")"):
+                args.append(self._or())
+                self._accept(",")
+            return self._function(token[1], args)
+        raise InvalidSelectorException(f"Unsupported XPath: {self.expression}")
+
+    def _function(self, name, args):
+        text = lambda arg, tag, pos: "" if arg(tag, pos) is None else str(arg(tag, pos))
+        if name == "text":
+            return lambda tag, pos: "".join(str(c) for c in tag.children
+                                            if isinstance(c, NavigableString) and not isinstance(c, Comment))
+        if name == "contains":
+            return lambda tag, pos: text(args[1], tag, pos) in text(args[0], tag, pos)
+        if name == "starts-with":
+            return lambda tag, pos: text(args[0], tag, pos).startswith(text(args[1], tag, pos))
+        if name == "normalize-space":
+            if not args:
+                return lambda tag, pos: _string_value(tag)
+            return lambda tag, pos: " ".join(text(args[0], tag, pos).split())
+        if name == "not":
+            return lambda tag, pos: not args[0](tag, pos)
+        if name == "position":
+            return lambda tag, pos: pos
+        raise InvalidSelectorException(f"Unsupported XPath function {name}() in {self.expression}")
+
+    def select(self, context):
+        """Elements matched from ``context`` (an element for relative paths, else the document), in document order"""
+        if not self.relative:
+            while context.parent is not None:
+                context = context.parent
+        nodes = [context]
+        for axis, name, predicates in self.steps:
+            matched = []
+            for node in nodes:
+                candidates = node.find_all(name or True, recursive=axis == "descendant")
+                for predicate in predicates:
+                    kept = []
+                    for position, candidate in enumerate(candidates, start=1):
+                        result = predicate(candidate, position)
+                        if isinstance(result, bool):
+                            keep = result
+                        elif isinstance(result, int):
+                            keep = result == position  # [2] selects the second candidate
+                        else:
+                            keep = bool(result)
+                        if keep:
+                            kept.append(candidate)
+                    candidates = kept
+                matched.extend(candidates)
+            seen = set()
+            nodes = [node for node in matched if not (id(node) in seen or seen.add(id(node)))]
+        return nodes
+
+
+class FakeElement:
+    """An element of the current page of a :class:`FakeDriver`"""
+
+    def __init__(self, parent, tag, generation):
+        self.parent = parent
+        self._tag = tag
+        self._generation = generation
+
+    def __eq__(self, other):
+        return isinstance(other, FakeElement) and other._tag is self._tag
+
+    def __hash__(self):
+        return id(self._tag)
+
+    def __repr__(self):
+        return f"<FakeElement {self._tag.name} {dict(self._tag.attrs)}>"
+
+    @property
+    def tag(self):
+        """The BeautifulSoup tag; raises StaleElementReferenceException once the page was left"""
+        if self._generation != self.parent._generation:
+            raise StaleElementReferenceException(f"{self!r} is no longer attached to the page")
+        return self._tag
+
+    @property
+    def tag_name(self):
+        return self.tag.name
+
+    @property
+    @_command("getElementText")
+    def text(self):
+        return _visible_text(self.tag)
+
+    @_command("getElementAttribute")
+    def get_attribute(self, name):
+        """Attribute or property, as Selenium's ``get_attribute`` returns it"""
+        return self._attribute_or_property(name)
+
+    @_command("getElementProperty")
+    def get_property(self, name):
+        return self._attribute_or_property(name)
+
+    def _attribute_or_property(self, name):
+        tag = self.tag
+        if name in _BOOLEAN_ATTRIBUTES:
+            return "true" if tag.has_attr(name) else None
+        if name == "value":
+            return self.parent._value(tag)
+        if name in _URL_ATTRIBUTES and tag.has_attr(name):
+            return urljoin(self.parent._url, _attribute(tag, name))
+        if name in ("innerText", "textContent"):
+            return _visible_text(tag) if name == "innerText" else tag.get_text()
+        if name == "innerHTML":
+            return tag.decode_contents()
+        if name == "outerHTML":
+            return str(tag)
+        return _attribute(tag, "class" if name == "className" else name)
+
+    @_command("getElementAttribute")
+    def get_dom_attribute(self, name):
+        return _attribute(self.tag, name)
+
+    @_command("isElementDisplayed")
+    def is_displayed(self):
+        return _is_displayed(self.tag)
+
+    @_command("isElementEnabled")
+    def is_enabled(self):
+        return not self.tag.has_attr("disabled")
+
+    @_command("isElementSelected")
+    def is_selected(self):
+        return self.tag.has_attr("selected") or self.tag.has_attr("checked")
+
+    @_command("clearElement")
+    def clear(self):
+        self.parent._set_value(self._interactable(), "")
+
+    @_command("sendKeysToElement")
+    def send_keys(self, *values):
+        tag = self._interactable()
+        typed = "".join(str(value) for value in values)
+        self.parent._set_value(tag, self.parent._value(tag) + _SPECIAL_KEYS.sub("", typed))
+        if any(key in typed for key in _SUBMIT_KEYS):
+            form = self.parent._form_of(tag)
+            if form is not None:
+                self.parent._submit(form)
+
+    @_command("clickElement")
+    def click(self):
+        self.parent._click(self._interactable())
+
+    @_command("submitElement")
+    def submit(self):
+        form = self.parent._form_of(self.tag)
+        if form is None:
+            raise WebDriverException(f"{self!r} is not inside a form")
+        self.parent._submit(form)
+
+    @_command("findChildElement")
+    def find_element(self, by="id", value=None):
+        return self.parent._find(by, value, self.tag, single=True)
+
+    @_command("findChildElements")
+    def find_elements(self, by="id", value=None):
+        return self.parent._find(by, value, self.tag)
+
+    def _interactable(self):
+        tag = self.tag
+        if not _is_displayed(tag) and tag.name != "option":
+            raise ElementNotInteractableException(f"{self!r} is not displayed")
+        return tag
+
+
+class FakeDriver:
+    """WebDriver stand-in that serves ``pages`` (URL or path -> HTML) and, optionally, a ``requests.Session``
+
+    Relative keys of ``pages`` match any URL with that path (and query, if the
+    key has one). A form posted to a URL in ``pages`` shows that page, so a
+    static fixture can also map the page displayed after a submit. URLs not in
+    ``pages`` are fetched with ``session``; without one they raise
+    WebDriverException.
+    """
+
+    name = "fake"
+
+    def __init__(self, pages=None, session=None):
+        self.pages = dict(pages or {})
+        self.session = session
+        self.command_log = None
+        self._scripts = {
+            scripts.EXTRACT_ITEMS: self._extract_items,
+            scripts.PAGE_STATE: self._page_state,
+            scripts.SNAPSHOT: self._snapshot,
+            scripts.OBSERVE_CONDITION: self._observe_condition,
+            "arguments[0].scrollIntoView(true);": lambda element: None,
+            "arguments[0].click();": lambda element: self._click(element.tag),
+            "return document.readyState": lambda: "complete",
+            "return document.readyState;": lambda: "complete",
+            # Web storage as saved and restored by the session cache (one store, whatever the origin)
+            session_cache._READ_STORAGE: lambda: [dict(self.local_storage), dict(self.session_storage)],
+            session_cache._WRITE_STORAGE: self._write_storage,
+        }
+        self.local_storage = {}
+        self.session_storage = {}
+        self._cookies = {}
+        self._history = []
+        self._generation = 0
+        self._window_token = None
+        self._url = "about:blank"
+        self._soup = BeautifulSoup("<html><head></head><body></body></html>", "html.parser")
+
+    # Navigation
+
+    @_command("get")
+    def get(self, url):
+        self._navigate("GET", url)
+
+    @property
+    @_command("getCurrentUrl")
+    def current_url(self):
+        return self._url
+
+    @property
+    @_command("getTitle")
+    def title(self):
+        title = self._soup.find("title")
+        return title.get_text().strip() if title else ""
+
+    @property
+    @_command("getPageSource")
+    def page_source(self):
+        return str(self._soup)
+
+    @_command("goBack")
+    def back(self):
+        if len(self._history) > 1:
+            self._history.pop()
+            self._load(*self._history[-1], record=False)
+
+    @_command("refresh")
+    def refresh(self):
+        self._navigate("GET", self._url, record=False)
+
+    def load_html(self, html, url="http://fake.local/"):
+        """Show ``html`` as the current page at ``url`` without registering it in ``pages``"""
+        self._load(url, html)
+
+    # Elements
+
+    @_command("findElement")
+    def find_element(self, by="id", value=None):
+        return self._find(by, value, self._soup, single=True)
+
+    @_command("findElements")
+    def find_elements(self, by="id", value=None):
+        return self._find(by, value, self._soup)
+
+    # Scripts
+
+    def stub_script(self, script, handler):
+        """Answer ``execute_script(script, *args)`` with ``handler(*args)``; elements are passed as FakeElements"""
+        self._scripts[script] = handler
+
+    @_command("executeScript")
+    def execute_script(self, script, *args):
+        handler = self._scripts.get(script, self._scripts.get(script.strip()))
+        if handler is None:
+            raise WebDriverException(f"FakeDriver has no stub for script: {script.strip()[:80]!r}; "
+                                     f"register one with stub_script()")
+        return handler(*args)
+
+    @_command("executeAsyncScript")
+    def execute_async_script(self, script, *args):
+        """Like ``execute_script``; the stub returns what the script would pass to its callback"""
+        handler = self._scripts.get(script, self._scripts.get(script.strip()))
+        if handler is None:
+            raise WebDriverException(f"FakeDriver has no stub for async script: {script.strip()[:80]!r}; "
+                                     f"register one with stub_script()")
+        return handler(*args)
+
+    # Cookies, screenshots and session settings
+
+    @_command("getAllCookies")
+    def get_cookies(self):
+        return self._all_cookies()
+
+    @_command("getCookie")
+    def get_cookie(self, name):
+        return next((cookie for cookie in self._all_cookies() if cookie["name"] == name), None)
+
+    def _all_cookies(self):
+        if self.session is not None:
+            return [{"name": c.name, "value": c.value, "domain": c.domain, "path": c.path, "secure": c.secure}
+                    for c in self.session.cookies]
+        return [dict(cookie) for cookie in self._cookies.values()]
+
+    @_command("addCookie")
+    def add_cookie(self, cookie):
+        if self.session is not None:
+            self.session.cookies.set(cookie["name"], cookie["value"], path=cookie.get("path", "/"),
+                                     domain=cookie.get("domain") or urlsplit(self._url).hostname)
+        else:
+            self._cookies[cookie["name"]] = {"path": "/", **cookie}
+
+    @_command("deleteCookie")
+    def delete_cookie(self, name):
+        if self.session is not None:
+            for cookie in [c for c in self.session.cookies if c.name == name]:
+                self.session.cookies.clear(cookie.domain, cookie.path, cookie.name)
+        else:
+            self._cookies.pop(name, None)
+
+    @_command("deleteAllCookies")
+    def delete_all_cookies(self):
+        if self.session is not None:
+            self.session.cookies.clear()
+        self._cookies.clear()
+
+    @_command("screenshot")
+    def get_screenshot_as_png(self):
+        return _PNG
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def set_page_load_timeout(self, seconds):
+        pass
+
+    def set_script_timeout(self, seconds):
+        pass
+
+    def quit(self):
+        if self.session is not None:
+            self.session.close()
+
+    # Internals
+
+    def _find(self, by, value, root, single=False):
+        if by == "css selector":
+            tags = root.select(value)
+        elif by == "id":
+            tags = root.find_all(id=value)
+        elif by == "name":
+            tags = root.find_all(attrs={"name": value})
+        elif by == "class name":
+            tags = root.find_all(class_=value)
+        elif by == "tag name":
+            tags = root.find_all(value)
+        elif by in ("link text", "partial link text"):
+            tags = [a for a in root.find_all("a") if (_visible_text(a) == value if by == "link text"
+                                                       else value in _visible_text(a))]
+        elif by == "xpath":
+            tags = _XPath(value).select(root)
+        else:
+            raise InvalidSelectorException(f"Unsupported locator strategy: {by}")
+        elements = [FakeElement(self, tag, self._generation) for tag in tags]
+        if not single:
+            return elements
+        if not elements:
+            raise NoSuchElementException(f"Unable to locate element: {{\"method\":\"{by}\",\"selector\":\"{value}\"}}")
+        return elements[0]
+
+    def _load(self, url, html, record=True):
+        self._url = url
+        self._soup = BeautifulSoup(html, "html.parser")
+        self._generation += 1
+        self._window_token = None
+        if record:
+            self._history.append((url, html))
+
+    def _page_for(self, url):
+        if url in self.pages:
+            return self.pages[url]
+        parts = urlsplit(url)
+        path_and_query = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        for key in (path_and_query, parts.path):
+            if key in self.pages:
+                return self.pages[key]
+        return None
+
+    def _navigate(self, method, url, data=None, record=True):
+        url = urljoin(self._url, url)
+        base, fragment = urldefrag(url)
+        if fragment and method == "GET" and base == urldefrag(self._url)[0]:
+            self._url = url  # same-document link: no reload
+            return
+        html = self._page_for(url)
+        if html is not None:
+            self._load(url, html, record)
+        elif self.session is not None:
+            response = self.session.request(method, url, data=data, allow_redirects=True)
+            self._load(response.url, response.text, record)
+        else:
+            raise WebDriverException(f"FakeDriver has no page for {method} {url}")
+        # Every load, like a browser, whether it came from get(), a link or a form
+        command_profiler.navigated(self, self._url)
+
+    def _value(self, tag):
+        if tag.name == "textarea":
+            return tag.get_text()
+        if tag.name == "select":
+            option = tag.find("option", selected=True) or tag.find("option")
+            return self._value(option) if option else ""
+        if tag.name == "option":
+            return tag.get("value", _visible_text(tag))
+        return tag.get("value", "")
+
+    def _set_value(self, tag, value):
+        if tag.name == "textarea":
+            tag.string = value
+        else:
+            tag["value"] = value
+
+    def _form_of(self, tag):
+        if tag.get("form"):
+            return self._soup.find("form", id=tag["form"])
+        return tag.find_parent("form")
+
+    def _click(self, tag):
+        if tag.name == "option":
+            select = tag.find_parent("select")
+            if select is not None and not select.has_attr("multiple"):
+                for option in select.find_all("option"):
+                    del option["selected"]
+            tag["selected"] = ""
+            if select is not None and "this.form.submit()" in (select.get("onchange") or ""):
+                self._submit(self._form_of(select))
+            return
+        if tag.name == "input" and tag.get("type") in ("checkbox", "radio"):
+            if tag.get("type") == "radio":
+                scope = self._form_of(tag) or self._soup
+                for radio in scope.find_all("input", attrs={"type": "radio", "name": tag.get("name")}):
+                    del radio["checked"]
+                tag["checked"] = ""
+            elif tag.has_attr("checked"):
+                del tag["checked"]
+            else:
+                tag["checked"] = ""
+            return
+        link = tag if tag.name == "a" else tag.find_parent("a")
+        if link is not None and link.get("href"):
+            self._navigate("GET", link["href"])
+            return
+        button_type = (tag.get("type") or "submit").lower()
+        if (tag.name == "button" and button_type == "submit") or (tag.name == "input" and button_type in ("submit", "image")):
+            form = self._form_of(tag)
+            if form is not None:
+                self._submit(form, submitter=tag)
+            return
+        if tag.name not in _CONTROLS:
+            # A click on a card-like container lands on the link it wraps
+            link = tag.find("a", href=True)
+            if link is not None:
+                self._navigate("GET", link["href"])
+
+    def _submit(self, form, submitter=None):
+        fields = []
+        for control in form.find_all(["input", "select", "textarea", "button"]):
+            name = control.get("name")
+            if not name or control.has_attr("disabled"):
+                continue
+            kind = (control.get("type") or ("submit" if control.name == "button" else "text")).lower()
+            if control.name == "button" or kind in ("submit", "image", "button", "reset"):
+                if control is submitter:
+                    fields.append((name, control.get("value", "")))
+                continue
+            if kind in ("checkbox", "radio") and not control.has_attr("checked"):
+                continue
+            fields.append((name, self._value(control)))
+        action = (submitter.get("formaction") if submitter is not None else None) or form.get("action") or self._url
+        method = ((submitter.get("formmethod") if submitter is not None else None) or form.get("method") or "get").upper()
+        if method == "GET":
+            self._navigate("GET", f"{urljoin(self._url, action).split('?')[0]}?{urlencode(fields)}")
+        else:
+            self._navigate("POST", action, data=fields)
+
+    def _write_storage(self, local_storage, session_storage):
+        self.local_storage.update(local_storage)
+        self.session_storage.update(session_storage)
+
+    def _page_state(self, token):
+        if token:
+            self._window_token = token
+        return [self._url, self._window_token]
+
+    def _snapshot(self, locators):
+        result = {}
+        for name, by, value in locators:
+            tags = self._find(by, value, self._soup)
+            if not tags:
+                result[name] = None
+                continue
+            element = tags[0]
+            result[name] = {"text": _visible_text(element.tag), "displayed": _is_displayed(element.tag),
+                            "attributes": {attribute: element._attribute_or_property(attribute)
+                                           for attribute in element.tag.attrs}}
+        return result
+
+    def _observe_condition(self, kind, by, value, timeout_ms):
+        elements = self._find(by, value, self._soup)
+        first = elements[0] if elements else None
+        displayed = first is not None and _is_displayed(first.tag)
+        result = {
+            "present": first,
+            "all_present": elements or None,
+            "visible": first if displayed else None,
+            "clickable": first if displayed and not first.tag.has_attr("disabled") else None,
+            "invisible": True if not displayed else None,
+        }[kind]
+        if result is not None:
+            return [True, result, 0]
+        # Nothing changes a static page while the script waits
+        time.sleep(timeout_ms / 1000)
+        return [False, None, timeout_ms]
+
+    def _extract_items(self, by, value, fields, include_elements):
+        rows = []
+        for item in self._find(by, value, self._soup):
+            row = {}
+            for name, (selector, attribute) in fields.items():
+                target = item.tag.select_one(selector) if selector else item.tag
+                if target is None:
+                    row[name] = None
+                elif attribute is None:
+                    row[name] = _visible_text(target)
+                elif attribute in _URL_ATTRIBUTES and target.has_attr(attribute):
+                    row[name] = urljoin(self._url, _attribute(target, attribute))
+                else:
+                    row[name] = _attribute(target, attribute)
+            if include_elements:
+                row["element"] = item
+            rows.append(row)
+        return rows
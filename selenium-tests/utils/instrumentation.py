@@ -0,0 +1,139 @@
+"""Buffered, leveled step logging for page objects and tests.
+
+Levels:
+    off       nothing is recorded; decorated methods run with a single check
+    failures  steps and details are buffered and attached only when the test fails
+    steps     step titles and timings are attached for every test
+    verbose   steps and details are attached for every test, and each step is
+              also reported as a native Allure step
+
+Instead of one Allure step and one attachment file per page-object call, a test
+produces at most one compact "Step log" attachment. Step titles are formatted
+only when the log is actually written.
+"""
+import functools
+import inspect
+import time
+
+LEVELS = ("off", "failures", "steps", "verbose")
+OFF, FAILURES, STEPS, VERBOSE = range(len(LEVELS))
+
+# Formatted step titles are cut to this length (scripts and long texts are common arguments)
+MAX_TITLE_LENGTH = 200
+
+_level = FAILURES
+_buffer = None
+
+
+class _StepBuffer:
+    """Events recorded while one test runs"""
+
+    def __init__(self, test_name):
+        self.test_name = test_name
+        self.events = []
+        self.depth = 0
+
+
+def set_level(level):
+    """Select the instrumentation level by name"""
+    global _level
+    if level not in LEVELS:
+        raise ValueError(f"Unknown instrumentation level '{level}', expected one of {', '.join(LEVELS)}")
+    _level = LEVELS.index(level)
+
+
+def get_level():
+    return LEVELS[_level]
+
+
+def start_test(test_name):
+    """Begin buffering events for a test"""
+    global _buffer
+    _buffer = _StepBuffer(test_name) if _level != OFF else None
+
+
+def finish_test(failed):
+    """Stop buffering and return the step log to attach, or None if nothing should be written"""
+    global _buffer
+    buffer, _buffer = _buffer, None
+    if buffer is None or not buffer.events:
+        return None
+    if _level == FAILURES and not failed:
+        return None
+    return _render(buffer)
+
+
+def note(title):
+    """Record a test-level step that is not tied to a page-object method"""
+    if _buffer is not None:
+        _buffer.events.append(("step", title, None, None, None, _buffer.depth, 0.0, "note"))
+
+
+def detail(name, text):
+    """Record a text detail (what used to be a separate Allure text attachment)"""
+    if _buffer is not None and _level != STEPS:
+        _buffer.events.append(("detail", name, text, _buffer.depth))
+
+
+def step(title):
+    """Decorator recording a call of the wrapped method as a step.
+
+    ``title`` is a ``str.format`` template over the method's arguments, like
+    ``allure.step`` titles.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            buffer = _buffer
+            if buffer is None:
+                return func(*args, **kwargs)
+
+            event = ["step", title, signature, args, kwargs, buffer.depth, 0.0, "passed"]
+            buffer.events.append(event)
+            buffer.depth += 1
+            started = time.perf_counter()
+            try:
+                if _level == VERBOSE:
+                    import allure
+                    with allure.step(_format_title(title, signature, args, kwargs)):
+                        return func(*args, **kwargs)
+                return func(*args, **kwargs)
+            except Exception:
+                event[7] = "failed"
+                raise
+            finally:
+                event[6] = time.perf_counter() - started
+                buffer.depth -= 1
+
+        return wrapper
+    return decorator
+
+
+def _format_title(title, signature, args, kwargs):
+    if signature is None:
+        return title
+    try:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        formatted = title.format(**bound.arguments)
+    except (KeyError, IndexError, TypeError, ValueError):
+        return title
+    if len(formatted) > MAX_TITLE_LENGTH:
+        formatted = formatted[:MAX_TITLE_LENGTH - 3] + "..."
+    return formatted
+
+
+def _render(buffer):
+    lines = [f"Step log for {buffer.test_name}"]
+    for event in buffer.events:
+        if event[0] == "step":
+            _, title, signature, args, kwargs, depth, duration, outcome = event
+            marker = {"passed": "+", "failed": "x", "note": "*"}[outcome]
+            timing = f" ({duration * 1000:.0f} ms)" if outcome != "note" else ""
+            lines.append(f"{'  ' * depth}{marker} {_format_title(title, signature, args, kwargs)}{timing}")
+        else:
+            _, name, text, depth = event
+            lines.append(f"{'  ' * depth}  [{name}] {text}")
+    return "\n".join(lines)
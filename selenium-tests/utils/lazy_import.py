@@ -0,0 +1,23 @@
+import importlib
+
+
+class LazyModule:
+    """Module proxy that imports the module on first attribute access.
+
+    Used for heavy dependencies (``selenium.webdriver``, ``allure``) that
+    module-level code only needs once a test actually drives a browser, so
+    that collection and non-UI runs do not pay for them.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attribute):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attribute)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
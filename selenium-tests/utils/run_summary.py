@@ -0,0 +1,60 @@
+import os
+
+# Key under which xdist workers ship their records back to the controller
+WORKER_OUTPUT_KEY = "run_summary"
+
+_formatters = {}
+
+
+def worker_id():
+    """Return the xdist worker id of this process, or 'main' without xdist"""
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+def register_formatter(section, title, formatter):
+    """Register how a section is rendered in the terminal summary.
+
+    ``formatter`` receives the list of records of the section and the pytest
+    config, and returns the lines to print.
+    """
+    _formatters[section] = (title, formatter)
+
+
+def _records(config):
+    if not hasattr(config, "_run_summary_records"):
+        config._run_summary_records = {}
+    return config._run_summary_records
+
+
+def record(config, section, **fields):
+    """Store a summary record for ``section``; fields must be plain JSON-like values"""
+    fields.setdefault("worker", worker_id())
+    _records(config).setdefault(section, []).append(fields)
+
+
+def records(config, section):
+    """Return every record stored for ``section`` by this process and its workers"""
+    return _records(config).get(section, [])
+
+
+def export_to_controller(config):
+    """Hand this worker's records to the xdist controller"""
+    if hasattr(config, "workeroutput"):
+        config.workeroutput[WORKER_OUTPUT_KEY] = _records(config)
+
+
+def merge_from_worker(config, workeroutput):
+    """Merge the records a finished xdist worker sent back"""
+    for section, items in (workeroutput or {}).get(WORKER_OUTPUT_KEY, {}).items():
+        _records(config).setdefault(section, []).extend(items)
+
+
+def write_terminal_summary(terminalreporter, config):
+    """Print every registered section that has records"""
+    for section, (title, formatter) in _formatters.items():
+        items = records(config, section)
+        if not items:
+            continue
+        terminalreporter.write_sep("-", title)
+        for line in formatter(items, config):
+            terminalreporter.write_line(line)
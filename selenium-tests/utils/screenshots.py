@@ -0,0 +1,137 @@
+import hashlib
+import io
+import logging
+import os
+import queue
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+def _attach_to_allure(name, png, stored_path=None):
+    """Attach a PNG to the running Allure test, if Allure is reporting.
+
+    ``stored_path`` is an identical screenshot already on disk: Allure copies it
+    instead of the captured bytes being handed over again.
+    """
+    try:
+        import allure
+    except ImportError:
+        return
+    try:
+        if stored_path:
+            allure.attach.file(stored_path, name=name, attachment_type=allure.attachment_type.PNG)
+        else:
+            allure.attach(png, name=name, attachment_type=allure.attachment_type.PNG)
+    except Exception as e:
+        logger.debug(f"Could not attach screenshot '{name}' to Allure: {e}")
+
+
+class ScreenshotService:
+    """Captures screenshots once and stores them from a background thread.
+
+    Each capture is hashed; identical images are stored once and reused by
+    every test and report that refers to them. Per-test and per-run byte caps
+    bound the volume of a failing run, and images can be downscaled or
+    recompressed when Pillow is installed. Screenshots are attached to the
+    running Allure test through Allure's public API, from the stored file once
+    it has been written.
+    """
+
+    def __init__(self, directory, per_test_bytes=5_000_000, per_run_bytes=200_000_000, max_width=None, recompress=False):
+        self.directory = directory
+        self.per_test_bytes = per_test_bytes
+        self.per_run_bytes = per_run_bytes
+        self.max_width = max_width
+        self.recompress = recompress
+        self._paths = {}
+        self._written = set()  # Digests whose file is on disk, added by the writer thread
+        self._queue = queue.Queue()
+        self._thread = None
+        self._test_name = None
+        self._test_bytes = 0
+        self._test_hashes = set()
+        self.run_bytes = 0
+        self.stats = {"captured": 0, "stored": 0, "deduplicated": 0, "dropped": 0, "bytes_written": 0}
+
+    def start_test(self, test_name):
+        """Reset the per-test budget"""
+        self._test_name = test_name
+        self._test_bytes = 0
+        self._test_hashes = set()
+
+    def capture(self, driver, name):
+        """Capture the current page; return the path it is (or will be) stored at, or None if dropped"""
+        png = driver.get_screenshot_as_png()
+        self.stats["captured"] += 1
+        digest = hashlib.sha1(png).hexdigest()
+
+        if digest in self._test_hashes:
+            # Same image already attached to this test (e.g. several timeouts on one page)
+            self.stats["deduplicated"] += 1
+            return self._paths[digest]
+
+        is_new = digest not in self._paths
+        if is_new:
+            if self._test_bytes + len(png) > self.per_test_bytes or self.run_bytes + len(png) > self.per_run_bytes:
+                self.stats["dropped"] += 1
+                logger.info(f"Screenshot '{name}' dropped: byte budget exhausted")
+                return None
+            self._test_bytes += len(png)
+            self.run_bytes += len(png)
+            safe_name = "".join(c if c.isalnum() else "_" for c in (self._test_name or name))
+            self._paths[digest] = os.path.join(self.directory, f"{safe_name}_{digest[:12]}.png")
+        else:
+            self.stats["deduplicated"] += 1
+
+        self._test_hashes.add(digest)
+        _attach_to_allure(name, png, self._paths[digest] if digest in self._written else None)
+        if is_new:
+            self._ensure_writer()
+            self._queue.put((digest, png))
+        return self._paths[digest]
+
+    def close(self):
+        """Wait for pending writes and stop the writer thread"""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _ensure_writer(self):
+        if self._thread is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._thread = threading.Thread(target=self._write_loop, name="screenshot-writer", daemon=True)
+            self._thread.start()
+
+    def _write_loop(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            digest, png = job
+            path = self._paths[digest]
+            try:
+                data = self._process(png)
+                with open(path, "wb") as f:
+                    f.write(data)
+                self._written.add(digest)
+                self.stats["stored"] += 1
+                self.stats["bytes_written"] += len(data)
+            except Exception as e:
+                logger.warning(f"Failed to store screenshot {path}: {e}")
+
+    def _process(self, png):
+        if not (self.max_width or self.recompress):
+            return png
+        try:
+            from PIL import Image
+        except ImportError:  # Pillow is optional; without it screenshots are stored as captured
+            return png
+        image = Image.open(io.BytesIO(png))
+        if self.max_width and image.width > self.max_width:
+            height = round(image.height * self.max_width / image.width)
+            image = image.resize((self.max_width, height))
+        output = io.BytesIO()
+        image.save(output, format="PNG", optimize=self.recompress)
+        return output.getvalue()
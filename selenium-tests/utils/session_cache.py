@@ -0,0 +1,164 @@
+"""Authenticated browser state shared by the tests of one process.
+
+The first test that needs a logged-in user pays for one real login, through
+the login form or the ``/auth/login`` API. The resulting cookies and
+local/session storage are kept in memory and injected into the (reset) pooled
+browser for every later test of the same user, environment and base URL.
+"""
+import time
+
+# localStorage key an API token is stored under (same name as the Postman environment variable)
+TOKEN_STORAGE_KEY = "authToken"
+
+_READ_STORAGE = """
+function dump(storage) {
+    var values = {};
+    for (var i = 0; i < storage.length; i++) { values[storage.key(i)] = storage.getItem(storage.key(i)); }
+    return values;
+}
+return [dump(window.localStorage), dump(window.sessionStorage)];
+"""
+
+# arguments: localStorage values, sessionStorage values
+_WRITE_STORAGE = """
+var local = arguments[0], session = arguments[1];
+Object.keys(local).forEach(function (key) { window.localStorage.setItem(key, local[key]); });
+Object.keys(session).forEach(function (key) { window.sessionStorage.setItem(key, session[key]); });
+"""
+
+
+class SessionLoginError(Exception):
+    """Raised when a user cannot be logged in"""
+
+
+class SessionState:
+    """Cookies and web storage of a logged-in browser"""
+
+    def __init__(self, cookies, local_storage=None, session_storage=None, token=None):
+        self.cookies = cookies
+        self.local_storage = local_storage or {}
+        self.session_storage = session_storage or {}
+        self.token = token
+        self.created_at = time.monotonic()
+
+    def expired(self, ttl):
+        return time.monotonic() - self.created_at > ttl
+
+
+def api_login(config, credentials, http=None):
+    """Log ``credentials`` in through ``/auth/login``; return the token and cookies as a SessionState
+
+    ``http`` is an optional ``requests.Session`` to send the request with.
+    """
+    import requests
+
+    response = (http or requests).post(
+        f"{config.api_url}/auth/login",
+        json={"email": credentials["username"], "password": credentials["password"]},
+        timeout=config.page_load_timeout,
+    )
+    if response.status_code != 200:
+        raise SessionLoginError(f"API login of {credentials['username']} failed with HTTP {response.status_code}")
+    token = response.json().get("token")
+    cookies = []
+    for cookie in response.cookies:
+        entry = {"name": cookie.name, "value": cookie.value, "path": cookie.path or "/"}
+        if cookie.expires:
+            entry["expiry"] = int(cookie.expires)
+        cookies.append(entry)
+    return SessionState(cookies, {TOKEN_STORAGE_KEY: token} if token else {}, token=token)
+
+
+def restore(driver, config, state):
+    """Replace the browser's cookies and web storage with ``state``, on a page of the application"""
+    # Cookies and storage can only be set on a page of the application's origin
+    driver.get(config.base_url)
+    driver.delete_all_cookies()
+    for cookie in state.cookies:
+        driver.add_cookie(cookie)
+    if state.local_storage or state.session_storage:
+        driver.execute_script(_WRITE_STORAGE, state.local_storage, state.session_storage)
+
+
+class SessionCache:
+    """Logs users in once per process and restores their session in later tests.
+
+    Entries are keyed by user, environment and base URL, expire after ``ttl``
+    seconds and are dropped as soon as the application rejects them: a
+    restored session that lands on ``/login`` (or, for API logins, a 401 from
+    ``/users/me``) triggers a fresh login.
+    """
+
+    def __init__(self, config, ttl=1800, login_via_api=False, landing_path="/account"):
+        self.config = config
+        self.ttl = ttl
+        self.login_via_api = login_via_api
+        self.landing_path = landing_path
+        self._entries = {}
+        self.stats = {"restored": 0, "ui_logins": 0, "api_logins": 0, "invalidated": 0}
+
+    def key(self, username):
+        return (username, self.config.env, self.config.base_url)
+
+    def login(self, driver, user_type="admin_user"):
+        """Make ``driver`` logged in as ``user_type``; return how: 'cache', 'ui' or 'api'"""
+        credentials = self.config.get_credentials(user_type)
+        key = self.key(credentials["username"])
+
+        state = self._entries.get(key)
+        if state is not None and state.expired(self.ttl):
+            self.invalidate(key)
+            state = None
+        if state is not None:
+            self._restore(driver, state)
+            if self._accepted(driver, state):
+                self.stats["restored"] += 1
+                return "cache"
+            self.invalidate(key)
+
+        if self.login_via_api:
+            state = self._api_login(credentials)
+            self._restore(driver, state)
+            if not self._accepted(driver, state):
+                raise SessionLoginError(f"Session from API login of {credentials['username']} was rejected")
+            self.stats["api_logins"] += 1
+            source = "api"
+        else:
+            state = self._ui_login(driver, credentials)
+            self.stats["ui_logins"] += 1
+            source = "ui"
+        self._entries[key] = state
+        return source
+
+    def invalidate(self, key):
+        """Drop a cached session"""
+        if self._entries.pop(key, None) is not None:
+            self.stats["invalidated"] += 1
+
+    def _ui_login(self, driver, credentials):
+        from pages.login_page import LoginPage
+
+        login_page = LoginPage(driver, self.config).open().login(credentials["username"], credentials["password"])
+        if not login_page.is_logged_in():
+            raise SessionLoginError(f"Login form did not log in {credentials['username']}")
+        local_storage, session_storage = driver.execute_script(_READ_STORAGE)
+        return SessionState(driver.get_cookies(), local_storage, session_storage)
+
+    def _api_login(self, credentials):
+        return api_login(self.config, credentials)
+
+    def _restore(self, driver, state):
+        restore(driver, self.config, state)
+        driver.get(f"{self.config.base_url}{self.landing_path}")
+
+    def _accepted(self, driver, state):
+        if "/login" in driver.current_url:
+            return False
+        if state.token:
+            import requests
+
+            response = requests.get(f"{self.config.api_url}/users/me",
+                                    headers={"Authorization": f"Bearer {state.token}"},
+                                    timeout=self.config.page_load_timeout)
+            return response.status_code != 401
+        return True
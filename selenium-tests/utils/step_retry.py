@@ -0,0 +1,99 @@
+"""In-place retries of idempotent page-object actions.
+
+Page-object methods that can safely run twice (typing into a field, picking a
+dropdown option, a click whose failure means it never landed) are marked with
+:func:`retryable`. When retries are enabled (the ``step_retry`` section of
+``config.json`` or the ``step_retry`` marker), the driver fixture sets a
+:class:`StepRetryBudget` as ``driver.step_retries``; a marked method that fails
+with a transient WebDriver error is then re-run on the spot, up to
+``max_attempts`` times and ``max_retries`` times per test, instead of the whole
+test being rerun. Every retry is noted in the step log and reported with the
+test.
+"""
+import functools
+import time
+
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    StaleElementReferenceException,
+)
+
+from utils import instrumentation
+
+# Errors raised before the action took effect: the element was re-rendered, covered or not yet interactable.
+# Timeouts are not retried; the step already waited its full timeout.
+RETRYABLE_EXCEPTIONS = (
+    StaleElementReferenceException,
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+)
+
+
+class StepRetryBudget:
+    """Retry policy of one test and the retries it used"""
+
+    def __init__(self, max_attempts=2, max_retries=5, delay=0.25):
+        self.max_attempts = max(1, max_attempts)
+        self.max_retries = max(0, max_retries)
+        self.delay = delay
+        self.entries = []
+        self._active = 0
+        self._attempt = 0
+
+    @property
+    def remaining(self):
+        return self.max_retries - len(self.entries)
+
+    def will_retry(self, error):
+        """Whether the running retryable step is re-run after ``error``"""
+        return (bool(self._active) and isinstance(error, RETRYABLE_EXCEPTIONS)
+                and self._attempt < self.max_attempts and self.remaining > 0)
+
+    def add(self, step, attempt, error):
+        message = str(error).strip().splitlines()
+        self.entries.append((step, attempt, f"{type(error).__name__}: {message[0]}" if message else type(error).__name__))
+
+    def format(self):
+        lines = [f"{len(self.entries)} retries (budget {self.max_retries}, up to {self.max_attempts} attempts per step)"]
+        for step, attempt, error in self.entries:
+            lines.append(f"  {step} attempt {attempt} failed: {error}")
+        return "\n".join(lines)
+
+
+def retryable(func):
+    """Mark a page-object method as safe to re-run in place after a transient WebDriver error"""
+    step = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(page, *args, **kwargs):
+        budget = getattr(page.driver, "step_retries", None)
+        if budget is None or budget._active:
+            # Retries disabled, or an outer retryable step already owns the retry loop
+            return func(page, *args, **kwargs)
+        budget._active += 1
+        try:
+            attempt = 1
+            while True:
+                budget._attempt = attempt
+                try:
+                    return func(page, *args, **kwargs)
+                except RETRYABLE_EXCEPTIONS as e:
+                    if not budget.will_retry(e):
+                        raise
+                    budget.add(step, attempt, e)
+                    instrumentation.note(f"Retry {attempt}/{budget.max_attempts - 1} of {step} after {type(e).__name__}")
+                    time.sleep(budget.delay)
+                    attempt += 1
+        finally:
+            budget._active -= 1
+            budget._attempt = 0
+
+    wrapper.retryable = True
+    return wrapper
+
+
+def will_retry(driver, error):
+    """Whether the retryable step running on ``driver`` is re-run after ``error`` (no retry budget: never)"""
+    budget = getattr(driver, "step_retries", None)
+    return budget is not None and budget.will_retry(error)
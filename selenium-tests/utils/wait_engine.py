@@ -0,0 +1,207 @@
+import threading
+import time
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+
+from utils.lazy_import import LazyModule
+
+EC = LazyModule("selenium.webdriver.support.expected_conditions")
+
+BACKENDS = ("poll", "observer")
+
+# Exceptions that mean "not yet" while polling a condition
+_IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+# Locator conditions the observer backend can evaluate in the page, and their polling equivalents
+LOCATOR_CONDITIONS = {
+    "present": lambda locator: EC.presence_of_element_located(locator),
+    "all_present": lambda locator: EC.presence_of_all_elements_located(locator),
+    "visible": lambda locator: EC.visibility_of_element_located(locator),
+    "clickable": lambda locator: EC.element_to_be_clickable(locator),
+    "invisible": lambda locator: EC.invisibility_of_element_located(locator),
+}
+
+# Seconds kept free below the driver's script timeout when slicing an observed wait
+_SCRIPT_TIMEOUT_MARGIN = 1.0
+
+
+class WaitLedger:
+    """Per-test record of every explicit wait: what was awaited, for how long and how it ended"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.entries = []
+
+    def add(self, label, seconds, polls, outcome, backend="poll", saved=0.0):
+        """Record a wait; ``saved`` is the latency an observed wait is estimated to have saved over polling"""
+        with self._lock:
+            self.entries.append({"label": label, "seconds": seconds, "polls": polls, "outcome": outcome,
+                                 "backend": backend, "saved": saved})
+
+    @property
+    def total_seconds(self):
+        return sum(entry["seconds"] for entry in self.entries)
+
+    @property
+    def saved_seconds(self):
+        return sum(entry["saved"] for entry in self.entries)
+
+    def format(self, limit=10):
+        """Text report of the total, the latency saved by observed waits and the slowest waits"""
+        lines = [f"{len(self.entries)} waits, {self.total_seconds:.2f}s total"]
+        observed = [entry for entry in self.entries if entry["backend"] == "observer"]
+        if observed:
+            lines[0] += f", {len(observed)} observed in the page saving ~{self.saved_seconds:.2f}s over polling"
+        for entry in sorted(self.entries, key=lambda e: e["seconds"], reverse=True)[:limit]:
+            saved = f"  -{entry['saved']:.3f}s" if entry["backend"] == "observer" else ""
+            lines.append(f"{entry['seconds']:7.3f}s  {entry['polls']:3d} polls  {entry['outcome']:<8}  "
+                         f"{entry['backend']:<8}  {entry['label']}{saved}")
+        return "\n".join(lines)
+
+
+class WaitEngine:
+    """Explicit waits with a configurable, backing-off poll interval.
+
+    Implicit waits must be disabled on the driver (``implicitly_wait(0)``):
+    otherwise every failed lookup inside a poll blocks for the implicit timeout
+    and the two waits stack. Every wait is recorded in the optional ledger.
+
+    With ``backend="observer"``, locator waits (:meth:`until_located`) run in
+    the page instead: one ``execute_async_script`` installs a MutationObserver
+    and returns as soon as the condition holds. Other conditions, waits of
+    ``timeout=0``, script timeouts too short to leave a slice under
+    ``_SCRIPT_TIMEOUT_MARGIN`` and drivers or pages where the script fails are
+    polled.
+    """
+
+    def __init__(self, driver, timeout=10, poll_interval=0.1, backoff=1.5, max_poll_interval=1.0, ledger=None,
+                 backend="poll", script_timeout=30):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown wait backend '{backend}', expected one of {', '.join(BACKENDS)}")
+        self.driver = driver
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.backoff = backoff
+        self.max_poll_interval = max_poll_interval
+        self.ledger = ledger
+        self.backend = backend
+        self.script_timeout = script_timeout
+
+    def until(self, condition, timeout=None, label="condition"):
+        """Poll ``condition(driver)`` until it returns a truthy value, which is returned.
+
+        A timeout of 0 evaluates the condition exactly once. Raises
+        TimeoutException when the condition is still falsy at the deadline.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+        interval = self.poll_interval
+        polls = 0
+        while True:
+            polls += 1
+            try:
+                value = condition(self.driver)
+            except _IGNORED_EXCEPTIONS:
+                value = None
+            if value:
+                self._record(label, started, polls, "met")
+                return value
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._record(label, started, polls, "timeout")
+                raise TimeoutException(f"Timed out after {timeout}s waiting for {label}")
+            time.sleep(min(interval, remaining))
+            interval = min(interval * self.backoff, self.max_poll_interval)
+
+    def until_located(self, kind, locator, timeout=None, label=None):
+        """Wait until the element(s) at ``locator`` are ``kind`` (a key of ``LOCATOR_CONDITIONS``).
+
+        Returns what the matching expected condition returns: the element, the
+        list of elements for ``all_present``, True for ``invisible``.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        label = label or f"{kind} {locator}"
+        if self.backend == "observer" and timeout > 0 and self.script_timeout > _SCRIPT_TIMEOUT_MARGIN:
+            started = time.monotonic()
+            try:
+                return self._observe(kind, locator, timeout, label, started)
+            except TimeoutException:
+                raise
+            except WebDriverException:
+                # The page navigated away mid-wait, or the driver cannot run async scripts: poll for the rest
+                timeout = max(0.0, timeout - (time.monotonic() - started))
+        return self.until(LOCATOR_CONDITIONS[kind](locator), timeout, label=label)
+
+    def _observe(self, kind, locator, timeout, label, started):
+        from pages import scripts
+
+        by, value = locator
+        deadline = started + timeout
+        calls = 0
+        while True:
+            # Slices stay under the driver's script timeout; long waits take several calls
+            remaining = deadline - time.monotonic()
+            window = max(0.0, min(remaining, self.script_timeout - _SCRIPT_TIMEOUT_MARGIN))
+            calls += 1
+            met, result, waited_ms = self.driver.execute_async_script(
+                scripts.OBSERVE_CONDITION, kind, by, value, int(window * 1000))
+            if met:
+                waited = waited_ms / 1000 if calls == 1 else time.monotonic() - started
+                self._record(label, started, calls, "met", backend="observer", saved=self.polling_delay(waited))
+                return result
+            if window >= remaining or deadline - time.monotonic() <= 0:
+                self._record(label, started, calls, "timeout", backend="observer")
+                raise TimeoutException(f"Timed out after {timeout}s waiting for {label}")
+
+    def polling_delay(self, seconds):
+        """How much later than ``seconds`` into a wait polling would have seen a condition that became true then"""
+        poll_at = 0.0
+        interval = self.poll_interval
+        while poll_at < seconds:
+            poll_at += interval
+            interval = min(interval * self.backoff, self.max_poll_interval)
+        return poll_at - seconds
+
+    def until_absent(self, locator, timeout=0):
+        """Return True once no element matching ``locator`` is displayed.
+
+        Fast path for negative checks: the first poll is a single
+        ``find_elements`` call, so an element that is already absent costs one
+        round trip instead of a full timeout. Returns False if it is still
+        displayed after ``timeout`` seconds.
+        """
+        def absent(driver):
+            try:
+                return all(not element.is_displayed() for element in driver.find_elements(*locator))
+            except StaleElementReferenceException:
+                return True  # the element went away while being checked
+
+        try:
+            self.until(absent, timeout=timeout, label=f"absence of {locator}")
+            return True
+        except TimeoutException:
+            return False
+
+    def first_present(self, locators, timeout=None):
+        """Wait until any of ``locators`` matches an element; return the index of the first match.
+
+        Used when a page can settle in one of several states (e.g. cart items or
+        the empty-cart message), so neither state costs a timeout.
+        """
+        def any_present(driver):
+            for index, locator in enumerate(locators):
+                if driver.find_elements(*locator):
+                    return (index,)
+            return None
+
+        return self.until(any_present, timeout=timeout, label=f"any of {list(locators)}")[0]
+
+    def _record(self, label, started, polls, outcome, backend="poll", saved=0.0):
+        if self.ledger is not None:
+            self.ledger.add(label, time.monotonic() - started, polls, outcome, backend=backend, saved=saved)